@@ -0,0 +1,622 @@
+#!/usr/bin/env python
+# encoding: utf-8
+# Thomas Nagy, 2005-2010; Arne Babenhauserheide
+
+"""Waffle iron - creates waffles :)
+
+- http://draketo.de/proj/waffles/
+
+TODO: Differenciate sourcetree and packages: sourcetree as dir in wafdir, packages in subdir packages. 
+"""
+
+__license__ = """
+This license only applies to the waffle part of the code,
+which ends with
+### Waffle Finished ###
+
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions
+are met:
+
+1. Redistributions of source code must retain the above copyright
+   notice, this list of conditions and the following disclaimer.
+
+2. Redistributions in binary form must reproduce the above copyright
+   notice, this list of conditions and the following disclaimer in the
+   documentation and/or other materials provided with the distribution.
+
+3. The name of the author may not be used to endorse or promote products
+   derived from this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE AUTHOR "AS IS" AND ANY EXPRESS OR
+IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+DISCLAIMED. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR ANY DIRECT,
+INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+(INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION)
+HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT,
+STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING
+IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+POSSIBILITY OF SUCH DAMAGE.
+"""
+
+import os, sys, optparse, getpass, re, binascii
+if sys.hexversion<0x204000f: raise ImportError("Waffle requires Python >= 2.4")
+try:
+	from hashlib import md5
+except:
+	from md5 import md5 # for python < 2.5
+
+if 'PSYCOWAF' in os.environ:
+	try:import psyco;psyco.full()
+	except:pass
+
+VERSION="0.1"
+REVISION="f9e4d5455b490772e751ba8f71b4f6ae"
+INSTALL=''
+cwd = os.getcwd()
+join = os.path.join
+HOME = os.path.expanduser('~')
+
+WAF='waffle' #: the default name of the executable
+WAFFLE='waffle' #: the default name of the dir with the sources (prepended with s when unpacked)
+WAFFLE_MAKER='waffle_maker.py'
+
+def parse_cmdline_args():
+	"""@return: opts, args; opts are parsed"""
+	# parse commandline arguments.
+	parser = optparse.OptionParser()
+	parser.add_option("-o", "--filename", 
+			  help="Set the output filename", default="waffle.py", metavar="OUTPUT_FILE")
+	parser.add_option("-p", "--package", action="append", dest="packages",
+		  help="Package folder to include (can be used multiple times)", metavar="PACKAGE_FOLDER")
+	parser.add_option("-m", "--module", action="append", dest="modules", 
+			  help="Python module to include (can be used multiple times)", metavar="module_to_include.py")
+	parser.add_option("-s", "--script", 
+			  help="Execute this script", default="run.py", metavar="script_to_run.py")
+	parser.add_option("--unpack-only", action="store_true", 
+			  help="only unpack the tar.bz2 data, but don't execute anything.", default=False)
+	opts, args = parser.parse_args()
+	if opts.modules is None:
+		opts.modules = []
+	if opts.packages is None:
+		opts.packages = []
+			      
+	return opts, args
+
+def b(x):
+	return x
+
+if sys.hexversion>0x300000f:
+	WAF='waffle3'
+	def b(x):
+		return x.encode()
+
+def err(m):
+	print(('\033[91mError: %s\033[0m' % m))
+	sys.exit(1)
+
+def get_waffle_data():
+	f = open(sys.argv[0],'r')
+	c = "corrupted waf (%d)"
+	while True:
+		line = f.readline()
+		if not line: err("no data")
+		if line.startswith('#==>'):
+			txt = f.readline()
+			if not txt: err("wrong data: data-line missing")
+			if not f.readline().startswith('#<=='): err("wrong data: closing line missing")
+			return txt
+
+def unpack_wafdir(txt, zip_type="bz2"):
+	"""@param txt: The compressed data"""
+	if not txt: err(c % 3)
+	if sys.hexversion>0x300000f:
+		txt = binascii.a2b_base64(eval("b'" + txt[1:-1] + r"\n'"))
+	else: 
+		txt = binascii.a2b_base64(txt[1:])
+
+	# select the target folder
+	import shutil, tarfile
+
+	s = '.%s-%s-%s'
+	if sys.platform == 'win32': s = s[1:]
+
+	## Firstoff we we select some possible folders, to be tested one after the other (with the appropriate precautions).
+	## For the sake of readability we first note the different options here.
+	#: The home folder as the best option (if the user has a writeable home)
+	dirhome = join(HOME, s % (WAF, VERSION, REVISION))
+	# the scripts dir
+	name = sys.argv[0]
+	base = os.path.dirname(os.path.abspath(name))
+	#: As second option use the folder where the script resides (if writeable by us - and not yet taken, which could be, if another user started the script). 
+	dirbase = join(base, s % (WAF, VERSION, REVISION), getpass.getuser())
+	#: tmp as last resort
+	dirtmp = join("/tmp", getpass.getuser(), "%s-%s-%s" % (WAF, VERSION, REVISION))
+
+	def prepare_dir(d):
+		"""create the needed folder"""
+		os.makedirs(join(d, WAFFLE))
+
+	def check_base(d):
+		"""Check the dir in which the script resides.
+
+		Only use the dir, if it belongs to us. If we can’t trust the scripts dir, we’re fragged anyway (someone could just tamper directly with the script itself - or rather: could compromise anything we run)."""
+		prepare_dir(d)
+		return d
+
+	def check_tmp(d):
+		"""Check the tmp dir - always remove the dir before startup.
+
+		This kills the caching advantage, but is necessary for security reasons (else someone could create a compromised dir in tmp and chmod it to us)."""
+		# last resort: tmp
+		if os.path.exists(d):
+			try: shutil.rmtree(d)
+			except OSError: err("Can't remove the previously existing version in /tmp - executing would endanger your system")
+			try: 
+				prepare_dir(d)
+				return d
+			except OSError: err("Cannot unpack waf lib into %s\nMove waf into a writeable directory" % dir)
+
+	## Now check them. 
+	# first check: home
+	try:
+		d = dirhome
+		prepare_dir(d)
+	except OSError:
+		# second check: base
+		if base.startswith(HOME) or sys.platform == 'win32':
+			try:
+				d = check_base(dirbase)
+			except OSError:
+				d = check_tmp(dirtmp)
+		else: d = check_tmp(dirtmp)
+
+	## Now unpack the tar.bz2 stream into the chosen dir. 
+	os.chdir(d)
+	if zip_type == 'bz2': 
+		tmp = 't.tbz2'
+	elif zip_type == 'gz':
+		tmp = 't.gz'
+	t = open(tmp,'wb')
+	t.write(txt)
+	t.close()
+
+	try:
+		t = tarfile.open(tmp)
+	# watch out for python versions without bzip2
+	except:
+		try: 
+			os.system('bunzip2 t.bz2')
+			t = tarfile.open('t')
+		except:
+			# if it doesn’t work, go back and remove the garbage we created.
+			try: 
+				os.unlink(tmp)
+			except OSError: pass
+			os.chdir(cwd)
+			try: shutil.rmtree(d)
+			except OSError: pass
+			err("Waf cannot be unpacked, check that bzip2 support is present")
+
+	for x in t:
+		t.extract(x)
+	t.close()
+	os.unlink(tmp)
+
+
+	#if sys.hexversion>0x300000f:
+		#sys.path = [join(d, WAFFLE)] + sys.path
+		#import py3kfixes
+		#py3kfixes.fixdir(d)
+
+	os.chdir(cwd)
+	return join(d, WAFFLE)
+
+
+def make_waffle(base_script="waffle_maker.py", packages=[], modules=[], folder=WAFFLE, executable="run.py", target="waffle.py", zip_type="bz2"):
+	"""Create a waf-like waffle from the base_script (make_waffle.py), the folder and a python executable (appended to the end of the waf-light part)."""
+	print("-> preparing waffle")
+	mw = 'tmp-waf-'+VERSION
+
+	import tarfile, re, shutil
+
+	if zip_type not in ['bz2', 'gz']:
+		zip_type = 'bz2'
+
+	# copy all modules and packages into the build folder
+	if not os.path.isdir(folder):
+		os.makedirs(folder)
+	
+	for i in modules + packages:
+		if i.endswith(os.path.sep): 
+			i = i[:-1]
+		if os.path.isdir(i) and not os.path.isdir(join(folder, i.split(os.path.sep)[-1])):
+			shutil.copytree(i, join(folder, i.split(os.path.sep)[-1]))
+		elif os.path.isfile(i): 
+			shutil.copy(i, folder)
+
+	#open a file as tar.[extension] for writing
+	tar = tarfile.open('%s.tar.%s' % (mw, zip_type), "w:%s" % zip_type)
+	tarFiles=[]
+
+	def all_files_in(folder): 
+		"""Get all paths of files inside the folder."""
+		filepaths = []
+		walked = [i for i in os.walk(folder)]
+		for base, dirs, files in walked:
+		    filepaths.extend([os.path.join(base, f) for f in files])
+		return filepaths
+		
+	files = [f for f in all_files_in(folder) if not f.endswith(".pyc") and not f.endswith(".pyo") and not "/." in f]
+
+	for x in files:
+		tar.add(x)
+	tar.close()
+
+	# first get the basic script which sets up the path
+	f = open(base_script, 'r')
+	code1 = f.read()
+	f.close()
+	# make sure it doesn't do anything.
+	code1.replace("__name__ == '__main__':", "__name__ == '__main__' and False:")
+	# then append the code from the executable 
+	if executable is not None:
+		f = open(executable, 'r')
+		code1 += f.read()
+		f.close()
+
+	# now store the revision unique number in waf
+	#compute_revision()
+	#reg = re.compile('^REVISION=(.*)', re.M)
+	#code1 = reg.sub(r'REVISION="%s"' % REVISION, code1)
+
+	prefix = ''
+	#if Build.bld:
+	#	prefix = Build.bld.env['PREFIX'] or ''
+
+	reg = re.compile('^INSTALL=(.*)', re.M)
+	code1 = reg.sub(r'INSTALL=%r' % prefix, code1)
+	#change the tarfile extension in the waf script
+	reg = re.compile('bz2', re.M)
+	code1 = reg.sub(zip_type, code1)
+
+	f = open('%s.tar.%s' % (mw, zip_type), 'rb')
+	cnt = f.read()
+	f.close()
+
+	# the REVISION value is the md5 sum of the binary blob (facilitate audits)
+	m = md5()
+	m.update(cnt)
+	REVISION = m.hexdigest()
+	reg = re.compile('^REVISION=(.*)', re.M)
+	code1 = reg.sub(r'REVISION="%s"' % REVISION, code1)
+	f = open(target, 'w')
+	f.write(code1)
+	f.write('#==>\n')
+	data = str(binascii.b2a_base64(cnt))
+	if sys.hexversion>0x300000f:
+		data = data[2:-3] + '\n'
+	f.write("#"+data)
+	f.write('#<==\n')
+	f.close()
+
+	# on windows we want a bat file for starting.
+	if sys.platform == 'win32':
+		f = open(target + '.bat', 'wb')
+		f.write('@python -x %~dp0'+target+' %* & exit /b\n')
+		f.close()
+
+	# Now make the script executable
+	if sys.platform != 'win32':
+		# octal prefix changed in 3.x from 0xxx to 0oxxx. 
+		if sys.hexversion>0x300000f:
+			os.chmod(target, eval("0o755"))
+		else:
+			os.chmod(target, eval("0755"))
+
+	# and get rid of the temporary files
+	os.unlink('%s.tar.%s' % (mw, zip_type))
+	shutil.rmtree(WAFFLE)
+	
+
+def test(d):
+	try: 
+	      os.stat(d)
+	      return os.path.abspath(d)
+	except OSError: pass
+
+def find_lib():
+	"""Find the folder with the modules and packages.
+
+	@return: path to to folder."""
+	name = sys.argv[0]
+	base = os.path.dirname(os.path.abspath(name))
+
+	#devs use $WAFDIR
+	w=test(os.environ.get('WAFDIR', ''))
+	if w: return w
+
+	#waffle_maker.py is executed in place.
+	if name.endswith(WAFFLE_MAKER):
+		w = test(join(base, WAFFLE))
+		# if we don’t yet have a waffle dir, just create it.
+		if not w:
+			os.makedirs(join(base, WAFFLE))
+			w = test(join(base, WAFFLE))
+		if w: return w
+		err("waffle.py requires " + WAFFLE + " -> export WAFDIR=/folder")
+
+	d = "/lib/%s-%s-%s/" % (WAF, VERSION, REVISION)
+	for i in [INSTALL,'/usr','/usr/local','/opt']:
+		w = test(i+d)
+		if w: return w
+
+	# first check if we can use HOME/s,
+	# if not, check for s (allowed?)
+	# then for /tmp/s (delete it, if it already exists,
+	# else it could be used to smuggle in malicious code)
+	# and finally give up. 
+	
+	#waf-local
+	s = '.%s-%s-%s'
+	if sys.platform == 'win32': s = s[1:]
+	# in home
+	d = join(HOME, s % (WAF, VERSION, REVISION), WAFFLE)
+	w = test(d)
+	if w: return w
+
+	# in base
+	if base.startswith(HOME):
+		d = join(base, s % (WAF, VERSION, REVISION), WAFFLE)
+		w = test(d)
+		if w: return w
+	# if we get here, we didn't find it.
+	return None
+
+
+wafdir = find_lib()
+if wafdir is None: # no existing found
+	txt = get_waffle_data() # from this file
+	if txt is None and __name__ == "__main__": # no waffle data in file
+		opts, args = parse_cmdline_args()
+		make_waffle(packages=opts.packages, modules=opts.modules, executable=opts.script)
+	else: 
+		wafdir = unpack_wafdir(txt)
+	
+elif sys.argv[0].endswith(WAFFLE_MAKER) and __name__ == "__main__": # the build script called
+	opts, args = parse_cmdline_args()
+	if opts.filename.endswith(WAFFLE_MAKER):
+		err("Creating a script whose name ends with " + WAFFLE_MAKER + " would confuse the build script. If you really want to name your script *" + WAFFLE_MAKER + " you need to adapt the WAFFLE_MAKER constant in " + WAFFLE_MAKER + " and rename " + WAFFLE_MAKER + " to that name.")
+	make_waffle(packages=opts.packages, modules=opts.modules, executable=opts.script, target=opts.filename)
+	# since we’re running the waffle_maker, we can stop here. 
+	exit(0)
+
+if wafdir is not None: 
+	sys.path = [wafdir] + [join(wafdir, d) for d in os.listdir(wafdir)] + sys.path
+
+
+## If called with --unpack-only, no further code is executed.
+if "--unpack-only" in sys.argv:
+	print(sys.argv[0], "unpacked to", wafdir)
+	exit(0)
+
+### Waffle Finished ###
+
+#!/usr/bin/env python
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+import traceback
+
+import fsutils
+import ui
+import jobs
+import compiler
+import targets
+import variables
+import configurations
+import object_cache
+import remote_cache
+import distributed
+import parser
+import pgo
+import sharding
+import affected
+import query
+import ninja
+import garbage
+import testing
+
+def parse_source_tree():
+    for filename in fsutils.pake_files:
+        parser.parse(filename)
+
+    configuration = configurations.get_selected_configuration()
+    variables.export_special_variables(configuration)
+
+def build_configuration(name, build_targets):
+    configurations.select(name)
+    configuration = configurations.get_selected_configuration()
+    variables.export_special_variables(configuration)
+    targets.forget_built_targets()
+
+    if configuration.name != "__default":
+        ui.bigstep("configuration", str(configuration))
+
+    import command_line
+
+    if sharding.enabled():
+        sharding.assign(targets.compile_actions(command_line.args.target
+                                                or targets.visible_targets()))
+
+    # ninja gets the commands of the configuration as it is
+    if configuration.pgo.eval() and not command_line.args.generate_ninja:
+        pgo.build(configuration, build_targets)
+    else:
+        build_targets()
+
+    if command_line.args.test and not command_line.args.generate_ninja:
+        failed = testing.run(targets.built_targets())
+
+        if failed:
+            ui.fatal("tests failed: {}".format(" ".join(failed)))
+
+    if garbage.enabled():
+        garbage.collect()
+
+def finish():
+    object_cache.finish()
+    remote_cache.finish()
+    sharding.finish()
+    garbage.finish()
+
+def _build_in_child(name, build_targets):
+    # exit status of the forked process
+    jobs.forked()
+
+    try:
+        build_configuration(name, build_targets)
+        finish()
+        return 0
+    except SystemExit as e:
+        return e.code if isinstance(e.code, int) and e.code else 1
+    except BaseException:
+        traceback.print_exc()
+        return 1
+
+def _build_at_once(names, build_targets):
+    # every configuration is built by a process forked after parsing, they
+    # share slots of jobs and include scans through a temporary directory
+    directory = tempfile.mkdtemp(prefix="pake-")
+    jobs.share(directory)
+    compiler.share_scans(directory)
+
+    start = time.time()
+    children = {}
+    results = {}
+
+    try:
+        for name in names:
+            sys.stdout.flush()
+            pid = os.fork()
+
+            if pid == 0:
+                os._exit(_build_in_child(name, build_targets))
+
+            children[pid] = name
+
+        while children:
+            (pid, status) = os.wait()
+            if pid in children:
+                results[children.pop(pid)] = (status == 0, time.time() - start)
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    return [(name,) + results[name] for name in names]
+
+def _build_one_by_one(names, build_targets):
+    results = []
+    root_dir = os.getcwd()
+
+    for name in names:
+        start = time.time()
+        try:
+            build_configuration(name, build_targets)
+            results.append((name, True, time.time() - start))
+        except SystemExit:
+            # failed target can leave us in its directory
+            os.chdir(root_dir)
+            results.append((name, False, time.time() - start))
+
+    finish()
+
+    return results
+
+def build_configurations(names, build_targets):
+    # tree is parsed once and failure of one configuration doesn't stop the
+    # others. Shards collect objects of all configurations into one bundle
+    # and there is one build.ninja, so those are done in turn
+    import command_line
+
+    if sharding.enabled() or sharding.merging() or command_line.args.generate_ninja:
+        results = _build_one_by_one(names, build_targets)
+    else:
+        results = _build_at_once(names, build_targets)
+
+    ui.bigstep("summary", "{} configurations".format(len(results)))
+    for (name, succeeded, seconds) in results:
+        ui.info("  {} {} ({:.1f}s)".format(name, "ok" if succeeded else "FAILED", seconds))
+
+    return all(succeeded for (_, succeeded, _) in results)
+
+def main():
+    import command_line
+
+    if command_line.args.command == "worker":
+        distributed.serve()
+        return
+
+    parse_source_tree()
+
+    if command_line.args.command == "query":
+        query.run()
+        return
+
+    def build_targets():
+        if command_line.args.generate_ninja:
+            ninja.generate(command_line.args.target or targets.visible_targets())
+        elif affected.enabled():
+            targets.build_targets(affected.affected_targets(command_line.args.target
+                                                            or targets.visible_targets()))
+        elif command_line.args.target:
+            targets.build_targets(command_line.args.target)
+        elif command_line.args.all:
+            targets.build_all()
+        elif command_line.args.test:
+            targets.build_targets([name for name in targets.visible_targets()
+                                   if isinstance(targets.targets[name], targets.Test)])
+
+    # --gc alone only cleans up
+    if (command_line.args.target or command_line.args.all or affected.enabled()
+            or command_line.args.generate_ninja or command_line.args.gc
+            or command_line.args.test):
+        names = configurations.requested()
+
+        if sharding.enabled() and sharding.merging():
+            ui.fatal("--shard and --merge-shards can't be used together")
+
+        if sharding.enabled() and command_line.args.test:
+            ui.fatal("--shard doesn't link, so there is nothing to test")
+
+        if sharding.merging():
+            sharding.import_bundles()
+
+        if len(names) == 1:
+            build_configuration(names[0], build_targets)
+            finish()
+        elif not build_configurations(names, build_targets):
+            sys.exit(1)
+    else:
+        ui.info("no target selected\n")
+
+        ui.info(ui.BOLD + "targets:" + ui.RESET)
+        for target in targets.targets.values():
+            ui.info("  " + str(target))
+
+        ui.info(ui.BOLD + "\nconfigurations:" + ui.RESET)
+        for configuration in configurations.configurations:
+            ui.info("  " + str(configuration))
+
+        ui.info("\nsee --help for more\n")
+
+if __name__ == '__main__':
+    main()
+
+#==>
+#QlpoOTFBWSZTWcCd0swBMnD/3fz/////////////7/////4EIwwAABABIAKAkAhgr/910vemqoF2d1d95ztoAaMgKGgPPbYe23Gt1pu6x1UF2dj0B4r1Tp0dFBQFCl7AUFd2A0FAthJ0A9soCfWUN8O7UADb7I7moIWg0qipBIgkIlKS0AGpSUru+9jxryLMB69b3uMeWzO9h3Tb1y9j6vnwfE29U4AVgfezn3fVPfYHRo6ts+n3zju7zj77XvcWwML3TuLi3brnYsYozZQSUNtGnXCE1hJdahbNAodIlU66KLLFq3dt6VKikVCgalSyyOZG94N48NIntrN3ka97sXPIOuw833a9aAHmMAVezVA6zWGzLPsHfSPdzNbNrO9z3hrNimaD03ah1iXJ3ddW2lrKF657xQSqhpQ0Cm60jJs2jR2AdcyjYzGFaGtTs4GmbudQAC0Yml3AbtAmWg3Aa8kIaCbHoHPNtzCr2y9ma1owGPTxB6JAp3uiNWzlubbS1oGiOG9nevZG12Z0qF8u5ru53gjEHhpoCBBAiGgUYmFPUwp6ZNJhNqeiaNNqGmQDQAABoAaAABKYiEQgk0JlMCno1Tepoj1Mmh5RoAAaNAGgBkZGmhkGgAABKaRNKaaYiaNPSGjRo0aNGnqaepkaaNPUM1DQAA0NAADQ0NABpo0EmkiITQQBGkxNMQnqnkAp6jyE/UPUaIyNA0NGZQDT1BoNqAAABEkQIAQDQJoCE0aGUzKnso0ZGgjBNMRoGho0ADIAAAERRBBEyeUyKnvVNkp6PVPUZpHpDRoHqDQAAAAAGmgAAAAN//j+gAYFn9oDT4gHFhDcBiWASMAFIYZhjcCGBpjDr751iCd0RxTEk0CE5gZiFUvYCuqHGC0G8focC8dbbmyzldbi6acmr3vccuGYsWTWXvAK7rsQqqkqEISSkkgCQBiIgsQAgUBWICK2ILIqChzOyAfu2/Th+90q/sf03ttOUeH0mWhraq1/MVDb5/x7/tbwMW0Vtuusb3L8ZpGaobt53RGY/+P89J8nSHDOvQuo1xPFDsiS64IowUK5yYmf9ELJgo2Ms/+ZRJJHg6/YUdSFnLrtn+bo82de7S8U/rs0ndm3taHZN+lkxMVnVDyfR54oeOWOueqGifx2nDRgcs5L/ZXeCWW3nvHHVa1DdCEpTyTbu7hf9Y3K+OONXUeaaSp4Pdx7KqA8/VedRZE899tSNfGDpLENA1WW7EaWliq51l16zkDSraAqHvdpFmDDqnXL1Z1edXlHrZid1Zn9plcQZ2zior8yqsvvV25KSIIPKiNryqhnA1YHmnQem73ejnNOqaQWRRVNfKhWPHFyB/g/t3nRTjO2f7LggqybGWtBGVK1gURaMrtz3F7viz/GznvSXpQ6PnbFNWUU2zD0oYzTpik805Zm7CbZ2pQy+5wxkrWa/JZNHus2kxnKLjjM9jcQ6ZZMSW2VqGJC+VJpD1jVT3CD/QI60qrpyM8iPhk/sfr/N+KexaWr/VnUPjGXJ3XFNM/l53kkOUE4wCReudsLntqpmKm+NmBA6IbFYONARAigsBi5Zb6Z46qyCqTaSsBGStz3dd86xyfYyggWZaNh2B4W7L8YnxiZT2lQRJyZImAVRTCtvNWdIt7blf9WOog7/oD/oo97/6/O+9JfgzpRB3+v6/rj6Z+PvUOidlRQOfTzbgLBRlaV/eIj4FPWRNKAfomr6xQkNpxM+qBk+r5LXdkEqlU0UiRSQgtioSK2D4QCSxLFecULXovRzi4S5hD5Ymq4HXFN0PXvpkxb5mlx19GaxiaSFGdWUYsDzQK6YVFq+etetkmgd2tv89k9j4OmLF6s8ObDXW4qYlpjEEQaXi/3IVpYrQvDBou93xZbaC6PzOVKMlbVWqsAHk17YYrinvdOe8f26zeevLO2vPVzJJGISGaFYywKVrRtrVKWDy2QYDFgeOjDIkPqauM6dNTlK/datp0xPr9O5mblNJrXuy7WlNJXGQZls+/RRDndmIpFQEYIgpnnzmmXmXMTefWhgiiMRV3Z5tctBRY459Yf5N9vL2vGvLrhnpe+FERVX10o9LWdxJfr+bJm27erJcWUFLEqrQpUqNo16ZPDJjMO7tMhRtzMRmI6Bjpptg2Q6dNBia+NgUfo5vTqJRbfW1yHRA9iBvRvKC5vHp8s1x6Yc4qtpVggwYVttbaixa0fg1U6a+fjewYmrRGeCWCJkZejZm3MYMfOmmZK6uTFcpUVRlTohgJEXluioMERHVp5s1w2srSWrGlKxlCjYS0sbvmKojiFag1KVm1QvpQuqsinkgZllQUoyhXaZnYpmW1K6tTJWJxgFQVc5uHprMRbVWKNJKpt1TQosS3+NlprxvN670XWhnxM1Vo+pbIK6dZ3LLSMu4Yg2jVssja+YykCSOnNZUfNnxwrzCqhYW7tMKWvbO2rq22pS7pjOyai9LYKCsGcbwxS2rIKCKonoZemgLb1yncpKm2FtG0T0ZXLYqCKrK+SBUedZiNp1787mjTOHA4pWVCqaHJigVU5SpDNWpnKaQ0rET5nllk3rjQd0oCiKnzs1ELamSxtGXyTK4zpqmODceHzZ43M08KSQxsdJnlSt2w/oKnf8d6ln+nQgqwYMQZqlaJUlpTxtmMr5MLHztgLIIQpQmnEnoyGDiVPP6IZkWatlVktlyCSYwwtolEKS0UE6WEmJDGFtRlaMFhWJvHDx926chnU8IaD5ReTE0YR6cfDIZR2O+lOyZxdbj7e8tDAjGE0fzeo+Wj8HhinMUnWlh07tk897MKeRmLDIqLy/sJpBE8WFYCMVRR6NBE5T3FvRijqh8UCsJjC8h7WVB7W6WRVWbpb5YYYwqJE6DPnZmngwJjOkDJNHRqpaTDWsQqMLkTWqHtLC6amxhQ02QRWMTeWGKMBQ9iQiw/NN9IfW/6bq0fq3zy31Js3d/lv7j6PZnpaPctfzrXuxVKbDT19hUjfZ4s1hO8a33tkk+AOrKCPBciywGHxDqpDNYl18B2+EgwhRe1t+FF2RgChviqaQAC3z05ccK4UD8NU37bMVF4TOGmTGz1V1zIc63/kOft8uwwYJnwtmD4VCiqCDRXG+i+FsihrFCUpsQnL6NxkGWrSFRhlee/+Xe3vqoK3C1BvnZbPEEBfuwgDCAMEZFEVVuAxAAUTsuoIAecAQAJEBRkBFJFBQkFSQAEtBQigFntpRe8gxGDTGq+PH3oSPR3PrS+qLXef7dzb/owd1+f/x1hfo43J0OGGwalu/oU3NFAD6K2yb8LkKoJJIbEwJ9rhQekkEcYDnNsKRy86NImf9WGJGiUcMYFWKDHOjq+sqjWlVwYqdMVJRMaxRBFYU4swWMfC13aisYgkdtSVqGrVBy0iBFHSU5ZVW26fLKiY13czAVwRa5lZIMpUqQqoFbuEXLOju4G03l0z1BAzi0avWWXGG9WRZ1+3zz068B5EETykd08nl8EnFMw67ZN9v4VlCLQ8UYh8Kc3YmxSzrrd3ajNrNbI3AnZG+58PWq+h4QSO1WTf5FRLEliMdVBK0/mDrX9fVCQDjQlt1X9KHJFtKOvivo+Mk7kTC64098Te8eqeLymujR4pRi9Uh8u9elYdqtipdPpE/s4yBxFDQaVUX7Ih7/lGO+nDlzv0YkqWks47v2oHf7POR7VD+8F4xHZXcQYdncbCy6zsLfN5jX0YnD/dOx9OqaPQDn5gA/29fiyJI3jp9Pm2tP7NUXmVFBqJiwD1xNCdUh/Ik8Xbnvvhzz3DXfXOHctDSTvARixi4GRuDlbtvfn83cfH18TwPTq9Nf0T70D/NWRJ6cDA0NJ1+X5v3yPtbJ/ERMi/Nzp083TcFVdflcfqdHGfxYbq4MTwVB/y3QUUE+P0eGZuOXNfO1o6R5RFSHlYgswk8l/1ZRQLSokuZXGZoyYUoKVlu+oE9Dt5yjaJIVDY00fWMSrapx3E2uPID7TwvV4fbb0i8r7rbD3qHlOBizdZmyFSCTpauoelcEbQGBWLyGeFtYql0ftTvMD1brpgW09KqVjODltkH4N6O+a3z2Q3HWBoRLAjXxChh98iSUQNwKCaD2fk1YR6IdCrWsrzxmejzrdB9Xri0R8+5ngS2n9Ueim3K81Kntg+n4etZVv4sfhtNB6kfq2L7F+n1TLVfHh77yFX3TBI78shhHDMdkfmGRkdxtJ6FPZVzbNfq+vt3lGa9gn2CPJ50UYq9iexz2oOcrYWJUbennmsqA1EMyhWKrlDCDCEWOuFs9uDbCc0JQ/mjuvKEh6JU8/Owzg9nw315eOh3QoyYkE8uM2zbI2xpIp7OVsNH5Izxva5lIEGP51rMXiiq0ypJMbGq8rFl6X8J/IDv979lGfsWcubyUTKq7zJHYhMsopCKRcplKkxdlrl8MDia75mhyUOxzg7X39u0TpQq2lQSCk6TniMMlxYgqxWTBJzL0uro3Pw43vQHGcbzMMTet7K2bbnOIKKQRBZBWJrorDG2MAVLgXMddXbO+gRtoUK1d8Prt0iKIyKdEVYRSZpma3uqkQRZLqiy5S45jr1GyQ11q23c/NrWDVe8kxkhMQg7LVc+hzItMzDMpTKpRTPnDDSqO9lqYqu9F0nY3RMtNsKLSlHZrLlWiMSVUVus6M0gijyEG6hanFTwXJhy8ZXEVa9AS5WJKxbzZjWqoiw5tCvlptTmNEMplVSpKqRoN7emq3UiS9Ll49MiB7drz2keAUQJv2OwGHS/TjKxRzZgf4JnGgsdq1gLJMuMURfrLmQu1hs/3PSteopIPjnfw9cfXp/Z0I/uX00y2Xdix0qNMHrbMZ2u/x3b38PZk5Hlr8et1Ts54ImL6efZXhn+Nhhl589wvJuGOn3o8rGzM5IoOLdczXMw3vvaPC+vHa8LFH3JH8KiCo+xv+l8jJElLEQDtwNlMcppCFLvUkP6/u8RIc3BUhQaspwL+X33zm8uhNAj417d2MdVIVBEESFQIAuzXdDtUXebZVQ1HAwYIELQ52X7siMz8LbeW4VW2clnSxgFIvtvAettxJuuEey3C2ZDp3bDY9deeN0ObxhEq7qcTBtpANCZ6GiwpDjKtl1m4lzHPh1ul8qBlEKIQibOJuRlrmmdRhxtWnWtAWKEk0Qoc2dCzYkP8A7VoDvl0dS5KJjfAuPkm0dVf3L5+neefbtETj7cDEpiSSdiwsotm7cyLotqf3QG9Fgg86u5CoSBbOYSiOT1h01+G6WG0Zfoq8hQkNMXrncdzNWNjfjxKSBA0USuYHN4GymAJA3hSwN10gbBCSqrM4HYyxSRSUlzTPaul8vowqtS/V+1d+MCs6KxmQBbe2zLm14c2AFyyUiAPte/1Y625odMHNDblZ01AW9EHBTOGh3ZUHUWHXqAOvXpmLqQmSiohI5Nl0FYM4UbcyVqM0yCqKvCyOOcVYR4e3rn44zYqGP158zxoDSKrEMEfKwXuqEUigeoQztEOrjhMuEAkZ35t1UIsruLTzbVYvwwRiiBMEJwUQcUOEwMW322eqbZsIj7Ko1HTgkOObOuy+h9e+uHa67Nx9IYN1dMyKYqM/TPZ+3e3p3mX7ddvPx4aD0JYl1a0WA6oEy7qgmUCJDWc7MzTEz0ez9Md5xKsekdIdcFdR8h3RCTzbcajHCMocfWyhoD4z673HnO6H0GYj3qyURjoukl1PM1kqhUrCqAwUoxwR2w+YUaVRiRoYfhWiNOKqJ0KwPY9v4T/LjXq0ORteUDhUToIKFkb2NKBADvBspfPDlLD8Rs4let+XO/sYMMx24F+QgzoCCERWVyiEeL3GFGNLPvW7VOGxtVV0n5wwUa6rfCC5ebuGxAjmWIIjlLY9N6zGiAD39+lfrhJ68XPRQPTkV7VdnN1/SPY+8gXIHTXZvhso+xt9Ra26KjcEcK4xzPRrRZfj0cK+HdsBPXC8x6jsUD0pI142YB4qqzAVaf3/gT+P8e5x8mSaOPL7Juki4eRt54FSJzm6IGhxw3O+edhkWwza20grgSLzYas+0MfTN2VEtydkEFssd4qoS+zw53U7jOW3hZn7GHQADmcDhOJZOaFxwYnW4nAiacMhsV7B/ueApydBS0eZh4ZyoKnydmumTPwu7dmFtKpRW6v5JhRPlBkabGJzfOWb8i5K+FqV8pCIh6N2WdoIVGOiPkiMB6/46teFBYpFk6aEeiCbWKg0QqBPNa3gCMdZbzNtOGHZVFfp/V1mwyPFrz8yt8qqKoJyVyD8JiBL7LGfYqZZwipCqT6VtYjS+JpDTGjSzvNL+NzuqBIoGXhKkkkQJxKwdbO4mFQANXq83PyRsYGJlJgMhaFAyL9pR6muHGSWnHLjr52fkYuWvvcqBvWH4ICbEv7BdU54oblxAPx9r6gwqbbpHGyjOzhuMT7Da0eH0mr8ESbRusVGZ0vqpIKnhhwds2rQhbeyO4QeRGtlSyFCCgJHJPL3ZrUPLojR1fraoplyrVAik5siBPIIBRus9FgMM6vEwxxoZwE3HlnWk2QpstC0MLjLJUTvMg1WWKpyUDOqK6wzt5wihA5owwA8+dqzv15PxaqnRyMzfPSPx78LZWNJw2tAt57Dlmt9jlSbNQ2RwAOe4za0Dx0u54EKDnSF2RiGDLckBQkDSKH0UCbFQGSrrBGTqsjNXW4XJQkFCH7DyXJryMapoMg4zMc8zvMKy72cMHMuQplfRr6W2sQGz5qz4AWfjfYJ0cAMvza3jir4eGW7Ds+0pQvkeiPEysCspI5I9myaIojarZsibIQH8HaxrjfU7q0wkUIBIZuoisgmd6XVmdVsSa9pnDMAjgPcuSChZcnnUDW8T7rqlw+SvF2m+GIbs9/jeSavwaxFZ0Z0Tpryhl+zzeOop9LwIoQTTSKSK5HVKP1bPPV2NGth61ub92OA19x2pNLCDLrgFA3OM2KprCs/O22tHVqv4B4Rkf/eWboBzLwV8vJgu8JDok88Q+OaaywGSpVw6g7S2nCjMbV6nkNIUZCkEnph8l3P+J1EDZm7SFHOIBF7KSF7T0W2Hw1h591YZUisVHVrtLMsqr6MPY92lNrZLXus7TkAEp5EBEjaU1x4ZlKdr8NBtMbS3MVW/y3qoEX2+e7iFpSCoOzNlQpHldtVb7z7AdSlIEH1NPZEECAzEhtL7WUSAS8ooVeBmOMUHDSm02nCZwccGhdRqMAKGKBgDz5cp5NONB23HmMMJUuCZcDRiCM6ysIjIUARJfFiA6ellcbizuTGb9rsNK/jjh8PuC75bdpAdAQdio4SGB4A2WNSmRGsfXGeUA9N999tAb8wLlGMcD2cYehO1hk8FxgZEdOlgl3B3VAxTLWS7ev230NSoF3w7giuWJGaSANEIijuyzGq9KVYeXn06E1G1vXvo6sL5KJe1TBGo0sJCPBjwu+tHAtBP0NsN6C96vXq1Q6dM2vkU2kty1oty99odV6SGRllLBxp0yI5aq2cm1g+aihtLYDjAjSwSCeHUNRXDpcbkI8C/OHzc97ZbGBte6UMLQsXNigAwWys+YpIBMZgbF0SnUSqjtzbY+3ywGMYUMXfPaEyEeanWNKOY2vfe2MdcNpFL7N032pEAwq9NoGNsLmg/I10eMXQKRzk322cGmVzLRhA9f2F9BYsI7JEL6yz4rw2sgyKkYRka4YSMHRdfSaj7wiTMoJK/WQL+QFtv36UFAlElKEaXHcnQyRCdaAVCZCxbHL4sblClNfC9KS/c2g+TPHysLohTagQOxQhQ+3ot+VQRwjrYLnAcI5Y6G3Z4iqGYfOpbJ1lVKkBSHKIFGFSxwJ+P6OBRRCQnWWtooCWp06tfEKGgo7VDWK1wmbhJ6bFg7xfHIsw0Tjv2XhUD9rrQjjvjvXSGl2mjug9T3gCAhGD4XPzOI5ttNQNuLFKVQAoKcMgIkB1EGYHknRXthxa4ERZuLTkO1eoHQ2ysNTDbw1S+K4QTMZgVCBsiWrXC92PLcGKpghc0AMHQt9nnYu8zcrG3ImQ2+wBBQkEo4JRSEKA6QgKl1aWRw/nqaUlzXOr32h/O3Q7aTqe1+7TO+6so9BwI29czwvSZKXgWMh97RDnudYm5vGsooc7rhr2DiLLAxzkRko5Fjfa2bZzmKi+I22fKQWhrTOlU61fu8jFWGNwotlRmGZaziwEbYWY6eMwGVZF26Pk2KmDvmuhjpjwXqZFhTGFUTyXfMO8UtvD3zd2u84IPK5FkAsAB5D24XQk3y1kF6uEhAvqbz8hiUT28Z7Qp6nqdjaKZ28BGDU/GdS3PCXXGfRmnONkdNcdyLuTkr5tY3OUEoLG61gw2M67CuLYki1BcsT7dX04TaZ78NuyxsRYEbjVw40gIRB3FaAHUAL4ONP5bbxwtaTYtxuQM+yqxI5GeNhhgFrFPWtEKoCQFC3xeBcOGNZG5oNQGrb3a8ee41IkgGx0dbd+Lv7zlvxkrW638ER36IN2x37lemnGelZJ2D8cVtLLJcupW7U3Jj2GBU48tsblVU5vnXepQLmZmBnOWF5X2KNto7LkDJHsFLfvClgr2XYb4aTh472u+AvQN0A6KRkd8fRq8asbODXRo1vJfcbCWiyZwo6PxbbrkNoWyma03Xt1uihyAHlWVfUb+Sx4UC5FiEBuVqYAWGYEoAOcWoR0GzTZqL4j63gktlOGQMsr2IXGhhAQT9S7qW3N/aJ2ddrcdHTuJG/fRUFWXAt8P5/xV2E5Inzij9Zp0c93bt7PXje3fls51hx8X00mZtmldmGOl/o7tWzZjq9PV69nMTsJU17f0kcJP5KClPvEHp4UedbObFlE9dSRAJuAX9CLR4ryE0UzX6GMAlRhJpie3vx7bPppO/wx8z9Du01D+Q8TutJDgVP2q/2XahGMH+rDAQKIqgQ31/P6eW1eX2vo5+HxUUvsBFsMvlMUNQoXyX58faM5/F7h+lttv37/f8dY72HydYC9WFnHTtf0+wv5nGvibdvL76ud/2f5d+k8NW2v58r/Ad8CSBA1xKlEkCSuGZw1eyf2yw0/5Xr9f8Ej1/k1t33+VfUI93Jr1R09/jxfr84z+p+n+GLCy9/oIUv26j5cj9j7Xx+199wv56/P49m2+WXryHIv+0rntobcN4EfD2t+z6/MT9/9f73vYHtA8h9tfMoYdQbPxU+6e7yllBHH0P6ri2Pba5J9qtYL7hoMPsXf9T7f6O2/N1P55/kbKSOQRTB1tHrVpsF7DqazK0M/CwLcp06EaUFT9lwXc7YJSqsUCspF5P1evbrn4nx2fNPtisVP4iqiyyLRtLBpWt/kcEwUa1UiqD/LSUEXBCf1fNeb1ZPZadmTzbxTTFGj4wvs+nYI9DfW86Dok0/az7O95ZX7mdU58KHfwvIHX6ikqlKaKoMoyJvhIDEjwIp8aSPHs3/Hs26oSzMGMu/CLv+T78ThSo0FFx+mD+ZoK6qPeq/dNvNZJnlZ+E1ZnpTO+te0yewfauVRkSRioMe5/IfBe38P0TXyu11223ocdPSnkfnswsfc0HhBwAewIKAg+wpUFBQPZaKin8rtcpFIqKgiwRRlpvKy/RW5DNA0BZrV1qmF1TDJ/faOtWY7awWIIZbFlGxJaYmIII4rhgLCrOEWskFOLdWsFHSf8yZy0WRj/NSoqToWuilYN5CkMBYL/xP/G4DqykssKiERCdkd5MVOlhVESLtD+vkDr8DWf3p/UWKh/KwrP7LcpVtpbWiSiLjmWWj/utzMzEUrMuOFZ+d07TRtBbdUo5w4Jl3YXG0GYhiYoqCO8uMtsa0a0S5VTBy4qqo1jRtaUsdYZN/+/hZ0YM/PWkyP6/opJ34v9HGmf3VjEMvpjpJ+UejBNCCez088T9Svm9mE9f26q3utWMtF+gYYRaLuc9UH3M/m/uPhs4wPuWP5o/dtEAyrMDFNUwpWvYzdjt6N3dBW5ZbvOmzPX2JBQkAu/nrw/bq3hhj+5Tzx5hAYA64FTGSI2d8JKADFQL0phsTfw39vcQbFW1FpGofVNfO5w7Mm34UvSOBIfy51qDXSk385dVPApXm+eyZ7BgjXnxdgrV1PAzRKIY88CfFgg2VvzvZiQcVMx5Wjw4YsODhSNm2Ska6zV0a0b2tZr1JK71jg0HkeGY6YsvXSDwcFhJ7ik4yylCgMqCcZHSbqyp/FsAVVHhTvuYiBc/hNUrSv8FQ3WYs4zVyLkXUoxjErRklFxTiIoQR8+Wcgu+QrzvmskpUvHPe0JUMc8dpd7aVFxRWtCzOkC2Gqb3p6V0izGQTNBQZysXOuUQNy8C9rn5WHSKDi4h9G+AuZLGqpk9nR2uViG9L+bHfUbfdGu2zV8KNWUSlVcGo6YlxLSL/V760jW0eduzkBToa+2z51z7d7tukIS1q5drSXGY1iWsw128I0JHhGWhIfOvaZ2qxVKRrK+UAdTfp8zCWxpXy+0UwqJatHL22NwJI1QNwRBI2XdlgTc6gZfmnqarKwGILAqwWDGowrmxFsPdSitSw7AuLNAgQFvSKlkdRXcToaskVwWrgbyWRyEG2qlRMsPfSgLLIwCkGgRozUNKJfBGnjNruXKnmFwxyHjvZafrz43qtc0MhaFxhINjMZycF31nu5NJybAyIlmHCaRGK9tPmBa60cVQbt8W6avVWHR2ZyMad1xXOZdKjVZyNWkoho6JT6fHi3Y0L/XTBI6O+OLo5HKIyCTCO7h7d1iyR6+bepYeTZtVEUnoRzmrLKuwetMRnGdIvSLCGV9wmQ658bI5mIMZqGnZ17YaW/iJRzZFEhGCQPo4xsEORYXBYFUbc9DvqmRdWZSloCR0/RPdXEYqS17vImRWhL35TkWBUvV+smP1odJc2740r0ZMU8btsz39mbSsT7ld93jeIqlioC00rBkFgGCHRYZINcSzKTAkSlUDvqGt3Uxvz5c8Cp7EbpB14d/duRGylg1rTBg6XM067WVhbdNB7HJKi9ljphr7zTI5PXawXXqnrePaQ2MdCtx15vgqptZATFCHQtmzBSrzHd4jdI2khrHqrqMP5V5iNpkUVNbdNJVK0DfbLJzRa2vUa1Y6HR3e0uWHU0iDXOjOrSwUFSlO4PX6ejAVsUpR0xAm1Cm9lgoIgqVSdzx6s1eM291Apw7qMNMxTMFZj01whaVIeTCzHJYMDGePrumwyTJyjb4uIuLJhlSlQgHsRUAw2BLflD2c+2PDjOCvlkfygp68UxCekxCpC0JpHr59te23X6y+3x/jqFps3QhrE9YR/jkqHgY9a6gzFrVFa9rkjipKVm6vMy3Vijul6mnZFamS1FTW3IjYkau/x3zrArVb6k9szWuu1VokZKFuwy+aJ7GysJaNcswa/DoHd6oQHW6+V+am5NBG9fa7P2LOcgU8v3MEwnn0zQt+tPW9CAwW56wIGCEv10yLFnmGZ26lj5I+h2XnWaujS902KvFug0eDWmhHsVgYJmJO3dXry8XzvqrYJsQtc6v+f7TaorYgFjKiH7LZo81WhUG6Nofge/bUt88fiTLsh4sGXXC3BRuGDQHBBYG8dn11ShQd8oN0+ZLj3LDWP8h1PoRS/ZcE/twsXNpfj9aqkZNnVbeIi7qJC+TI/6xF6+v5u1/sd9G+ZXzjtjq2LCiDSr0IUQeh9ULEIqNmzB1Pw5zYZWvIioW7Y3gXaU467WdCaUu1/ZP6tVmqnMPLw/ZglTIzQRoOYgOHBNtMoeIJDSFuHZGqi/VDU+J0iG5kv7FkS8SdX3we9PjZaPF75ddbuM7RpSk18pKuLnGZpJlZlvjiAbswwcM6Fr2s7i0r2KL6Q0EaIyxJMkQr6Lh1C3ZIxIlxMsvamh1ZRNQ0Ejcpvm01SBUE5KmBDDd1wd2VksxBEX+R7mkMi7WF5u9FlM71kXhldqECFimSrdYvuoG82FZgOJuNyJujK2KLrWuF+OcchxxGXlC73hqj8OXFZE/GzqelglhvuO5tX2gzzbnbrIbxWyd6vay3ki5zCc1sm1m2NSOjSFpN/Y6yLeyFhPnT1BZFr0HBHCra7sPk9ciwr9pRep2AnD2I6KGanXyYPzPS1ZloINcKCeZ62eFQKnTv2AADBFRzuno8erls9Nxr0fjCxWnSXkcTxWrtaCHZNLcsSqAhU8rYaiWSqpjHUV1Z8Fm6NGPdO1DrWauR2CrRhWZofZgBqfy06YdQxQHDiz5Jgjsdqkem70HIXY1Via3YyJKqYgyaXN7TcJQFz+64tw+9hay4gWdWAcMW90KwWTt79gGmVMqoLMWKkaL+OFZACJKhb7Wi0d63nUUieLjGbNAqoU+U9+a/P78OjdHxxn515jXfcrgiW6/Iy6guvVUCVQjodc+NZFXMln+HaaM6uvTm9rLsbiguQxfTYsaRjRUdVDBnN722vfktPC9hgdGvk9tH1ZCoKnZj2Whv3BhEZ1SOD92eKu0oLD2e6ITCrzuWa/0t+XKbyihwdEIt7SPXibFKcwrKfk+SmCOfvqfHUZCoiAPH7zsGV2x9nyR35WWDefq+npxO4bazrsQvUFD4sGFm9xaAFJJswVlHngetvn8ds6irHZGPkQopexFyNE9yn6/2uga5J8UVbTk7Nx7LMGItNoR4taYiYl36mEqrMHVWYOXtaZtYMtd7qm11q92thVJwOq2cePO/VxAIO1ZE5ds10Pbe0twtEE3Onh8C6a+DWfELYxjZlyrBmZQUYc3N1D2hZT4EdpyYNkNdMWqhx0pz+3GzgOygjqSU5uJaOyim+TQoDrPCMQk4C2YPCOHh3SoYsOFqgtGbLDz5LPaRfZww+Lvd2EbO8eS7VzLpven1XekChiFKAjCoCUkdxS8Q+VpdJrtlqqn+0w8xryyLS3j5p3bbPt0HGgKBCpJlVbaWcwu7ug7OzbkCxGsJ5AjGsKJmqix+6M+NdnjXtx3F728zoiumawkq5NXpy6pGzDUSbayXgRO8SXukjVTRGkCA4ZmcZutOZl3FmVPrUBTEcYEdxer82SHEipHu3WlVeUa6TxUVkcV9QPbzmy65ym0y6zW8L3eoXWmsThbpjftDMtyIMaSKtWRnQ8Cb+VOYNtawwmSjMoBh3YhLawwdqSS18ifDxAhCSCc1VSKQuDSMWqnhAHpFzcQ3bjYeumfaiwMepKdcFb9bmrY0l13a7s1WU0dhGMCMNi3RcVtZ6XNl8lxF1zb9p39vFTEVgQql1XitvsrrACs4d/q2XR0Na4P8ktttYLZy2VCPR1Mx+y+nN8V7+erOJHvpftdWcTbOnCB04EkdCMA7GTKAewedkaIBBJ+3Ozcxu9m2E8O4Mvd4Q5X89uldnPbmZbzv2UBP8dH2ET9rKFfZFBPzz9X9PJVWf47JCFUrD+NjlyhYigGmJqcvj9YYyKHbA7vDwpZ6U6JCHEDB6pcZKfiXCFyFLckSmP9X3v9zSbSpb46O7H+LetPCm9c+G3fy5GhVNFRaqtq1bT6jpnY2NYp9ZecANMkn9Dxsm/pfTDPLWue/E07EI7KfvDFhp36rxoLlJyouWOk88zjU/L1sLOgpFVUXZXLGIZiVRODoDlJ+2Rqu0hfV+ceNxO33hsM9ETEeTAc/mWmwgRbH3vqqQg+kaDG6mypdewWVKB2d+HoWoZ8Xk0AS/ceEQJdeutq0MYgY1TvyTEbQiAr5x8/krms6PuoPzdAjfSSWwZXYhSWVU3XDK5prR4AsFqifpnp8ZjBQ9GLDc22mAWrMXx18t6hpkYmZnZeTqhhLcFzRvy0k26+FqMzqIZuWy3fNvJAre2LNRCRWw9cBJdUJsCB3KA3VhlWLvyELLgqCu3bpCOZKdAG0/QWVvrZmnvVxw5QoPMhkFl6ICs87Apgimw1RiCMXlzv91ht2sSRcqnVkYMpBUqgKjfiuNZnbo52LGhDURTGLlrMyFsIyYwxjaA8DbotSOq17vwj70er7h9N9Sq6sdMHQK5nlk9eoH2aii7aSFxyVuQ+/V9DPABv4OfhEj7TvcDRRCrDjO3VLfufb8ZynGgmkGuVYsVUlSoKiMsDAigQJA4uIG7e6rj7dqKCQFzLOpwyDwJxA1sq1HTGJTQ8zhKBoqBKkESqgLRK4Bcu6FAYQhAUSmhsQ3P2fA4vvcLgbFG9Ar8GsvwqoSSUNxsyXet+YyRdKXVlAxYFvKwjSOM4X1qAoy8d617RRkcWETL9xMungLwGObhrghiOoduS+HGEWnono0NUD2GOO6tXorMrGn0cJ8IHbYKYtjC0e6YIbwMzu38dModOy+HoobeOm5z93VPB269GCY5Ycgug5h+QEDOQPIoOOKiMq7iV83F7fC59nFM8U95rqnjQl4jgKNsIll6gjS6/i4hnIGyEN0UDsQPXfMnREQtyiefdmSB0wm/q7/LXC/KUOmLlDal+fbBmIUpbaWsshCFglWKoh9fAsJyjggborj8374Wj0lBZ4sS9PDLm+XQ1xVRgfoNMU/kSmV/M+cgdVpW9gWgLlwyCfNtnBP7pkeu3uLuEuzJ6I6WHk7BMAKoUtT9XA/nAgS3qC+0jp4m341CQQ2vX7uG6sK26wwf2x2iPc7NPx6FdWX4e5VM7bXzOU4T6fJsWv+gAPHnvr29v0+1/jj+VJtDadD+IoDoSBwJtGiBuQ/H7jFXtDLJCyNKQ0dC2WNLjFz/RmRZuWkFcTUaLgidvMAiWoFG0Du94Ft8J8kNmXwqADOrCpmGdENQ6ffYcjxBBR+nOmTUr5OMmItVB8KeGFY94d71OutaDWhFthdqYVQaZrrx4guBim0d0wLhpBkIQNllCWQnEo3zuIQMmxZhCgILtb4VUjSboK0TUO4UE80LAiqrULIqmBq3wzMJM6Zmqby0umQw0qxjIQVE539nt4bFHLhbMkJJHYGsq3FUCZoWivIQpmgGyT3GhxNe5kkJUak4QNQuoWk1uuxL58Pxe3H9Pn4u0EjtWsEzTBJI7Z+tQ0t7Kl+GS2PeaiFOzUqdup50A0ebrRPndm+dN4aOpxM5kHL/BP5YeqL+5D8cU/xRkDCKWgFoSIYQB/yWLwsiTM52O+dl05L1NPfCQtvpRvyoh6id/uqUur5uoz5gdvdfXxYGe4uZCFnusYAZeBKfLiGycBqKfRgYQ4Y9Fpco2TKjuooixjIJWUSIwQjD1a8SLNRDoT4lFeUCpEINCSLEJueJISSRV70GhoaMGG5nRA+tnaJ5xJNHASxTkuIXs6yUq9rQt2m9KG5EhthXWZNsy9TQQ3LsQw5azOWAoyzL5m+1i6605CtLVAATmeWLqTPQ4TaGUKPtJKeOO8pC2VUG9b/jDpKMoOcl3DE+f2Orx46KAzkgFH2HCxANV++fW/OsLo2V9wgrnxbay0qO/pJeUw7JqSJwIFQm32k3x6d0PPrOWKDGa65BQYJ7EPXzoes0fMEZrtd54qGB6c2a2c/XZD2yLoSGHrtnXXv1P17Ct9cDfzR3EFRUHYuDiw7u/atvPFuV48SBU6iZHywqaKw3ad9wmd+CzwScAvNvLUy9cT22fQZd3jLrr9po6QnroVk6d6jwk8QS7CXfj+CYj9P9X8U+E0ycJmffxn6Jc9vEzKi9mFiNpmFCnEowKREBnkKS7qkFqA3hueO7rC1T4W6AGCch7GAv92B4prlsNft5Q4FVoBA8DrQBg9/Duuzh5jzfCbNmMWaaEn78HsWuODM3VAZAweOrdwEqCcIF+OAHZaV2LMi3dnY7M6zrIy7M7GNlPyKMn8tJq7stUq4IfnH6tP3PLfDAHy98xZJCyauOjpBTp/jSYBVJbq4cd3zaYqp6AOCApBIAsiIGUTN2ClKhfx2YpcJt3QJ+Q8oP8PcNvrfCq2430PxXUbL0/O8SEew0PPZstp3cIoLMNnACFmXrTbjgdsB8BZwq0PEcgz1xNRed1ZEph/izN6VEHBATN7PuqJvZdWGKQBigJKEk4uJc8DcgP+K7B13+PCHdzpnZQLPdPw2GtMe4iYd/ZnigvJrk5zW/fxrBs+O2d8kQgKy2wCKq7yX2NxRt2TzJeAur0ZsixTxvetbRaRtVaDpGbu0yEr1IAJcWuiICLWzQQ1e2Ua7ladrvdDWBFmsWgVV2mROMAeod1Dka659Tp+D8oIAAH3PT7trRPwfewb/w4CD+OIoGH0+lWhRS/Zqu0l/wBWa6f8Qg872uXR/Cht/oxlJQ/ZjVsX6sq++fEv1zYjDywoe/m8QYdGcnFAo+TD9WayFeRHxx0ejN+rDaRSQjWDPXszvQ/fddQua1ZMRZ4/Gw6pNeflgcbLF7sUDtOaZbiAeyqoqqrELDCJRfLZGz515nar3Ra1clETOt2eBZbyFrqx6RjdWRNCEvPb647/zXb3Xz61GAJC5pcaCvHy7uGfN2teaAH340QMwsBDgM6g9AjtzHIZMVLas4dzYzysQtFhs9k69pGoUCTuUVSHa/5R/aZ0rLa9a+ZzPo3rKdQU9UqmSpJCqqqvbspAutS3n5jeUgbgeVYXvIDj9nvu4uY7MrMdfjux4oANRRQhOlSGsyQXvAgnvzLAXmGcMVlB+ItKuS3QgZ6ab9IqCU2Witj2s6OTrCJj0hiOCLDOLKXuQfMjhb2HPVBJBrHvl358mZNjjYz05SKGSowAzS+GU9jkbKHeadApdioAdZFX4HSKJyYbcuQ5Q4UdQZBfNKidCGb+hCN+dA62AUpeFHVfKBh+oTYuH/T94/HgAJLL+QxQUAK2e9B/gyFeEwFXPC2MVXBmCv1ZJMpWrcHaArl9sA2EWH9PAx8V+Pn1+f+wg+pOTBI+1yqR0Eo867OhA/XPD8A/raP9FGfxUHLcKUVykLGRQgoKAKoxiKCKkaywBFQBbKFw/aGsbSjWW1Urc/xa6ZmH9hxDlkJG1VCBwKkgKsFIiLJWSGCYMkWApAFqSBg473YLDU3SsbKBFKapUkBE01QkZiSKrYJBjmILpEUsXbGuA00oqVVKNQVqIrp2b+Z20eM78Aw729Yl7GESwm1+YMt/hKSg4n6F2KiCCiMEUdDLBgqZAnGGCxPTjf6fGSQDwDl/AYwKj3sko5vAChIDR9Sx+3wAooqg5yEZKSEKhP4TZdaMf0/r0yEH4VyEYp1BtjEDkMohAvPhA34Usgbe6EwbtmMo3nRayBW0EyTAa4xMNviSZiJIDXkOSmDR93h8n1z+xVNjo/EdXH9jj40/7QORqP7muSST6erLwYRGQXr/vPP49PR3+P8IfUqDDZ14pI+7j2L1Tc2a6mUwOmD3nCSdPSSxaTZj1cANvDe8Th0DVOgP0/vZPT/rK/F4/x/L8WS+Jm+GFgcl3y2ASfs/FRcnnjJk5XP8xo14DdtyJdTaHYtrB/XdETeP7lHlgvSpCgs5O5MhOw6NvZ0bDSbNCnUoaAzwI8GS+W/ND7Xw/Mx/P+GjANSIuZ9UuDkR08rTQjSngcgHkYv5h6D2PsN18RDrMhA+gPZVUSgOx9WlHrvmTf8I+81WxUwPIzHJC3QeHgpKKLXaTWfaue5hJ8JvNYHb3la+SO8ubDzgey+7xB9aYMbH3ncHWBCEDcGG1T4aInwNbqOn5/brPn6l6swOXcGLZO0m2JWVA9anmJ4ow+JaJDWcRKPDPkUQjIhb1Go0LhHcO0PA2FGP6fvkZJxNPeRDlvT27mxo8K9HwFmb53+eP5/hfOv0ZlrRPAW0JAdlX3QShs3IFEV0UH3Mki6QqMUL7IZ+fYHSHp7XEE1r2PyEX2HNzSjRQ18X8fh7Q8nMOQvUoce1+LIePS9poG01Emm7wC0cReoNoYv5cw0OZA5h14bHwcvantSSNOIe/fNgpGN4+ju8sIvtOsfXxkA4z44FlPALbNpPIxMROw0Mwuoa26+0z9eo+S3Ds4NM9XVezrwCiPjvG6es3CG8sbYp4B02eEuOrefcjISXbjtK56jppxLhqXqqZFVnedPGnj5focN2tLUnvyhxHiQzjgNneiYG7ZL4KXUuYFn1Fgs7K6A2B2h4TucfH0VJ7BDD9wjuKGSm8FtKERAkJKWhQB9uIDKAeUJ2ntF+SdTu/vfQOs050e878Bh5F/XByE3kApCBAjIQVGIf6yl59HvET6CD9WuVEhhbTUOv0GGySdmHt/V+nWvrP05R1iaNLdlXKX8i/Pf20H6H8P3swP7K/sVdlcRcxVo+hVEGMMmQiIOCUVQeI7BrR/Ehsyj+h8GZq1nE/ds88NLDeh9M0krSynR0w3VZ/yp/OM0c3fqoUyaOn7s2b1RnWbB6S6lRMk5XAK7CUE7OrCtqrhOtTauFoCP9T8dya1ef5l3ITVfz1Kipadb/ypLPzK1P8dtrCCHtdwk+UzxrmvFrWaTQmueGX9za4q22LwtOVQF1zV4mzUgUULwn7iv76WugYEbMNQqTqGHqpWkhUHGqHwU5W0tl20oipxJOi7blnZoqHtkxM8ERH89o/LSWFzEBkGxH2YjBDgje38vvWTUD596YixWJ+XtSefyPukOBkIUBT6VYJMkhJZEK0d+YJRJxG5XGJ4wK0idOnHK7RJjP70Y4kv4qyuutc/wONtDZdi8pJ+bA7LyPLbQCEjNf2XS7WGN7asHYTDBzP1vZ6LOr10BeHoC/8Yer6fpXXGfnTve+rsLBIESoQ301AgjEWSKW1FV/Dd/gprBFWEBERURqVWCqKLBGZStkpVAUYLBQVVVVVX0nFRWHoeE/FA/GY7tjBPOjdTY/BNENSpsbGtJKu7XAgUPXpbjP9+R20Ow0gTQS40l1YnhRsbpGWFAiH/V4O84LPyhSjD+sNVVFVRWI8B0oYHggHru6EiBrS/gQbEnGR0SwuOoSyWTu5gSrJxSENCLgmbK+gcOCoVlKuieUfQ+sk/u0GYaZiMiaQJaHOxKNabX9526bJin6yagp7ITR/SkPE1OdenkG4Gz9vKgjFFWIqjFUVVMlGVFYBjMPE9Y0YsPZZZSWqkSYVFiMRgoCxiLJCIMIRjrsZKYsblg2G7WHMzK29dE1wAIbXsu/IHmH3B+Toh7iPPl+FUj8CRqj9/uJ4lnjamKCXEwwG0paituZYwHiPuT5HezaXVr6tXe6bHXrBYdIGhNmGw/cd7N7piLsdGjNnuEnCTowoiqIqqKIsRkFg6pbZKJ05zCYlYCDUFKyKCySMB0lDTTdoqyIpb1wgFODrVKMZ7FQrBmMJRtNhoDnCRbuRQFoImB15hjtNZo8iDqOHKhsmo7ug5wl8FFJYxM7MImxtWhHF3PDcSQgXx3H81wMj1a45FgudFEnFpzOILiasTTbc36jRN5g4aGVLQVRKfAvfIYSH3UpBO3tWKiqoqrEVXJh39lNACbNNAUw9LJaYcwOXIqQ3DzRwoWAe/aV6L0jujT9lWzYwgFYIEAlpHvKKtoykkaliDBgtiUDGTg9EhAid5oOke8pXVi+YC8cDgMdc3cNCJwO82GwsaHE2EBuYpmhIpwNWozyJq+yCREWCGrbasVUkZFQYrESMEJESEZE35LET5XxhhCFECkShyd4Bj1PAsITYeDhuJ4m5yqwMDR6CA2NE5h1OJ+8B0Guwc0yLPTHs68uIBc7LXttC2RaJ7VhvpIdHgK39F6uvuJbpvgz0u7OVL8O+Ei+lUVuLY/9xfcSn1t9fkwQIDr7QeCdSgZ5qrPch6BiJWBx/YCPtrZ4nghw2X1JobaXULkMsHKEjaHBytY0GWvVxzDajVBLUlSRm7PDzznXvORGPWQPXDtVyzjbC8K7PYfT5csF2O9NnmpOQcEdfS9xsLqvuJrmhrGAZABqC0iQJFxPEhrXE2e3bgHQ/yrPyMQ/kcr6Nh7CmOxeK6o+wE7DkHSwJgNndkazIxRG23lkQwLuw2VyLmmtdkfX08wJ0/mR/FZJ60nj1m3EqY4YUXC45iX7QpcSjrPfmOVf14e+ZJPuYdXSP9ylPJQgb8Zk4YKroT6DSFgkiCSI9JBqDIloNgYAdryQCgQMXahuA8d5+z3+8CQg+VSKdB9vcvtAQOs+LKHRCtxoDpFWG8PEgAcyYFip7vLIBNoeuAa4IUWRgxYkNzr69qE40DJEA5YppaR0Qb7Qsz8N5ieoDqdhYCwRJJFgpJAVYxWKqDEUBEQ+iaOzOpzD6D00fBPI8vJM+8CdKijFOsvst2aqhDtAIPX0EfCSIQaSkTvwVR6xDUQoO/xAquyGFF6ICtiKpawP5oCbwHsFud4khrqmQSMFg7IWI5nhPKNwwENeTmZkwAP7EJCsWDGGHhNC5KGJbLJQtYxMSEMGK4hcc7IdBygQ2oQKgd3S1q76S+HZH9ncuWPhDQljfAgnbZ6Yd36wgc4pY4oA/ugECjdjJkneuodUkUAjJAkUSQGIcqgAhYMggL2gIM39CJgNPEy1SyGJRYL4FWpoIVPOHG38dogP4mQon/eIUTSQoMn4NoCEitgVc00+tsu5G2yJBio2D+lFcUeEJAkTnz1eL4Y5XB5kiERpJmF/ANaPefACHLjIVJLj91ro/PbNmkMaJYredo6xaO0BiuVbCwUk5tVK+kt6w9kACCQSEBUPaut2ENtJ72uE2wMLlYLY0BBgAdsUqJGJHRqAXYIWAS09oBuT713QI2Ad0FJEAiRIEACJAWRWRSQYMBFaDVH7fuDW5P7RwSjNROLSiVrCYWwltkMQ9wYHAAbpp9BPRP+7/hpt68fjFzoCyKCMMKDCxD4dgMiwBJGCC+CbYzw5vUvWdgoBzYiGCDHrCMEkTbvd9LvYxZAUh9BT09T7t6JfcayC6RZQTsCydmEB4jxiG2AlSMCEAXBUDfwlBCHg/InQExf26EvfxDIEyNYOmAbEcRGCdDju4ocOXVmmhDW7GTRJUquSEJIP22EgNQEYxFhGosgS7ZCOoieoRD40Q849etAsWxHrEefBJpK3O1MwsiYBCsFixYmIxlh4xLA/yhiMffaANk1j1CKhooR23xzyKXVGRNIhKsq29v/KysXBFBZAEYpFTRbYNhYxqFtKQtoIiiItaqtpRRLREESEUJbKMEBkEA/f1VUIfY3mDg89fm7lXzqBw63HedvtoWROST1w8OPkRZ3tD8p8EnLAomYJ/sWirGCMFNGgPclGQMTt5Hhfp3JriQE+n9m/Sp+iqf6LX5TCxIWnWUnku6aq4O1hLyzPpVWBONpYox7dGYjclVRNyEGYEj99hjpQeny/LkX2qfoRAGRRPqEOiApEiyADAIDBgKNw2JAPOO45BWD6wDJVT39MQ+44mtAMEyQLct3KQbARIoaaEkCSaY2kurgYvWghbjEKgV1VvdLdyPPRutWCJWB7B5Pc0BZt6HTpizse+8Ei8CauYmAojGJ7w0a0tBspSnTucnXe4gG2LEEizqw6s8k8R0yBicdjlK4ghjTKFgiWFh6EGHlFbxGqUrhDynpqptjXoWljO1ZFqLH1TcbAy7M4g5hZN9K07Q1oGugIxU5RN5fo5Soqr49ogv6X9uGALrfQTX1iFF8saKQYNOtW3robI+kcSRKEx1Z6N1MCK4qfpww+a32E7KqCIgwYwFIe34BPnDdD5z5h+ZS1sK7pTi0lQLqlSiVEURsEZGGkLot00JVAMQIshWALJFhWpWXGUWwVYifMHz7m0qomChaAJIIaTUiPrsZ6edwuWIJL2tJUdeBcFgwG6e0DqiiO/skkSMGPt918tT15QwoCNiw97Jflz8rflrcjEE8IB3IQmFH1YHkxbGFW0JRFYqYF9s8IaYnSCFjb1pvHpHHqBvKiMJCEiDWKWUNfOcxp5pn60RuD7S1IeaavPp6XcpISDGKpIyQiKW6uJkGjLkIjGPXqWYJU9X4pDqcrpvklTAqQ83o4wbU+RHXrw2QtDEME/EG1A0sw9CFB838n8hbOCyRI7jGJ3vzZKwStYsEX/osKAn2WTgfEH3wphMNsFixFh56FgAosAUVZiz1JPScBrFaF6aww6PsIiQkMnGQOtPW5A6vT7s0E0nC1BgXtutubuq9aMTC6VRUJFy3fVaol/+P+q1v8NP19WowAyL5wqEBvZnpVuA7e+yGziS4MKh5mGDCIw2mYE9rgsPVZ0Thih/IXkziRmMH6rPdubmd+lwEBiMg9bQEtKJ1QuRdMqrvlX3GFwLk0jtIolkMGtAjgW1jOHO14A+H3ezM1J1OvWGUEYvrCB5714MOERO6WJiLNm/t6HB+Q/AzCkD7vsO6w4ggMiQwEWCKWysW1ALIwRkUQIA/c0y0T2tLREALEqiKjEtGVmhKRkJDCIsYkUGMVEESMFYkWKCKLAO/p7d2N5eijpMQC0Bm5H0aA5Jw4JYXMNLyAqir2CGuslSP5aAfa4xTySXQn9BwEUGfpaw/ZyyGJywvr9vt3udBAWBwTW+zmg7W4wxHJaCFRBHCyYhgjdYYaSquoURzKghWgKDMMtlBmgeLKQlQY3t7UBUIVuQiqiGXM1aaI86DNM0GN0WFYCIatWKMZbJZFV2k3lIwYatmMGmOT9CbdttFp1z0Q2rFY3rQ43SKQ6aehsSJaF4ZFVDEMVU35XFbCVkLuwkUHIA3AYFvsjLHQWgpww2UtmFwpiKNNGWphp0QyUjLQbmOmVaYJVKumqixB41s0oa06cWFWNdJQQJYzGSCrBVTBW2kjrxJORSJFp0cO8vGZkxowXBRBLV67HeGCVlrMxtJIYzXNZaAT06jj45C0cuJNU9bmBwO9m81lQGQGRhiEOrMYPIexJ0B0B8UkLy9U8OtnU7GAByYM0M5FVyGRFjnAjYChs5KuhEDQARDCSmFMQYAylJwcE0TFZIhkwYkKWEaPod0Iw3HZpjxHl1OHO98reBjMDG1D2z5U+B81qrFYHVDnt80M3BJ+gIe4EYP6fYSSHyn6Y7rhTFLZaY4CyYIqCQJx5+qnjIAKC9qGz4qiLPYPb4eGGEMCDUDgj6EAZFUgyKLICyDFUGCsYMFYMRFFEV7shQpSVIsFFRhbVSIKRBkYkiKw9VoKKAjFYLFFVB9nh66ynjD0iBY4NHjnYzO4U4yfxUMoCmLADJ0kfZQOoS5uKBxTEEg6HYRPhx7Se3oakxCGyPhicCK+9EKWo0iomFITo165GEhEOcFdjz1Tb9u1Wp4QF7jlTYhCRYiCqMG+IE+XyA1PJFeNwyT1s+Hbt8tbP0hPgHv0raTsgp+bKqaqe4nw8fgYpYZiepkMtnvaMNwDWyCyIjLxAPoVHl8KB99pKsHzg1AqUIH0AHluLBCEJFh3x8fCSpmQPdgQqpoJiFjEvQQsAVZQ7ootEYJ6ZU34qdLEHknQHXtZHZE5weXOmPVJMnQDOw8hpy4uevNuMY04C3VmXJni61pSKtXObgmKCCgtIxVBXQhKrqy2SLWYXmQEqGCiC6GBszsGHI88YiJ7tymTuCM7INg4X2O3t8fi1f37nnpcy/a45ePupiI6WxQ927NKFpCdbUpKuMsg2mDbVyft1IKPESqtAtBPtHbv+Jxe7Y8/VrQL2nT4uGKEoEbDFbQYw5PbqRrhqrtXOOQQ/f2rPcwOLRxmiDGbhxrCe1c5fSYcR49uaQaSWCKNigtLxS3huEaw1DCawtikNxbF3K1kDcNUb5cSdr6ZIVaWI9KKgfiVEvKrY2RKanXMPV3HfGq9Oi6KDeldBVkkMIlAkoiGSgPDD6lKXbIXbfTPtHAaJNc402+2MyYIrJFmUALlUxqpA2JIaPD29loBnmaXBFZ73PK6Vi8S4bWgzU6VDI4WcuGDKQpdZHJRMaG0YUWVta0ufzISxFXjm79s8mKl6dEj+JTK9t1hKK50sCapUIJGEpSmZ37z3H3efC53Tknc5auvjfmUwFFyHpVvwnrSGz17s72pMXSjqvaumwPbQRUqWhjCvcVDaaHF5zQ2ws6lmWlDXdXVXlGOdnXN62hZKrtDXEGMa4qfF4QZ30avJvmes1VB14HWCFtjR0mvOOi1Vputrd1VyK+2ex22dsVh8w7ZF83uCaFpAo1tMASJsBYSpucqrOiuJEvsdmtkb0HbDW1s2MFbb1UDOEdeM7lZUk40FSzr0DKVGlSdQZoQr5lJG7sylmL6uprq49UHaBKhJIvO20ehjidV2OdFi2PD7ZTFJkVC2VXp3YPKgZIAR3CFEKbBFp3Y2GubvvvvfaM4u7b4qUdGhCEGsGnz151zA77Doo77SqmIYzWkkJHb0Pom6VeEhPTqKNF2bix7l2NQwZSjRlRwByXO0nUujKHoo4WMRaVJI3hFfg03lOjwIQtgFBSW1mcjGdWg5KrAZghKAUUCo/jw5zHdyb8CoJVIyQ9spgetazOuwZvyt9s9eX+KnUhWlXaqiY6vPEo6VB2gMY2hiD0jyqIKji2g2jqlzlzSrarpVoQ1vTLxvdy1XSaJt83o0iEsepOIrQqQotoJ0re1Z4VDFQIz2yzVx+4qdsdt1tyzpsQj623E0uraFxVampKNFyU45XG0WWzGcM1jXpVOBFkxJymcUPHnnDuh3Gwm2EWCanQ7boCI1abMdZvLusRrK4XhgeSaNNRWbe3FkxDYys7ukUDDrcZjKijSh5IGMHNZKkVQ6eGZZuMyyUaknuglW68Vq4lKnU2AIoUWU7HGTSbE7s6JDEANMixSovpFGtDD4VGrdLTfoHLY1VxglpXOzu6Dq+Jasots0s7Y0WI7h3bLy5KoLRXFDJbEL5WHHlYs49XXO3ek69rIcoKc9DOhSzCNwIEJO0XW2imUoNhLyECJ0TfVQgUjIyJQcGQxhJIYy4uQ5Cul52QbLmIS4JuwDGQjO/aBPA8RnYK7wG0tecLMFHdzKTBJpifvcirQHUgaoRWfNwU0OGCp27FYW6os0wpnz34RdBYKvd12q5ocRtN+reK8eEDqiw52AdpnB2dIepIpNpMYL9uUDGVWFEVQVOZxGeudzwGSHMOJwJwdzCUN6sKWdj0sQVImhFsim4sq4y81Q5ELSFo0hqMyBdsyESRmjnGBgBmWMkuQSyGAoay6azYUG6CyjRUKQB7mGyB4GQ2FXULpFnZXYyGhGykBwpUIwFVeDoDR4AuOYZBQvAxTGMCAsiZoB+tEBkRSlHcyQBN+UL0ZMS4QgQbazFBC6+zq8gLJvTIKDEgAO0ApKVb/kFp7MPppRIySBoxHGlSqoxBtkJGKMJeppMLUPOQETU0gEjGKgoAGgEjuetjGId4I830PWa4tG3Cw5u7wyBwr9nCq0WfVqXWwNYoSFFgz0QsWKNM0CFdIx5NQsQtb8tlCHyF4Ua/A6lMuqE5ezWyicLFWISUtu02EioZ3m4FhuRoyRGcDFcYGdTdgWNipvztZ9BpZB50zTyqNit7lxmd3gMJwrFUtFogiHZ4NSGZSKETgRNNMlsFFi5dQdIatVLeg9XLjftC33uLmThxl95meH2bdsXJWvbM9L9fbPHjblF+vBCuxdoGeTTcoeted81eM1MWuYqJyLQcqVWqW1VUCPgeiSSZCKQKc0ClSzAsEE28g7HvI8pYM9YRCRA2HakbDscjZEMdygg7BBIoFHcy9hpDuUDFSuqOZfgDr2O0a0NDdAw31qOgInBBRD2+xTzkZPgFUQKUCliIKQVVRgrNgHkejA9owUJFAsm0BzUxFMwDMT7nzXLLMsw0gEIhH83UC33+xpADBU2+4CkcztYG2EnwdDoPxNDGwplbLNY2FR22myb6/KAxjMCygowjFY5mSGCNEqxWUYyScIBJuIoQ+6TsxkVSR1BiqvUkRJBCRMSKCJ1tB3DjFdQZwUNZETNjUEqADIC4B4op2aHME5EWqd3K8pIFIikxTFthYYWWMAM8qsC4LFV1TLZWGJbAoabFWaSyu4zuvM3dswI0R5whCMs4ckVFQVWKkUREwN+/30efzftcLiNCGYBr5xKziW0hSj8swLjkgHidyASL4BKUO9F8woGGoNoQTuAXoyQpGAuvD1QJEQMMOo6eq3b2+mJNtNR3YzrlX+qLBpr9en+rc11XHoVvLuVI6n0Tu5WXfiod9KWl9iVFiWebMJMzInSophRBFS5YvMvQc5EigGlZ9sSHdvtYtCObJcgkvTMiqVUu8uNpHlSy3grQ7YroEISuJlq3nj23W8wjVLD2kxOmrbriBwHQ3T5bSLFS860jWia7QYhbE6eAjInqYYwdVYohd3iuoAMEwWOrAytC9sr3ZngEcs43NOYGy1iT3yeNK4kkqF4ViIDVGkIZz3PObnAkOJWLFEQWCINCwAq1SupzMG6hlDKnvryhIoFnEO11iSIZVvDiABfIUzRNpawJ+rv7PGa3VSdyOknzp8ZJGZqVPq+1+nW9bwWcOlfb4ih2b7vNwhkZfGh78x17XhxNDbcwxcOILBhjYGMyMTKYwpaDaEFkLrMABkHG9Ws9WPc0YHS2fXGDF0cPjYgRSLyLvK++fnEdRr8U/3CfvzeD9Li6VDXSNXkgmdQZYtGHa7z8dXXO8jU5MpnnNKrsWneZWsnnYvYmDhaFyjOtt1CkYUKLbWBK3iXYVW1XDA03vayRfZcnUq4lZtgMSL0FnU5K4hpVdh7vN9+tneYdyO70vWPs8ur0dNjnTL1YlY3579m5WZntYYjt0I7qebZdoVPHBAWLZ3HTVaE3fT0sEq7x8WCo8aTOLTuVnu7RQhCXjLmt3PCNqTJBIuUQqc8TLabaBF5d0i/CLXLzwirMQFWjQGEHC40qpoKJYlsiD6QvGhqC17N22dEwcTLch7W6hrCAR9906dH3ggCHxXVUqpPOCOoiLmySBpCSpCKkk0WmoL6G89+A+vRrV0Y5hKIURCfq3QrDFdCoKJcuNtcdFRJUe8hGmalMJwah6jiEDcwTavDCo8AB2SVAVRPaNhIwj6r+dmMNsA1otQBIIwkYpIkSIEiZhAiqaxarFGQ1gRgJYyKULVBMkRDs3EqONy4CDaDAwYqCXjKFAHsdSFd4jNrA1ote0AHYvkxE2DzIdZ3phCFiEos6Szk6GcttbYv2j8J7hRflSs8jRIfiGhPeaINKw7uyIkhjjwDWyMGAe0aKIJAktKMw0A4n0hPy3Nefuomp2kASwplBCE3VREpnwjz2oROyRUXx6LwYRiRulng+5Dg6AT0hwgdIePyRgIoCIEEX3kTb4cnpfQAnO05UW6RkFDCIjIALIoCgKLIKEUBYsBYMQUqFSlxDCIJGIgJBSGS0YsFgpGMgltC0lGoNlZzSY4RiJEjKS1YVoLIw/ZpYMxpURvlC1iOUrGIITeFwZwyZhWCRWRURIBsZCYzKpYEpEUgqMEFQZWFCy0ZWQsCKA1KJaDKsLBiDBkLK1IKAoA1rIQLCsooyIjLdJ+1gT43UwWKjA4JfgTweurMyWkoCDBjIREQgAUijIqt7zXAohziKGSEZBgB4RBqxQTZTaFTCMTNCgwIIRGUYSTrhIYIhqxdqmsU2qLUVMOzTrCzDZWqJbsTrQC2JfNQNhdb5bS2VoaG9y4gugzaCYuZsSFvlBZwEoBp7QAA1vt6vuMMRUYaKWlGJ/PT9pybj5ceWB9gMTF/F8aTNFL9rTuhpiwUIxx7LkmjsJozCgIrLIa9WUQnzp8w6lLJpGRGPzMAKwkffahWW2SoLRIq2wqhWRQrKhVSo2huDiLMRQW2SyjBGqkWApGMYIsYxYIqARxzIFyhRMqWThAUrAVgzErKgFNFOUwfmYpjBySdaZAw3QzLBGtiW0LYXi06kyC2Nze2wvUe3Gy2Z0hi0PalEYQhh819R92geeEpPl4rO9oYRDYkgbQy2ttIQIJGMIagHU2+ZjtXDag2A3SbInzy1QEOIprPePyTTTMWEzwuMaGRkxlImb3O8HBxO6Af6eFwvhcFpu/+GptmMb2y9GXSkLbFGsU5cE8u2TerUduD/16unQGNZU9YdSgTpLSJJEVfioD2CeBnY5wyIicpKfw/X01JOIiLGerp45NP1pUBEMDW6FKJVi7D8U3qbfjVbccTKxSRIa8vj/hTzV90IdkfCk9EAHBEofgw2yGIEm2HVCpuEgpBQUBkh99sEHjm75wRy21hiEgtDLJqBoaGZCWTtsnc9Hy9Mz4eJ9z+xmjT8AMhvr4IsT9io18qWRKJRHGtZSYFgMoKFtsFQtoLCFYop32dXxOnb2mjgdd0NnPPeYgIg8OXOWnUbBB7ETSKSK8F2INjCWFgshIDRxEyABZKB42VbEyRmI8IFgG0FQKNfIc0hrcEjtw1AZga5oQ3qcCJNahp0LhFEjoRNYR57iiwajEiPKCWIQgIRjCCSIEEYxVJA5aItsC6C2EACCJ+/9r6YBPg2AxIxFPMZJD+BxUiRWHnTMDeayaQMS0sdWSBUUxhUhiQoabEctJUjIDBSxgMZAqSpAVQVYqhFkCKSBiBWBGMCMjwIqhqHcZMDFdSlWqEQViDUHCwKzQoBuKtggn1wAYkELFhT+afnv7sUKW6BmkCEICyEjIsJFAFgSKoKBEhIX3ngIFkfUwA+ZUhn0pfJNJkZCy2RSLJxQxOWI7JIBAiBA0BiA6NwAsKagSSSKwjLAtL1wuqsPSDBPtoJooZQirUSkQd4uxk5L6mBh1BDVE61Twit3A/aBHPM8kb9NkYMQoKAofhUf6xCC+dATPTPVaxDeBgpVGTZ4kRZAC0AOCYBqOBghrTyFMHnerKoM9nMAU9WvSMCz5iDmiQE/fJCLEiq2Ew/DATmF0A9P6ChQ31H6P78pZ1OHtKdsLSLglnj8nLtA6xr0yHQST6g3Ot+l6VtAwg9aQJH0PVPP7VWtMVz0ZYnkeGZxcTHjHDFDWFMaDY7FaWU1dMbWDqYY5TkouWomNlsn9x/BnBuv8HSUzkopZl6ajLp0Nf7d0ZtFKFzZrOKBRDm0TW9ZP8tNqCK6f48lFMMGHFU4y4NU7cMUTE2OoI4nRGMTHkp5epoNUaSSoerlGjHEOyWNu3hcpfzXAy6mWblQCAMQv77m7BoLQUOWAQxbpmSzbxU6ewE8ShAF95+cfIQNj8iLjzQADx3DYTvDyFD1kQJEFCEYTipAYAjGCpHBiK2NYqxiQFgsIiSAf6gNgkjCH40VixYNgWERUoACxEAgSYgLYRhbZAQkB1MmPgxJ8aRQTdUNQ1LIAQkIIH2oC6hCG4Ds+Xh2Q9AkJP55owELFBzGoEjEMxEbEX4umfUivi+1FDMAyUbkAKgAoEC2wj4wFC0kWRb/r/Ne3y1Id9K0RQqCyCFKoWgrzdC2NXiFkM+HnRUJBkYwSEAkQJBjFIwfATdDj1RDqp+1qT1M/CD1Z6zv7+De4Gj/azj9TQ2Ff4WcYFozum5E8MfJkmENdQKG5MEhPdA6dLPWrQKiEi2d+BlNNGm5DhYwtISeGFnG/iq9kRJABO3VIUjnhq3K1HS/yvt7omue6jnKsvzW61SPzGMPs4cq9TCZmplR/sji1yAn+9h1ASRBSLX+5Et0F9Xi65mzAU4yoYH7DoosQ8Ms6Y4nDbXKbAc5GtGuDd3oJYoayYa66trp39ROoD4gsdBHbtREPiga7HX0leBh7viaDuQED48U/E2KHeF6Wlb+5SiITMmOHNtkSJqu2c4DOygMDpR7+H4bhgasVUXfAVA5qc3tnFf167wJiXEOk8e9GMYyJEFfkIKpkwQ1CsRB8D7UDeg7SKwikkijIB2zgR7KAqRIchJYxxgvplQyl4NA9wQ9jCqe6A9iJqIRd4JBICl7HwRO5+yKjIpqElISntNbUVP3k8snDyJ4MsHvEM4sUPsThKk4JriW1lNmLYT5FQtNw69PUBDfINgmM41LkQ03xehdnJEHVTcIeniSLECKREgbqxbDvUsGsipi+uBIXL7cQMYSQiAbDFOhEA8YIvOLUdrwzrNDcQ72iosCPB1GvaQIGTAog1Qldw0AN2SCOqaO+WBIJYW83NjF5KxAqqHuAP6kA25omkZEGBCCVAp6woR80FDavOB8Oot7evAPqjaJgCAzQh7Z8/ayD+Qwh4tWtw9+XBoirTMsl93uDJbN2VaG47psxlZAWRf7X10ykiO+hVxAAL0EPociQhJFJBQ4cN3ZwJnc9QyXZIAFDUNqoMWCMWCgiCkgoCkQggBoOCGjg+qJ+Vw7llfUw9RiqioJSiFgxI3+0n9x/PGHDFj8LJXkBN4Hl5eVnrInF9N0rNFD0tTWZkZbrFgxh7eRPdfpwKD7Ym44Oi1QCy6WS7GxWJnUuhW6vTu6/PvBFABTGFQGILIoQRgCmmWk5bzE1MrRtkrRpd2NzJ+MDLqGd2IZMBRKuCKNc02KUwBCCnwA8UVdxuC35i3Kqq4u8II2XADWG4zPCQJMwS/eC2CIqNZiVg96UtsAXhBUKIiwikgOBBwiWiHmHsS7EHzpTKzLC5EbRgsgP5KcM06olIUanDJjMYLMazIhioZDCpYYkxkglTwZkEFHVJYaqkG3GgxktIqygjB5ELiWSjNWxaE0SSDpCoICG2eAKjIY2SOoVEhQllYJwMA4NSGgUgosiMMKEiQLjQu11JtOMTc2GSRFi4BpAzISKWI0gEtCQLRFTf1ePy0aB0TJdtDaHTCpzqgkZJA1AorrISIKcNpSMjAqSiHoworNKyUQUKqUGQURgCQiKwB1GKIHxLx2PtKHVFH2bnHkiKB08MzSJmhmbwLlwcF0fZH1kTqSkgnYQadhHL7GhxIDkJoLCPFUOaHi9oAmg6EIe/babRxwxVLQNj07L4ZXLJllaJ7rzHaWAuotU4Tx6DFTyIJTphiQo78DwLlM3q60qzJPDhXrhwtgSvmkeKPgYI/sf14UQVaoQe/rllhi4RiSKl8ZWJctaFOfKyTjiECgtp67nMQ2h4IpqBir4IZiHITo0bGXyMGGQcSVLayAKIcH1hNGQPjIzEM3vCBnoGpYEgFGqAdEG4QTZw3r6ecVIZzwj0B57FJjqyscKkpvmYENM0dMOVujuNmJCHqicC5VljF7h/SIEgr5AckQ3ja7N6A2EJCKyIDGMmEAyBGEZIAncye1IsGLIoiKijAIwSIxgRUsqOiqsFXoMhMC+gZA67J+OsFiqHZCfWn0iBoZEgrKJrhF9GsGRGSfr6Zv5qfu7/kS4ehOemQ+5GxCWPkDrU8Z2xOskSQj4ajFEQx78HWHuEI0rU5Vfe9+TUuNIMhN+qKuDtXk6RSBIqffTwBcSI4C+EgwADjBZLasCsiLCMiIRQWQFAVGBFBVCBFCQUikhFgERgqgMSAEiIhJIqEjIRGCrm0u7MOwMfUXr46yec+PEM+PkKIgAnmwWWAdWqqCJBU7QgU9nJ8Q/DwO3i+P5r03U9PBUVEfVa20RYgoIyCgApIxgKRWanIOAQJqHhbk0nq3KhM2UErZWYJp1wG0dEFDdAFYJZPodPJkwwwh0xHEKXR/wsFFkcnKGzhRSAlJIMUr8MXTMozOk6hBZy7cISyAFnf2FNSGCFhEeqFwHnBBCAdAPycFHCERBchUMGtRhud0CMb56zjELAjCPYxnkECJxBXbdUj9+NTx1LtIfhY7iB1IRVBVgUOR4wjzkNRDhOEmUCgJhApRebMFCTLyBKkJGMBYogxUWCrIgoIqi8t3HNWK7lMq0FlVZdW3QSzKtNXkGsFTVRVVkYrpo5uhzwZmwFhcM4YLqVEtmZrRNCEUON3Nb1EtXCbdsiTepuhXSmt0mskXLSYsBjCNtmzYYNS10W6CIIiMhlKseGsYoMylgDOBOMlEWCiMGjKyRjC5gQxAXSKIilpvTC9IdEjFIlK07t4YqjG2xApBW71mSk2REJWOxH9MXHhwYIWxXQUwjlpyyw4qfnD71G1R1ktDbJbbWmVSRRNtqIKEoSEWidtzJggxGSv57KOimmRmU4svF1VSQeLoZQjHJRV3dQQLLTusTq8HdDYZN6bdWlEhuyspFoXYyGzNiYmRN5ZlecDhONlKNpVGFUWxtgoDIWxbLQQttLxZiCkGthEVXLCjDwzDIiMFD0SHTCzQSiSCUxS2rIa5ETOAjAc2wwoMbGdUCiwYYJJQEK2LBGCOrRRkxuJQxAJaffhiBjDTlhGAwlKRiwiRIiJqYcI0gKNIhQRdBDGAHYwNkMnl8VGr+XD1YERFflmYJWUL8ImE+NbmtOFefefODTARNMLCKxJWKR+aZwMh7SMrRIKEYi1ALBkDa5eGcJUtoqq1NY47oikJTTKSKGiXcr+VYMxWlg4EvJCxUNXWnRcGGYDbKYjWWzEx1aVFqLJp0OsLRmJpFg3MbVlLZWYhWxLgWBiCwil1JpxZourmFsIatQWDBGlsuWCVG603VqiIiCohJjXLpIaNGjHMjhNaw0TUKoxoJl0a1q6cy2MXKU04Y1yMYXBVKiBDsjqe0/NosSFP1KeCrQmJFTmuZMiIqjMTpjDUp4pQ+vjmaAWCMEBEZEBkWGgUitv/P840OiqdT3djzEmZYFHxaQhEbZCYZh7EsNlBehqB43UMbq4pjAhEIEkQxDJFUyyRQJnGAcQKlwwUiKTIyAsGCLEloFSVC1FELaQiMBiZaWACQwgMQyMAcJgXKmUMQCMClkcDCoSo0cxYowEBkWQQijAVVgLIMUBGKsSLAVVBYohJGMYLCKCIhPsnUto22Vso0O09Q9uYSHJzAjIh9zffET7vuovNETa0PIQ1AABYNSPnBB3xUvBCQZAEhBKIKSSIiEqEkoMSAFW10FCHlmk8nDxQtwKIzqdWL2avxRy59H3aDgCdwYrFE4AlBbAZAQCEEnJAfKK9BANwl5EhtQ1smKZn3S46sNDahKQOMBJFU4EUKgyAYJB0x/A7NyBE3B4sO64UKmMWpnlQyuTJaRuDIqRMxkQpmjiCgSJhIC+F1xBXpGGf4nk5iwWCqKoLCQUKgVkow0CQDFVoLFEEVRgpGlisYoAsFiMCxgKScEAiWSGQAvYL3vSNg8lIWEvQIH8Ylkd59yPokHZoYQGHQpJL1MYgigKskHv9H5vVaJ7Q9whl+5zWop9+jWENaapFVTv+bIY8ULwvLTDlriCCVigILtjT5Mdas0qv8tD3hRhKZR+CuFtPz3uyrAMYv5725hqLtJAih0KAf1IA7x7ye2qWda8FsVAqPxT6/V6/x/Jh8fuw0S58kJOYSyFqdeWUbJ+h/TtpuMFd9CU7qKwNNNjebArE5HKKSCEAfrIB2Ij5UDZCNJAGD+EKNvrPw/BfvRZpED64LICPs8oEkgGO8QH4IHtzVW2waIj6qMeIIGf3/ehzin50zAHMivuhIgMESAqSSLYB+qC8oSLIiLY1zgcTx58TFzB+EDQNTElCdyGOxRrgic6oofrDABZAkUYDFFXtdIGBADaeFKyDsgsgQl4BR15ZgioLEQMZpFh7gZJJRgeDJJwgKBOBIKEpqFmgEMEAKyZwVFNhgGhBOpTTAGQUYpIGmAMhHivIih+yI4gEicY0sbQqcsNRxeCwD99mDHSSrANGScEA5EhBkRYQQTjuHOOmpFX1FUpkE1eYCB6UWgKcIg+YD5ffQ5T9eI2WlENjMeoNLCFKCrx0iihTITrzX39b+KemvsiEgyCXheOgbg1VZ4suidxQREFGCCj+H+lkxJxIUoxgz70W/xX+NMkFRkiz+z+zmL7GdGRyqxgIkWQFQ/CyjA8GSz40qCGJeaUg/6/68hjFk3oWSUBPNEJBHpB+pit53zqah0Q2VdzzeFfigZdU9kQkAkOKJIHlCiYKTlELBAqfPaEWAv4oKyKyINCq3QyNw4wkF2qIBwQhFILYETWiUM3dXwTuhPElBVrcuTI5IyvnsXyL2ajRRdUqIq8JNwwAomklQFWKtQWUKNtltosKytW8ZJvfAtbeTM0G2S6pwi/X7Ye9tgidwD01ioVqeqyfWASzEAuWLCEqASlRBGxRCMr4099xDBioEOQ9on0qxEhr7gGwOvKEGKgck95PA+J4oiPxAYDngelBR9odkXG/zZSdceyeq+ODXVnjiuC9DBkcMZKqoGq2ov5wzK5LKYLHj56YwWKKgwFGLBgLFWJBEBUBjEQYxh8rBGfTtC6SfgGQqx/YYU5Dy/M5X6ryOCdKogo9THpMn0SSQjv6oc18MCFdfW5HfevAvOoxXu541j1W85cNDA6MQA6dcE/RrmMHZE/gim6Y8IbixMvv89OAAbbCanE8y+EQ9BKfFfnnp8TU+OhUzooG9BD5AkJMEkwYFZI1oCJVrEKQkbJC2iTy+f9H7ntQD4O03eZwLlhhiMFcUVOVoBAqgca9u18Y9k3fdknDmT9DI6dA+30njSGB+7j1+9OWBqqR9v2kpfgiwtUxdd/A3JjYooWjRGoopMZSkSsJQRFLTGoRZniEi3iVRf2U4DLQ0yTt36efsy3aGvyVPnR8YHURSEHaP6YkiHr6Zt4KDXMiCEAHl2ELdnDjxjkrM4buoos8F2mO8oqoSdmJ1HdROwaeRah3TBhab4u1uG4MwsVvMOUPYWynZcyLByDiCCHB6MXAJ1MuswA7IprckAoekEbqPxGOEuiwDaSTFCaS1dlxUTtFV+nToAx/dcN+kLDP9EzZvZCoqS4hiUUnY6OHGMJCQj7OR1KIc4n55CEhATW57100ezXxlsMe1sNjIP6P5cfzYfeiZR+/Myf2YP7E6PAm0n7zUwTzpU+vRMTgKawINoel/Km2ROLJVBETjfJedT0E4VgqLs5/G2EMre3xHF4QYapfRDnF/LEsq4EopVuMk6iU8aSXY927cuHZlPeNTmhyDJlzG5SXIfdloyE1Fyz/A7B5kDyIQjQxVfbEdfkUjxYjAaogU4C4oebp7lZE2m0tQDY+UQWKoptrBEiMBEVImADoQIoX1TWdcJD1+/p2GQOTtKAA8zw1GBs0HmJtUksCPcUFABSIYJRWAYTKDAZAsYhkCsRFhBxqKoiMkRJPBKqjFAMLY1lBiKjHTMHGMloUEVCIxGFLSQUbSUUYMZFIWligrFYKFYHpmYssiCy2WJlCpEiiqCJ47YWSsm2LDUTHLQqCQYsiRBGIgoqh5QzBsKEcoULCtFDUyUwbCUbrCuBahWNmoBiQWsyFRiKg5VMcTGBWEz9i00UDURQURybtjHEGwskLSsKwKMsRVCgxSaZCGkAFIRGKpA2gH35KC7gKiKiazFAwtCuTCk4VjOPyuFsG8CQYIQSBBC4BRQrDf44uUxifPD7IB4Hn0UaMMEpPLJzU4qCNPgnlC/CHsB7iEJIgSJCEgC/Q8zQBuzSRj2RZAgkiSJICJIiEkIALNO31Gxsd/Cic0CtFzDmI6kFGyIamImuSIwIEFOORKE/w6CSoRSAs6DeWKZksZUiJWy1ZKkzClrYGMDBMcYphCiSHxxoUZmpcjKJir8+taMZMIsAskIhFoDzTMOMhuEInikUagWgP23pFvzToMTqbcnQuRh0+ysuAANaEkbmtTSFtsgR8/riKmADvLEMd9DB0opj2bhhEZCbLMHQo62b7BRulb8D8lv4MaMf5pZI4kJCGZR7b0nR7ber0rGMi6iJByNudPHwpT3zp1ocCh4q9EXXI7HJyjx46U0bNwAMAA7+tWeUAaOhnY6BwFF+78uZqB6k50ETbin4/QULJk54nmGjz0JTF6ms/I6SBrE0iKbiipUaXW4utiAp7vbxwPNobSIcbH+LJxNhaVLYNWWRSKtZpxKhHINMyojjN5qLlUYZqySmtGaVzArbSuUJYxVJEUTKSiIMbhVkUkxFiqNcytDJkMRMSFZatLSgMCoKQoUxgwSYgWlqcV2A4+5eikyjJ16gEFJUDnFLAEQQcWAitJAED7rGElGQJDUgqzVjalKVVJ9mLSB6aI0vmIf0AEzZ9UFJEMgBdNBwppDtuirsJhEKLgKpYA9BClrFfEAsBbYoH6EEZBF9h5qOYmyAnLmA9YDR1ehDwC1w7Q7rockLja/TgYJPwTJktSySiUBUqBIsyyL38uATpRAOaYeZocADfOoe2disAP41IkYoEUIRGREZIYqaZFki1BClYMEGVAKgrGQPmYBbYFYLlkbKjEYAxQiMgFiMILQIopWxtJRgVwLYgqSGgBsPx9ORsuQuu4wICQekpIUSEkQqVVYKysAokIRAfKMiAURsRKiBT8qKeYEVdOgdJokT46sFCV+5DA3RkWC6tgrUZ91wfudmSsVlKfDPmHk3RUYT39wJ5TuyXyChaXBhWCXAxmFq43EaWYNIzCxFGMLCIiIDExK2ICUljKlSxWwwyskkxEmCECsFgrV/l9lME9X1m5+HmumnjkxPhvuXGsd3hasrUNfyW/WruDfi2o+ifgjfnfV6NSKbhmxmYlMl5dBkSO1zntOTp+b76Z3/F69c66N2S2WrDKE1koWsyjMC4xpmqq0affnufHsbiSEvH6RkLbSr8Pf+Duww7qhmWvh5mHI1aYnch6Go4IQjGMS+jerybN6PitzFvZdtIFbNOFzKUMSUjjcSlq3CwiHciE7+Lufr6L0G1qLTglCWXEUhF9qYtUdWcJ6iRALZrRcW5i5PufVqffgdj7aeHd47PLxfGnJcSipIQjX7sia6nr27GJUZdcTJPZncaKuohiJl3wXPmERHmnEebygQCbSHYkhlGxQkZcbmTJJGTJOFZhMrUQDJcFNrXrJUY+41NbLDtGhTU9ddqw5toWccl10jWcfqbL7hRBVo6Uq3+2MQr7685hEwQPeXCXzC6dc2ggO1MOCyxNKIDEkmrsm0BXNz1PFlkKCKw97uIc6fIbkrc6YLS71DJJlyrA0Vvtu+/SLgTyJxvuxxZsjOzMQQVBChSksTBRhkoqPtvysCcUNpZWUXBjoPmi1uFAYYs4lDkO5gZFnjk2bZw1ckfPhO7y6FYhyVDRdCJdmFv7zLk1VxZTuDdQ1ZdYiy7JeRCURL98PC3RvU4hlQNsJRdpDMNZ9Md0TDcGPCjmcecFDg8Q1SEDtnGNDdnQ4TiY0TeTLCsGKdKUyUGCFVXp7vSFg95EQQkWqaf31YZ46NI06NrH+dEmSJYJ7iGy3bbYhUhv2mJPJghIGLi/qUuIMe+Id62+tjNG6hIIwuQ3WMeSKlHTyNKUkqNJmvDnOOs7cXTs0i6toQ3IpEkWoIf19Gi0C08UYYgyhbS3nk5YccVqQqcABZmVXEpwDdM1FFRcMoHDuEzSmClSpyrISsj0KIOGhpkJ6nRfU6tNU4cSAMqkv0HYWqvAdQolFGJiME6PFHRAJVpnBy7qIQgUduj7KdGjLCuqYSnygOhEodW8KrSToGtU64YGFXQbKLDXTw1UklSJagsy5bRsNzHfiumvPdk63BTNXWkqizsXRzT7ZwFTBbN0NVhCq4UA7hQqAA8yr2vCoXU4d9Z3dHCuwrfVC7KhAoeq2SgwwOlutIFSMroXewnDXfKrzR0V2AdOjoYdtVewWxaqx0TiKs71h9zrinG/TLUNsOy07QPRCU215d+7vE09MFKJiGI8lwMtkmcD4+v3c5tfNwOksfpUOLw6NXSbyNnbRKQEt9zirvXXUnwgTcTnEQWCw8zAulEGFCgk8o8wIbmqVMEAOXKDfMoSL8j3QsgQLSsicgpACGR6EikgMhONbBOhDrT3uqLEqLpGEurszxICeSQcmlSEqFsNLFUm97nGpIG0gcCSdDnjdsAnEUgK4YG/l8yl5eTiwOfCdoVkkm9l7CYkiwgWpw1x9EmZUlNKO/oPABEnmb4SYkgM/1fxWFD/hHDChTl8xCkfh/COGvCqwtagsFyizjChTnFmQ0RT9CQ/hcjATUf6KFjjUzKuTnpkzEurpsMatqVvaa1pEXqUwQ2JoQtlWNWbMxDVjDguyb3iCaGuSlmmjbFjbmUwba1pGEwuVeN53LxeV4EDqDqIAnW3vPkoa1pk5ZHiwN+92ohPBInUw180h9cJ1qeH2jWXAhGRsXNhmDrOG83oMt8ZGEZtQ+/gCw5kkhl4frDkoL91AG2yoLd1Em6hRoHxKd8WHgIjxlhUWxiw1bssmoYjv4oUDnr17r64VMJsfnlEMqMUhISHGGpQ9408omhxzrz3InnUO0yMNllOQHTgE19AYb34IVnHeQCfWAeOwDR2F72nXvk94eO/JHHiptCTaAb+Em/pU+Tll1QjR17QwI0SEJOvSitfLC8YQzXPtHVK2XNRkPpAZAc8Lm+VcfahEtD9cNZAht6sMCQCRdshp19Wj5x2iwWRSeRzRFyxS1pWW0CoIlZZRJKP00/w61MioiFPaZyqbFV/C6bL8PBKhIS2xXTI2YJA5xu3KDzdjIa2nvJh6gN7juh5/DkNSbIKD8dGyxsgWmZF1IvO/aAzpLsJEIMEiEgorEiB8AKMCwlLbYh8/e2ty7sLXj4TrK0x9blElMu7qDt00VvGUCCRRUhBEVIsFOjKgZbVFbaNv3snr3IsbMdbLJJ3Ywggcfh5BdEfFwy/BgaHsJUHLuGgvu/5OTNL7QhvAfPTkZBjkVE1EoHDXlfbMB8J8tnSe2jG2v2NPabQ0LRkNt7mdsJLNquQ2x5/RR1uiW/R+rpHfjB4jSZeISSDIMiSDA0qd0MREh7ETAKOCbwuFq+Li2XCpS1KjY50BtuvHG5tEuidniGwzF2hjEgDCRIZBrCBDpo1RNQmIAU2m3evgAJqfd5BFPFMtcd8DVDl3Yd5L1u4mvX98VPjnbB4gDke+SHGHXyyJKqjVu/nUzQvvNv8HlGIfOT+Cy3EpguLMT48Na1f7QrtG95gwN/dNxq3ph2i1EDFS7x62b1ZN6m8VXE2j92l45ubHB6lUXAXiGlzoinDkichIjuyRZTN5bZDckONyzJes7XnP7kZuFPoaXD0Tqw668t+qpV53ub7p9au/Fb0nVVdWwBik5zmtBviDMmEhAUS12RZZ87OAwQ6oIjFBV7tIKI5DYLXvYUbFAdI93AggYvId1bAZEfBvKwFmshSJEm6XTSoBN1RXwQaNpul2ewSrDDG0NIRb2tFxKTndCfO1uijuqPOG7sREPnicuF5663WtmtpV/pOKXpUaBBGB6VHWpC925Xsga2gLp+JXBttB0vWZVV/f1tU5x+5wZVHaWMCx9Hjyb8Ewc8JLFRIK4t1d7LvaxZxaV7NOKbNTQlhFxE1oyVpDg5Z36BUowsnV2t4wWyAddGXOZgnRoDdwvyDhy4CuiaQ6rTY2bTFhzkTgiFqlOcV2+hpV7D0KiUhbO5e06Z3IhVWuxpIeVR1iYryhKu0Zb0PkCYaHEIMA2wDSGBiPSwoO63nomijp1I3DDwQxA5N9Zq6TpRSdJxYVquknVBbu6WqWFWg6t1pYgsRqhK1eXYiizW70+5jQO3IQt7xmsuN53l66DaOlL5AKFxUs0+9YWLj4Wld8W9Xq7a3HKm8jfu9ze41Lkms8W1rKrCmlfN3F0BnbiRxnWS2unrRQy72whKfVltZ1hfNGl1DN81qwwuIPGZWpLq9TR1rLSVBmRm1ZtFxDrnWjp03moLJwkxlEIHRjpjQvFhkwoHRrreVvKEztCECFQqlToydOut+pu9xxhm+3lyeYPG+gmhw3h4XjqgyqKy0G25phixzpkjvRwwM3bF5ybiu2XkcHQXIuNjI0EM1I1imUWRk0AxgUNOjmJMSBWFYFSIyFaorCslZAJACIGQYsM6SGMGCRADQhoqBSUo2E0C5ojYsQbrRgIhoXjEH9qCdjmGAIQllQPP3d08clLlXHwh4Qrcmtlh9MD4F+oIbhd2iMVYxMssFYToXpSgY/Ukv/BT8rFJ/N/1Ldpq0Hp2zD+8eBMD8O8NkyCsREUYMEYgooyxXJ+JVLO2DYQF0i7zGYocExsGpoPQ5LP06qkFcsEeKU9WYYiOla8XoAGNFKAHgEUfUxZHwWpFSJBTGkbSPNil/DnVERnMS1KWCxFqSBLDBohZcC2gzEKlyGGYlAWUsCllBAGZMlkEA0T5H4tu9YYb1uKJH5pLcP0yLWQJSRhc3vTG9F6FdLSLWUtCZSFRoQMQXFI2RGqt6ttSSI5mp2LxqbmODGRkJgUOTqWENCQuIJuTYYj8Ck6r9E6vn9XUZB1vFH4nYz2Q9jY6CAxBMukHSKWHiWz0FhGFWxZEOtNjQyp8rApSCGogDQ+X4Qo20VihFCpBGT8PZ5n58oe5S/V9JxvWz6hNHrMqxwh1409Zzo6dw7k2mMcJ5GOPnAhHIKKgWUpIRYxIokSAzzSoJZ64o4GQUiojJBZAESKGmVJBZAgBCEVkUCLAQZIym47qEBVN9R1h0mVixU05EKnfTuO2GZ0d4b21FGItmobblOsgng+IhPNhO3dmmYyVB3KeYdVKE503vd3TiEidpkUoJ8mRGPrhLjFngMJ2d92E9bXm0w8ZzMHytYS01+GnhvOBTYyRdnOcD3nYKHM8Oj5THXpmsu9jwcQmtBphYKMiyCKPMI4KqpFCWMrJkyBmBiS2hJFMGSYhFAMaIQKkFjlojaCBgIMCURxYwkZmZBloUTLsciOmCUpWwRC2ojABmqElYVnsOZyGbUsRA2JT3+ocPOIkkWRYCwnTDaI23eo9pSUvq9MEX44GSPVUJAGJEjIERaFP8D4x+dm47APjdk3Z604DZ3YZhBEYCgMYyMFYsY/2/2f9zzNm2d3zNVVkNCKoX2nvctnzH5vn88gQ0DBRN+Rv1FB1zv7iPcqholQRhFb5/Ao6uw9lrSWTEOFxLPkRKPnwE27SSJSJkxcQILZMSA71XYg9K4l2Cu8onnq89X8bX1swDe7w++5okZq83nOa5e7H93GY8QlDjSEmtWt8g9oZSxMarcveTOrjm2DLe8usRmBZKxF85vOLhq+cLqXIWY2GIf35NM7jW9473y0x6wVG0AlW0kKqiSYw5gyJsQUtKDHEadrUenGHHbZkGBLyQ4ghTRLLLqXuAs4pJOFFxZKN5i6KgMFRo6nd7IyjnBUzSK2gDBFWY9TU0s1qUYp0F4cMzdm7AgiuCNtVSqqzcnIsaONyGgNWDFufMFBwhsFuCWggqYXmVxu7DrAIQ8Y0IMIKdqOkEnlE2iYO9UdQJ8hwpiWVV1i4hUKgiMRZAWdzCUBlQRgVEGQkYMYFYrUD6QsxCi/yATxVQ3EiCG46HIU8iHj4wkh4laHybiYK24wOBbky5hg3KYJ9LmmaHBtFGJVFDTkzeFHaxWqIsUFHAKWOTeGRjkRgqaLoofa/vZd/UnROmwofh4hAA3iAbgek6IrAkkgyAr0nPokYSAsAj6wqhiJ5FV4gJsLECmfQJmBrgYgg8eYfbUNoFgsYoleh4BuCwZAuUkqbjEIUGz5/Ay19ZeF5r5ETyV+3VKjzQdNDqgdKYCGoGnBQ3waevXAkCA8NjcAAIgo6dOkza4hBeh8zd+YcXvJy3maoA+xV2lRwrZC0kInDtw427J6r7i9JUjHQPSvH6eYf8gHwTc8My1kqEiwjCqKCMStEKxZRVZEFBVQFYEIMiEWIoFkq1JohQWtSbjf3odovjEAOgnSYa/1YihrUWEyHvGJ1yiKRIsiERFBAYPvAIe2+6IZJBt2w8/VW1GH4cKJFhCSaqLn5XfYyZ6/d7bJuIPZFYpxaM97PH6nrgcgMBjBh/tlkhmlu0/hes6lh9bPGfnBT4JYKqU+8tWRJEREglQsk0UhYe5P7BuxZgVgaSplthVWCw9vuTXwOLOUIsnJ1vKkWzYimArpyXMnQVUC0w5HEub+D1XLte0b2oU6KSHKbArhRI21AiBDS09LRp/nSttLJlmaOnk/3rf7/fbp6c+PVbZMkkIV8OXiYgQQkljAEHBRTZRGesbA+gDfyT6H0sev6CKlNRLSQ+BPVP1IAHEiJ7fgdANfXCzS5kxQr5zK7EJOSz8JTQpDZwMkSOQMYKfnP062aHqOM3mYjGUoqtcwpldSmZgRmQpxDyAIFQVgmh8nFIHXyiYYkPdWhruconAOBE/pZz7RdICc6xOg5lFrsROPjSYKdTxjAknB3HSTBC5TkmGiOOg5OXlwbQUha+jivO9jbiLoHbE6dR+uPo18+GwkfCiWSQn9qn8w2IKkRX6BGKhYCKBpFG0CRBaIon+AfUKn2APcF9Xg2KPWUVeUp9l4X9RTSHAn1uzaYYdLeDKWKJRKG3o0f08iidujjP1Ist4humO7urW254T3dpbTVGOohjwiERU2DFq7tV4mTcIJc0a2GTEKkt0Y2ksQ96mkCFbLQTH4ly2x6LNXSuhmU8iIyE0hWWgtlOOauVTVNVB3UAeUNquoNmk4heDROdZjDY1IUb0sqIIiMRRVRSD1YXhn9ScdtGwrIZEIisixEBdppMZjCWxGY4zpTR/XoGxCAqRGQImIa0MDUYKZJoYuQXUMGsNN7jz9stbcmxkzV/rQSEGwbwIphA/XNi5O2RJJhHqQQkdSd8ED+5BKgTx8rLYpv32gTBPxszKf06VQRCCI/kbFOlqv9+2DJtDlh+tCpxe+HDOsSfZvt1zD9fKhpOCRUPBv/6z/fn3MPez6HEBcYYyfWwxiiMkhUKLBRFRBFgqsVVGKx99qxBFJ0tf7yRtiiMAUSEhmkh5NZgXTAB/xdyRThQkMCd0swA==
+#<==
@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+
+# Generates a source tree of configurable size, parses and evaluates it with
+# pake and reports the peak resident set size after each phase.
+
+import os
+import sys
+import shutil
+import argparse
+import resource
+import tempfile
+
+pake_sources = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+
+def _parse_command_line():
+    parser = argparse.ArgumentParser(description='Measure pake memory usage on generated tree.')
+    parser.add_argument('-m', '--modules', type=int, default=100, help='number of modules')
+    parser.add_argument('-s', '--sources', type=int, default=300, help='sources per module')
+    parser.add_argument('-k', '--keep', action="store_true", help='keep generated tree')
+    return parser.parse_args()
+
+
+def peak_rss():
+    # kilobytes on linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def report(phase):
+    print("{:<12} {:>10} kB".format(phase, peak_rss()))
+    sys.stdout.flush()
+
+
+def generate_tree(root, modules, sources):
+    for m in range(modules):
+        module_dir = os.path.join(root, "module{}".format(m))
+        os.makedirs(module_dir)
+
+        with open(os.path.join(module_dir, "module{}.pake".format(m)), "w") as f:
+            for s in range(sources):
+                f.write("append $sources src/unit{}.cpp\n".format(s))
+
+            f.write("append $include_dirs include \"${__path}/include\" $common.include_dirs\n")
+            f.write("target static_library lib{m} sources($sources) include_dirs($include_dirs) "
+                    "compiler_flags(\"-DMODULE=${{__path}}\" $common.flags)\n".format(m=m))
+
+    with open(os.path.join(root, "common.pake"), "w") as f:
+        f.write("set $include_dirs common/include third_party/include\n")
+        f.write("set $flags -O2 -g -Wall \"-I${__path}/generated\"\n")
+
+
+def evaluate(targets):
+    evaluated = []
+
+    for target in targets.targets.values():
+        evaluated.append(target.common_parameters.depends_on.eval())
+        evaluated.append(target.common_parameters.run_before.eval())
+        evaluated.append(target.cxx_parameters.sources.eval())
+        evaluated.append(target.cxx_parameters.include_dirs.eval())
+        evaluated.append(target.cxx_parameters.compiler_flags.eval())
+
+    return evaluated
+
+
+def main():
+    args = _parse_command_line()
+
+    root = tempfile.mkdtemp(prefix="pake-memory-benchmark-")
+
+    try:
+        generate_tree(root, args.modules, args.sources)
+        print("{} modules, {} sources each, generated in {}"
+              .format(args.modules, args.sources, root))
+
+        # pake reads the tree and command line during import
+        os.chdir(root)
+        sys.argv = [sys.argv[0]]
+        sys.path.insert(0, pake_sources)
+
+        report("startup")
+
+        import pake
+        import targets
+
+        report("import")
+
+        pake.parse_source_tree()
+        report("parse")
+
+        evaluated = evaluate(targets)
+        report("evaluate")
+    finally:
+        if not args.keep:
+            shutil.rmtree(root)
+
+
+if __name__ == '__main__':
+    main()
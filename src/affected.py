@@ -0,0 +1,141 @@
+import os
+
+import ui
+import fsutils
+import shell
+import compiler
+import targets
+import command_line
+
+# --affected-by and --since build only targets whose outputs could change
+# because of given files. Target is affected when one of the files is its
+# source, include found by the last build, resource or prerequisite, and so
+# is every target which depends on or links with an affected one.
+
+_changed = None
+
+
+def enabled():
+    return bool(command_line.args.affected_by or command_line.args.since)
+
+
+def _absolute(root_path, filename):
+    return os.path.normpath(os.path.join(root_path, filename))
+
+
+def changed_files():
+    global _changed
+
+    if _changed is None:
+        if command_line.args.since:
+            try:
+                out = shell.run(["git", "diff", "--name-only", "--relative",
+                                 command_line.args.since], capture_output=True)
+            except Exception as e:
+                ui.fatal("can't get changed files since {}: {!s}"
+                         .format(command_line.args.since, e))
+        else:
+            try:
+                with open(command_line.args.affected_by, "r") as f:
+                    out = f.read()
+            except IOError as e:
+                ui.fatal("can't read changed files: {!s}".format(e))
+
+        _changed = set(_absolute(fsutils.SOURCE_ROOT, line.strip())
+                       for line in out.splitlines() if line.strip())
+
+        ui.debug("changed files: {!s}".format(sorted(_changed)))
+
+    return _changed
+
+
+def _is_under(filename, directory):
+    return filename == directory or filename.startswith(directory + os.sep)
+
+
+def _inputs(target, toolchain):
+    # files target is built from, None when it can't be told without
+    # building it first
+    root_path = target.common_parameters.root_path
+    name = target.common_parameters.name
+    inputs = set()
+
+    for prerequisite in target.common_parameters.prerequisites.eval():
+        inputs.add(_absolute(root_path, prerequisite))
+
+    if not isinstance(target, targets.CompileableTarget):
+        return inputs
+
+    root_dir = os.getcwd()
+    os.chdir(root_path)
+
+    try:
+        # unity sources are compiled instead of the listed ones
+        compiled = target.sources(toolchain)
+        sources = target.cxx_parameters.sources.eval() + compiled
+
+        precompiled_header = target.precompiled_header()
+        if precompiled_header:
+            sources.append(precompiled_header)
+
+        for source in sources:
+            inputs.add(_absolute(root_path, source))
+
+            includes = toolchain.cached_includes(name, source)
+            if includes is None:
+                if source in compiled:
+                    ui.debug("{} of {} was never scanned".format(source, name))
+                    return None
+                continue
+
+            inputs.update(_absolute(root_path, include) for include in includes)
+    finally:
+        os.chdir(root_dir)
+
+    return inputs
+
+
+def _is_directly_affected(target, toolchain, changed):
+    root_path = target.common_parameters.root_path
+
+    for resource in target.common_parameters.resources.eval():
+        resource = _absolute(root_path, resource)
+        if any(_is_under(filename, resource) for filename in changed):
+            return True
+
+    inputs = _inputs(target, toolchain)
+
+    return inputs is None or bool(inputs & changed)
+
+
+def affected_targets(names):
+    changed = changed_files()
+
+    # pake files can change anything
+    if any(filename.endswith(".pake") for filename in changed):
+        ui.bigstep("affected", "pake files changed, everything is")
+        return names
+
+    toolchain = compiler.Gnu()
+    affected = {}
+
+    def is_affected(name):
+        if name not in affected:
+            # cycles are reported by the build, here they are just cut
+            affected[name] = False
+
+            target = targets.targets[name]
+            affected[name] = (_is_directly_affected(target, toolchain, changed)
+                              or any(map(is_affected, targets.dependencies(name))))
+
+        return affected[name]
+
+    for name in names:
+        if name not in targets.targets:
+            ui.fatal("target {} not found".format(name))
+
+    ret = [name for name in names if is_affected(name)]
+
+    ui.bigstep("affected", " ".join(ret) or "nothing")
+
+    return ret
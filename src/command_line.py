@@ -1,3 +1,5 @@
+import os
+import sys
 import argparse
 
 import ui
@@ -6,11 +8,77 @@ def _parse_command_line():
     parser = argparse.ArgumentParser(description='Painless buildsystem.')
     parser.add_argument('target', metavar='target', nargs="*", help='targets to be built')
     parser.add_argument('-a', '--all',  action="store_true", help='build all targets')
-    parser.add_argument('-c', action='store', dest='configuration', default="__default", nargs="?", help='configuration to be used')
+    parser.add_argument('-c', action='store', dest='configuration', default="__default", nargs="?", help='configuration to be used, comma separated list builds few of them')
+    parser.add_argument('--all-configurations', action="store_true", dest='all_configurations', help='build with every configuration')
     parser.add_argument('-j', action='store', dest='jobs', default="1", nargs="?", help='parallel jobs to be used')
     parser.add_argument('-v', '--verbose',  action="store_true", help='show tool invokations')
+    parser.add_argument('--cache-dir', action='store', dest='cache_dir', default=os.environ.get("PAKE_CACHE_DIR"), help='directory of object cache shared between builds, disabled by default')
+    parser.add_argument('--cache-size', action='store', dest='cache_size', default="5120", help='object cache size limit in megabytes')
+    parser.add_argument('--remote-cache', action='store', dest='remote_cache', default=os.environ.get("PAKE_REMOTE_CACHE"), help='url of http cache server for objects and archives, disabled by default')
+    parser.add_argument('--remote-cache-timeout', action='store', dest='remote_cache_timeout', default="2", help='seconds to wait for remote cache before building locally')
+    parser.add_argument('--workers', action='store', dest='workers', default=os.environ.get("PAKE_WORKERS"), help='comma separated host:port/slots of workers to distribute compilation to')
+    parser.add_argument('--generate-ninja', action="store_true", dest='generate_ninja', help='write build.ninja doing what building the targets would do instead of building them')
+    parser.add_argument('--affected-by', action='store', dest='affected_by', help='file with changed files, one per line, build only targets they affect')
+    parser.add_argument('--since', action='store', dest='since', help='git revision, build only targets affected by files changed since then')
+    parser.add_argument('--build-root', action='store', dest='build_root', default=os.environ.get("PAKE_BUILD_ROOT", "__build"), help='directory where everything is built')
+    parser.add_argument('--test', action='store_true', dest='test', help='run test targets which are built, only those whose binary, data or arguments changed since they passed')
+    parser.add_argument('--test-timeout', action='store', dest='test_timeout', default=os.environ.get("PAKE_TEST_TIMEOUT", "300"), help='seconds test can run, unless its timeout() says otherwise')
+    parser.add_argument('--gc', action='store_true', dest='gc', default=bool(os.environ.get("PAKE_GC")), help='remove from the build directory what the current tree would not build, PAKE_GC=1 does it after every build')
+    parser.add_argument('--shard', action='store', dest='shard', help='I/N, compile only I-th of N parts of the objects and pack them into a bundle, links are left for --merge-shards')
+    parser.add_argument('--merge-shards', action='store', dest='merge_shards', help='comma separated bundles made by --shard to import before building')
+    parser.add_argument('--query', action='store_true', dest='query', help='answer questions about the build graph instead of building, see --query --help')
+    parser.add_argument('--worker', action='store_true', dest='worker', help='compile objects for other pake instances instead of building, see --worker --help')
+    parser.add_argument('--worker-timeout', action='store', dest='worker_timeout', default="300", help='seconds to wait for a worker before building locally')
     args = parser.parse_args()
+    args.command = None
+    if not args.configuration:
+        ui.fatal("-c expects configuration, or comma separated list of them")
+    args.configurations = args.configuration.split(",")
+    args.configuration = args.configurations[0]
     ui.debug(str(args))
     return args
 
-args = _parse_command_line()
+def _parse_worker_command_line(argv):
+    parser = argparse.ArgumentParser(prog='pake.py --worker', description='Compile objects for other pake instances.')
+    parser.add_argument('--bind', action='store', dest='bind', default="127.0.0.1", help='address to listen on, 0.0.0.0 for every interface')
+    parser.add_argument('--port', action='store', dest='port', default="3632", help='port to listen on, 0 means any free port')
+    parser.add_argument('--port-file', action='store', dest='port_file', help='write the port to this file once listening')
+    parser.add_argument('--slots', action='store', dest='slots', default=str(_cpu_count()), help='parallel compilations')
+    parser.add_argument('--compiler', action='store', dest='compiler', default="c++", help='compiler to be used')
+    args = parser.parse_args(argv)
+    args.command = "worker"
+    ui.debug(str(args))
+    return args
+
+def _parse_query_command_line(argv):
+    parser = argparse.ArgumentParser(prog='pake.py --query', description='Answer questions about the build graph without building anything.')
+    parser.add_argument('kind', choices=["deps", "rdeps", "includers", "why-rebuild", "where"], help='deps and rdeps of targets, includers of headers, why-rebuild of targets, where variables ($module.name) are set')
+    parser.add_argument('names', nargs="+", help='targets, headers or variables to ask about')
+    parser.add_argument('-c', action='store', dest='configuration', default="__default", help='configuration whose build is inspected')
+    parser.add_argument('--build-root', action='store', dest='build_root', default=os.environ.get("PAKE_BUILD_ROOT", "__build"), help='directory where everything is built')
+    args = parser.parse_args(argv)
+    args.command = "query"
+    args.verbose = False
+    ui.debug(str(args))
+    return args
+
+def _cpu_count():
+    try:
+        import multiprocessing
+        return multiprocessing.cpu_count()
+    except NotImplementedError:
+        return 1
+
+def _parse():
+    # modes are options, so they don't take names targets could have
+    argv = sys.argv[1:]
+
+    if "--worker" in argv:
+        argv.remove("--worker")
+        return _parse_worker_command_line(argv)
+    if "--query" in argv:
+        argv.remove("--query")
+        return _parse_query_command_line(argv)
+    return _parse_command_line()
+
+args = _parse()
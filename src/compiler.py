@@ -1,23 +1,113 @@
 import os
+import time
+import fcntl
 import marshal
+import hashlib
+import threading
 
 import ui
 import fsutils
 import shell
+import object_cache
+import remote_cache
+import distributed
+import pgo
+import sharding
 import configurations
 import command_line
+import jobs
+
+
+# objects are shared between targets, each of them is built only once per
+# pake run even when few targets ask for it at the same time
+_objects_lock = threading.Lock()
+_objects = {}
+
+_RESPONSE_FILE_THRESHOLD = 32 * 1024
+
+# include scans done in this run, by the command line. Configurations built
+# at once by forked processes find them in files of share_scans() directory
+_scanned = {}
+_scans_directory = None
+
+
+def share_scans(directory):
+    global _scans_directory
+
+    _scans_directory = directory
+
+
+def _scan_once(key, scan):
+    # the first process scans, the others wait for the lock and read it
+    filename = os.path.join(_scans_directory,
+                            "scan." + hashlib.sha1("\0".join(key)).hexdigest())
+
+    with open(filename, "a+b") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            f.seek(0)
+            content = f.read()
+            if content:
+                return marshal.loads(content)
+
+            ret = scan()
+            f.write(marshal.dumps(ret))
+            return ret
+        finally:
+            f.flush()
+            fcntl.flock(f, fcntl.LOCK_UN)
 
 
 class Gnu:
     def build_object(self, target_name, out_filename, in_filename, include_dirs,
-                     compiler_flags):
+                     compiler_flags, precompiled_header=None):
+        with _objects_lock:
+            built = out_filename in _objects
+            if not built:
+                _objects[out_filename] = (threading.Event(), [])
+
+        (done, errors) = _objects[out_filename]
+
+        if built:
+            ui.debug("object {} is shared, waiting for it".format(out_filename))
+            done.wait()
+            if errors:
+                raise errors[0]
+            return
+
+        try:
+            self.__build_object(target_name, out_filename, in_filename, include_dirs,
+                                compiler_flags, precompiled_header)
+        except Exception as e:
+            errors.append(e)
+            raise
+        finally:
+            done.set()
+
+    def __build_object(self, target_name, out_filename, in_filename, include_dirs,
+                       compiler_flags, precompiled_header):
         ui.debug("building object " + out_filename)
 
         with ui.ident:
             prerequisites = self.__fetch_includes(target_name, in_filename,
-                                                  include_dirs, compiler_flags)
+                                                  include_dirs, compiler_flags,
+                                                  precompiled_header)
             prerequisites.append(in_filename)
 
+            if precompiled_header:
+                prerequisites.append(self.precompiled_header_filename(target_name,
+                                                                      precompiled_header))
+
+            profile = None
+            if pgo.stage() == pgo.USE:
+                profile = pgo.stage_profile(out_filename, in_filename)
+                if profile:
+                    prerequisites.append(profile)
+            elif pgo.stage() == pgo.GENERATE:
+                pgo.record_instrumented(out_filename, in_filename)
+
+            sources = list(prerequisites)
+
             ui.debug("appending prerequisites from pake modules: {!s}"
                      .format(fsutils.pake_files))
 
@@ -28,13 +118,81 @@ class Gnu:
             if fsutils.is_any_newer_than(prerequisites, out_filename):
                 fsutils.mkdir_recursive(os.path.dirname(out_filename));
 
-                cmd = configurations.compiler() + " " + self.__prepare_compiler_flags(include_dirs, compiler_flags) + " -c -o " + out_filename + " " + in_filename
+                flags = self.__prepare_compiler_flags(include_dirs, compiler_flags) + self.__prepare_precompiled_header_flags(target_name, precompiled_header)
+
+                # caches hold only objects, .dwo of split dwarf would be lost
+                cache_key = None
+                if ((object_cache.enabled() or remote_cache.enabled())
+                        and not configurations.split_dwarf()):
+                    cache_key = object_cache.key(configurations.compiler(), flags, in_filename, sources)
+
+                    if self.__fetch_from_cache(cache_key, in_filename, out_filename):
+                        return
+
+                    object_cache.prepare_output(out_filename)
+
+                compiler = shell.split(configurations.compiler())
+                cmd = self.compile_command(target_name, out_filename, in_filename,
+                                           include_dirs, compiler_flags, precompiled_header)
                 if command_line.args.verbose:
-                    ui.step(configurations.compiler(), cmd)
+                    ui.step(configurations.compiler(), shell.quote(cmd))
                 else:
                     ui.step(configurations.compiler(), in_filename)
 
-                shell.execute(cmd)
+                start = time.time()
+
+                built_by_worker = (not self.__local_only(precompiled_header, profile, flags)
+                                   and distributed.enabled()
+                                   and distributed.build_object(compiler, flags, in_filename, out_filename))
+
+                if not built_by_worker:
+                    with jobs.local():
+                        shell.run(cmd)
+
+                sharding.record_compile_time(target_name, in_filename, time.time() - start)
+
+                # worker can compile with other compiler than the key is made of
+                if cache_key and not built_by_worker:
+                    if object_cache.enabled():
+                        object_cache.store(cache_key, out_filename)
+                    remote_cache.store(cache_key, out_filename)
+
+    def __local_only(self, precompiled_header, profile, flags):
+        # workers have neither precompiled headers nor profiles, split dwarf
+        # .dwo and path of .gcda of instrumented objects would be left in
+        # worker's temporary directory
+        return bool(precompiled_header or profile or configurations.split_dwarf()
+                    or pgo.stage() == pgo.GENERATE
+                    or any(flag.startswith("-fprofile") for flag in flags))
+
+    def build_precompiled_header(self, target_name, in_filename, include_dirs,
+                                 compiler_flags):
+        out_filename = self.precompiled_header_filename(target_name, in_filename)
+
+        ui.debug("building precompiled header " + out_filename)
+
+        with ui.ident:
+            prerequisites = self.__fetch_includes(target_name, in_filename,
+                                                  include_dirs, compiler_flags)
+            prerequisites.append(in_filename)
+            prerequisites.extend(fsutils.pake_files)
+
+            cmd = self.precompiled_header_command(out_filename, in_filename,
+                                                  include_dirs, compiler_flags)
+
+            if (fsutils.is_any_newer_than(prerequisites, out_filename)
+                    or self.__is_command_changed(out_filename, cmd)):
+                fsutils.mkdir_recursive(os.path.dirname(out_filename));
+
+                if command_line.args.verbose:
+                    ui.step(configurations.compiler(), shell.quote(cmd))
+                else:
+                    ui.step(configurations.compiler(), in_filename)
+
+                shell.run(cmd)
+                self.__store_command(out_filename, cmd)
+
+        return out_filename
 
     def link_application(self, out_filename, in_filenames, link_with, library_dirs):
         if fsutils.is_any_newer_than(in_filenames, out_filename) or self.__are_libs_newer_than_target(link_with, out_filename):
@@ -43,27 +201,170 @@ class Gnu:
             ui.debug("  with libs: " + str(link_with))
             ui.debug("  lib dirs: " + str(library_dirs))
 
-            parameters = " ".join("-L " + lib_dir for lib_dir in library_dirs)
+            ui.bigstep("linking", out_filename)
+            try:
+                shell.run(self.link_application_command(out_filename, in_filenames,
+                                                        link_with, library_dirs))
+            except Exception as e:
+                ui.fatal("cannot link {}, reason: {!s}".format(out_filename, e))
+        else:
+            ui.bigstep("up to date", out_filename)
+
+    def link_shared_library(self, out_filename, in_filenames, link_with, library_dirs,
+                            relink_on_interface_change):
+        if fsutils.is_any_newer_than(in_filenames, out_filename) or self.__are_libs_newer_than_target(link_with, out_filename):
+            ui.debug("linking shared library")
+            ui.debug("  files: " + str(in_filenames))
+            ui.debug("  with libs: " + str(link_with))
+            ui.debug("  lib dirs: " + str(library_dirs))
 
             ui.bigstep("linking", out_filename)
             try:
-                shell.execute(" ".join([configurations.compiler(),
-                                        configurations.linker_flags(),
-                                        "-o", out_filename,
-                                        " ".join(in_filenames),
-                                        self.__prepare_linker_flags(link_with),
-                                        parameters]))
+                shell.run(self.link_shared_library_command(out_filename, in_filenames,
+                                                           link_with, library_dirs))
             except Exception as e:
                 ui.fatal("cannot link {}, reason: {!s}".format(out_filename, e))
+
+            self.__update_interface(out_filename, relink_on_interface_change)
         else:
             ui.bigstep("up to date", out_filename)
 
     def link_static_library(self, out_filename, in_filenames):
+        thin = configurations.thin_archives()
+        members = self.__load_archive_members(out_filename)
+        is_thin = self.__is_thin_archive(out_filename)
+
+        if (members == in_filenames and is_thin == thin
+                and not fsutils.is_any_newer_than(in_filenames, out_filename)):
+            ui.bigstep("up to date", out_filename)
+            return
+
+        cache_key = None
+        if remote_cache.enabled() and not thin:
+            cache_key = object_cache.archive_key(configurations.archiver(), in_filenames)
+
+            if remote_cache.fetch(cache_key, out_filename):
+                ui.bigstep("remote cached", out_filename)
+                self.__store_archive_members(out_filename, in_filenames)
+                return
+
         ui.bigstep(configurations.archiver(), out_filename)
-        shell.execute(configurations.archiver() + " -rcs " + out_filename + " " + " ".join(in_filenames))
 
-    def object_filename(self, target_name, source_filename):
-        return configurations.build_dir() + "/build." + target_name + "/" + source_filename + ".o"
+        archiver = shell.split(configurations.archiver())
+
+        # thin archive holds only paths to objects, so it's cheaper to make
+        # it from scratch than to figure out what changed
+        if members is None or thin or is_thin != thin:
+            if os.path.exists(out_filename):
+                os.remove(out_filename)
+
+            shell.run(self.static_library_command(out_filename, in_filenames))
+        else:
+            current = set(os.path.basename(f) for f in in_filenames)
+            stale = [os.path.basename(f) for f in members
+                     if f not in in_filenames and os.path.basename(f) not in current]
+            changed = [f for f in in_filenames
+                       if f not in members or fsutils.is_newer_than(f, out_filename)]
+
+            ui.debug("updating archive, changed: {!s}, stale: {!s}".format(changed, stale))
+
+            # symbol index is written only once, by the last command
+            if stale:
+                shell.run(archiver + ["-dS", out_filename]
+                          + self.__prepare_objects(out_filename, stale))
+
+            if changed:
+                shell.run(archiver + ["-rcs", out_filename]
+                          + self.__prepare_objects(out_filename, changed))
+            else:
+                shell.run(archiver + ["-s", out_filename])
+
+        self.__store_archive_members(out_filename, in_filenames)
+
+        if cache_key:
+            remote_cache.store(cache_key, out_filename)
+
+    # commands are argument vectors, to be run in the directory of the target
+
+    def compile_command(self, target_name, out_filename, in_filename, include_dirs,
+                        compiler_flags, precompiled_header=None):
+        return (shell.split(configurations.compiler())
+                + self.__prepare_compiler_flags(include_dirs, compiler_flags)
+                + self.__prepare_precompiled_header_flags(target_name, precompiled_header)
+                + ["-c", "-o", out_filename, in_filename])
+
+    def precompiled_header_command(self, out_filename, in_filename, include_dirs,
+                                   compiler_flags):
+        return (shell.split(configurations.compiler())
+                + self.__prepare_compiler_flags(include_dirs, compiler_flags)
+                + ["-x", "c++-header", "-o", out_filename, in_filename])
+
+    # with write_response_file=False, response file is only referred to and
+    # whoever runs the command writes it
+
+    def link_application_command(self, out_filename, in_filenames, link_with, library_dirs,
+                                 write_response_file=True):
+        return (shell.split(configurations.compiler())
+                + shell.split(configurations.linker_flags())
+                + self.__prepare_linker_options()
+                + ["-o", out_filename]
+                + self.__prepare_objects(out_filename, in_filenames, write_response_file)
+                + self.__prepare_linker_flags(link_with, library_dirs))
+
+    def link_shared_library_command(self, out_filename, in_filenames, link_with, library_dirs,
+                                    write_response_file=True):
+        return (shell.split(configurations.compiler())
+                + shell.split(configurations.linker_flags())
+                + self.__prepare_linker_options()
+                + ["-shared", "-Wl,-soname," + os.path.basename(out_filename),
+                   "-o", out_filename]
+                + self.__prepare_objects(out_filename, in_filenames, write_response_file)
+                + self.__prepare_linker_flags(link_with, library_dirs))
+
+    def static_library_command(self, out_filename, in_filenames, write_response_file=True):
+        # makes the archive from scratch, it has to be removed first
+        thin = configurations.thin_archives()
+
+        return (shell.split(configurations.archiver())
+                + ["-rcsT" if thin else "-rcs", out_filename]
+                + self.__prepare_objects(out_filename, in_filenames, write_response_file))
+
+    def objects_directory(self, target_name, include_dirs, compiler_flags, precompiled_header=None):
+        # objects are keyed by everything which makes the command line, so
+        # targets compiling the same source the same way share the object
+        signature = "\0".join([configurations.compiler()]
+                               + self.__prepare_compiler_flags(include_dirs, compiler_flags)
+                               + self.__prepare_precompiled_header_flags(target_name, precompiled_header)
+                               + [os.path.relpath(os.getcwd(), fsutils.SOURCE_ROOT)])
+
+        return configurations.build_dir() + "/objects/" + hashlib.sha1(signature).hexdigest()[:16] + "/"
+
+    def object_filename(self, objects_directory, source_filename):
+        return objects_directory + source_filename + ".o"
+
+    def precompiled_header_filename(self, target_name, header_filename):
+        return self.cache_directory(target_name) + header_filename + self.__precompiled_header_suffix()
+
+    def unity_filename(self, target_name, index):
+        return self.cache_directory(target_name) + "unity_{}.cpp".format(index)
+
+    def write_unity_source(self, out_filename, in_filenames):
+        content = "".join("#include \"{}\"\n".format(os.path.abspath(in_filename))
+                          for in_filename in in_filenames)
+
+        if os.path.isfile(out_filename):
+            with open(out_filename, "r") as f:
+                if f.read() == content:
+                    return
+
+        ui.debug("writing unity source " + out_filename)
+
+        fsutils.mkdir_recursive(os.path.dirname(out_filename))
+        with open(out_filename, "w") as f:
+            f.write(content)
+
+    def shared_library_filename(self, target_name):
+        return configurations.build_dir() + "/lib" + target_name + ".so"
 
     def static_library_filename(self, target_name):
         return configurations.build_dir() + "/lib" + target_name + ".a"
@@ -77,51 +378,236 @@ class Gnu:
     def build_dir(self):
         return configurations.build_dir()
 
-    def __fetch_includes(self, target_name, in_filename, include_dirs, compiler_flags):
+    def includes_filename(self, target_name, in_filename):
+        return self.cache_directory(target_name) + in_filename + ".includes"
+
+    def cached_includes(self, target_name, in_filename):
+        # includes found by the last build, None if the source wasn't scanned
+        try:
+            with open(self.includes_filename(target_name, in_filename), "rb") as f:
+                return marshal.load(f)
+        except (IOError, EOFError, ValueError):
+            return None
+
+    def __fetch_from_cache(self, cache_key, in_filename, out_filename):
+        if object_cache.enabled() and object_cache.fetch(cache_key, out_filename):
+            ui.step("cached", in_filename)
+            return True
+
+        if remote_cache.enabled() and remote_cache.fetch(cache_key, out_filename):
+            if object_cache.enabled():
+                object_cache.store(cache_key, out_filename)
+
+            ui.step("remote cached", in_filename)
+            return True
+
+        return False
+
+    def __fetch_includes(self, target_name, in_filename, include_dirs, compiler_flags,
+                         precompiled_header=None):
         ui.debug("getting includes for " + in_filename)
 
         with ui.ident:
-            cache_file = self.cache_directory(target_name) + in_filename + ".includes"
+            cache_file = self.includes_filename(target_name, in_filename)
             includes = None
             if os.path.exists(cache_file) and fsutils.is_newer_than(cache_file, in_filename):
-                includes = marshal.load(open(cache_file, "rb"))
-            else:
+                includes = [intern(include) for include in marshal.load(open(cache_file, "rb"))]
+
+                # headers and sources of unity unit can include something
+                # new, unity source itself isn't touched then
+                if (not all(map(os.path.isfile, includes))
+                        or fsutils.is_any_newer_than(includes, cache_file)):
+                    includes = None
+
+            if includes is None:
                 fsutils.mkdir_recursive(os.path.dirname(cache_file));
-                includes = self.__scan_includes(in_filename, include_dirs, compiler_flags)
+                includes = self.__scan_includes(in_filename, include_dirs, compiler_flags,
+                                                precompiled_header)
                 marshal.dump(includes, open(cache_file, "wb"))
 
         return includes
 
-    def __scan_includes(self, in_filename, include_dirs, compiler_flags):
+    def __scan_includes(self, in_filename, include_dirs, compiler_flags, precompiled_header):
         ui.debug("scanning includes for " + in_filename)
         try:
             flags = self.__prepare_compiler_flags(include_dirs, compiler_flags)
-            out = shell.execute(" ".join([configurations.compiler(), flags, "-M",
-                                          in_filename]),
-                                capture_output=True).split()
+
+            # sources might rely on the precompiled header being included
+            if precompiled_header:
+                flags += ["-include", precompiled_header]
+
+            cmd = shell.split(configurations.compiler()) + flags + ["-M", in_filename]
+
+            # configurations built in one run often scan the same way
+            key = tuple([os.getcwd()] + cmd)
+            if key in _scanned:
+                ui.debug("already scanned with the same flags")
+                return list(_scanned[key])
+
+            def scan():
+                with jobs.local():
+                    out = shell.run(cmd, capture_output=True).split()
+                return [token for token in out[2:] if not token == "\\"]
+
+            includes = _scan_once(key, scan) if _scans_directory else scan()
         except Exception as e:
             raise Exception("error while building dependency graph for"
                             "{!s}, {!s}".format(in_filename, e))
 
-        return [token for token in out[2:] if not token == "\\"]
+        _scanned[key] = [intern(token) for token in includes]
+        return list(_scanned[key])
+
+    def __prepare_linker_flags(self, link_with, library_dirs):
+        ret = ["-L", configurations.build_dir()] + ["-l" + lib for lib in link_with]
 
-    def __prepare_linker_flags(self, link_with):
-        libs_str = "".join(" -l" + lib for lib in link_with)
-        return " ".join(["-L " + configurations.build_dir(), libs_str])
+        # shared libraries from our tree are next to the binaries which use them
+        if any(os.path.exists(self.shared_library_filename(lib)) for lib in link_with):
+            ret.append("-Wl,-rpath,$ORIGIN")
+
+        for lib_dir in library_dirs:
+            ret += ["-L", lib_dir]
+
+        return ret
+
+    def __prepare_linker_options(self):
+        ret = []
+
+        linker = configurations.linker()
+        if linker:
+            ret.append("-fuse-ld=" + linker)
+
+        threads = configurations.linker_threads()
+        if threads:
+            if linker == "gold":
+                ret += ["-Wl,--threads", "-Wl,--thread-count=" + threads]
+            elif linker == "lld":
+                ret.append("-Wl,--threads=" + threads)
+            elif linker == "mold":
+                ret.append("-Wl,--thread-count=" + threads)
+            else:
+                ui.debug("linker {} doesn't link in parallel, ignoring linker_threads"
+                         .format(linker or "default"))
+
+        if configurations.split_dwarf() and linker in ["gold", "lld", "mold"]:
+            ret.append("-Wl,--gdb-index")
+
+        if pgo.stage() == pgo.GENERATE:
+            ret += self.__pgo_flags()
+
+        return ret
+
+    def __prepare_objects(self, out_filename, in_filenames, write_response_file=True):
+        # long lists go through response file anyway, single argument can't
+        # be longer than 128kB on linux and whole command line has its limit
+        # as well
+        if (not configurations.response_files()
+                and sum(len(f) + 1 for f in in_filenames) < _RESPONSE_FILE_THRESHOLD):
+            return list(in_filenames)
+
+        if not write_response_file:
+            return ["@" + out_filename + ".rsp"]
+
+        return [shell.response_file(out_filename + ".rsp", in_filenames)]
+
+    def __update_interface(self, out_filename, only_on_change):
+        # dependents are relinked when this file is newer than them, so it can
+        # be kept untouched when exported symbols stay the same
+        interface_filename = out_filename + ".interface"
+
+        try:
+            symbols = shell.run(["nm", "-D", "--defined-only", out_filename], capture_output=True)
+            interface = "\n".join(sorted(" ".join(line.split()[1:]) for line in symbols.splitlines()))
+        except Exception as e:
+            ui.debug("can't read symbols of {}: {!s}".format(out_filename, e))
+            interface = None
+
+        if only_on_change and interface is not None and os.path.exists(interface_filename):
+            with open(interface_filename, "r") as f:
+                if f.read() == interface:
+                    ui.debug("interface of {} didn't change".format(out_filename))
+                    return
+
+        with open(interface_filename, "w") as f:
+            f.write(interface or "")
 
     def __prepare_compiler_flags(self, include_dirs, compiler_flags):
-        return " ".join([configurations.compiler_flags(),
-                         " ".join(compiler_flags),
-                         self.__prepare_include_dirs_parameters(include_dirs)])
+        split_dwarf = ["-gsplit-dwarf"] if configurations.split_dwarf() else []
+
+        return (shell.split(configurations.compiler_flags())
+                + split_dwarf
+                + self.__pgo_flags()
+                + shell.split(" ".join(compiler_flags))
+                + self.__prepare_include_dirs_parameters(include_dirs))
+
+    def __pgo_flags(self):
+        if pgo.stage() == pgo.GENERATE:
+            if pgo.is_clang():
+                return ["-fprofile-generate=" + pgo.raw_profile_dir()]
+            return ["-fprofile-generate", "-fprofile-update=atomic"]
+
+        if pgo.stage() == pgo.USE:
+            # sources which weren't run during training have no profile
+            if pgo.is_clang():
+                return ["-fprofile-use=" + pgo.clang_profile(), "-Wno-profile-instr-unprofiled"]
+            return ["-fprofile-use", "-fprofile-correction", "-Wno-missing-profile"]
+
+        return []
+
+    def __prepare_precompiled_header_flags(self, target_name, precompiled_header):
+        if not precompiled_header:
+            return []
+
+        # compiler looks for the precompiled header next to the included
+        # file, the header itself doesn't have to be there
+        return ["-Winvalid-pch", "-include", self.cache_directory(target_name) + precompiled_header]
+
+    def __precompiled_header_suffix(self):
+        if "clang" in configurations.compiler():
+            return ".pch"
+        return ".gch"
+
+    def __load_archive_members(self, out_filename):
+        if not os.path.exists(out_filename):
+            return None
+
+        try:
+            with open(out_filename + ".members", "rb") as f:
+                return marshal.load(f)
+        except (IOError, EOFError, ValueError):
+            return None
+
+    def __store_archive_members(self, out_filename, in_filenames):
+        with open(out_filename + ".members", "wb") as f:
+            marshal.dump(list(in_filenames), f)
+
+    def __is_thin_archive(self, out_filename):
+        try:
+            with open(out_filename, "rb") as f:
+                return f.read(8) == "!<thin>\n"
+        except IOError:
+            return None
+
+    def __is_command_changed(self, out_filename, cmd):
+        try:
+            with open(out_filename + ".cmd", "r") as f:
+                return f.read() != shell.quote(cmd)
+        except IOError:
+            return True
+
+    def __store_command(self, out_filename, cmd):
+        with open(out_filename + ".cmd", "w") as f:
+            f.write(shell.quote(cmd))
 
     def __prepare_include_dirs_parameters(self, include_dirs):
-        ret = " ".join("-I" + include_dir for include_dir in include_dirs)
-        ui.debug("include parameters: " + ret)
+        ret = ["-I" + include_dir for include_dir in include_dirs]
+        ui.debug("include parameters: {!s}".format(ret))
         return ret
 
     def __are_libs_newer_than_target(self, link_with, target):
-        # check if the library is from our source tree
-        files = (self.static_library_filename(lib) for lib in link_with)
+        # check if the library is from our source tree, shared libraries
+        # are checked by their interface
+        files = [self.static_library_filename(lib) for lib in link_with]
+        files += [self.shared_library_filename(lib) + ".interface" for lib in link_with]
 
         def is_newer_than_target(filename):
             if os.path.exists(filename):
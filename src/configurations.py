@@ -1,10 +1,12 @@
+import collections
+
 import ui
 import lexer
 import command_line
 import fsutils
 import variables
 
-configurations = {}
+configurations = collections.OrderedDict()
 
 def build_dir():
     return fsutils.build_dir(get_selected_configuration().name)
@@ -21,6 +23,34 @@ def compiler_flags():
 def linker_flags():
     return get_selected_configuration().linker_flags.eval_to_string()
 
+def precompiled_header():
+    return get_selected_configuration().precompiled_header.eval()
+
+def unity():
+    return get_selected_configuration().unity.eval()
+
+def thin_archives():
+    return _is_enabled(get_selected_configuration().thin_archives)
+
+def linker():
+    return get_selected_configuration().linker.eval_to_string()
+
+def linker_threads():
+    return get_selected_configuration().linker_threads.eval_to_string()
+
+def split_dwarf():
+    return _is_enabled(get_selected_configuration().split_dwarf)
+
+def response_files():
+    return _is_enabled(get_selected_configuration().response_files)
+
+def pgo():
+    return get_selected_configuration().pgo.eval()
+
+def _is_enabled(variable):
+    value = variable.eval()
+    return bool(value) and value[0] not in ("no", "false", "0")
+
 def archiver():
     return get_selected_configuration().archiver.eval_to_string()
 
@@ -34,6 +64,21 @@ def get_selected_configuration():
         ui.fatal("no such configuration: {}, perhaps try one of these: {}"
                  .format(command_line.args.configuration, ", ".join(configurations)))
 
+def requested():
+    if command_line.args.all_configurations:
+        return list(configurations)
+
+    for name in command_line.args.configurations:
+        if name not in configurations:
+            ui.fatal("no such configuration: {}, perhaps try one of these: {}"
+                     .format(name, ", ".join(configurations)))
+
+    return command_line.args.configurations
+
+def select(name):
+    ui.debug("selecting configuration: " + name)
+    command_line.args.configuration = name
+
 def add_configuration(configuration):
     ui.debug("adding configuration: " + str(configuration))
     configurations[configuration.name] = configuration
@@ -50,6 +95,15 @@ class Configuration:
         self.linker_flags = variables.make_simple_variable("-L.")
         self.application_suffix = variables.make_simple_variable("")
         self.archiver = variables.make_simple_variable("ar")
+        self.precompiled_header = variables.Variable()
+        self.unity = variables.Variable()
+        self.thin_archives = variables.Variable()
+        self.linker = variables.Variable()
+        self.linker_threads = variables.Variable()
+        self.split_dwarf = variables.Variable()
+        self.response_files = variables.Variable()
+        self.pgo = variables.Variable()
+        self.pgo_stage = None
         self.export = []
 
     def __repr__(self):
@@ -0,0 +1,260 @@
+import os
+import json
+import socket
+import shutil
+import tempfile
+import threading
+import subprocess
+import SocketServer
+
+import ui
+import shell
+import jobs
+import command_line
+
+# Compilation is distributed by preprocessing the source locally and sending
+# the result with compiler flags to a worker (pake.py --worker) over tcp. Each
+# message is a json header line optionally followed by "size" bytes of data.
+#
+# Workers don't authenticate anyone, by default they listen only on the
+# loopback. They compile only with code generation and warning flags from
+# an allow-list, anything which could make the compiler run or write
+# something else (-fplugin=, -specs=, -B, -o...) is refused and the object
+# is built locally.
+
+# flags given with the preprocessor, they only refer to local files
+_PREPROCESSOR_FLAGS = ("-I", "-D", "-U")
+_PREPROCESSOR_FLAGS_WITH_ARGUMENT = ["-isystem", "-iquote", "-idirafter", "-include"]
+
+_ALLOWED_FLAGS = ("-f", "-m", "-O", "-g", "-W", "-std=", "-w", "-pedantic", "-pthread", "-ansi")
+_REFUSED_FLAGS = ("-fplugin", "-fprofile", "-fauto-profile", "-fdump", "-fstack-usage",
+                  "-fcallgraph-info", "-Wa,", "-Wl,", "-Wp,")
+
+_lock = threading.Lock()
+_workers = None
+
+
+class _Worker:
+    def __init__(self, host, port, slots):
+        self.host = host
+        self.port = port
+        self.slots = slots
+        self.busy = 0
+        self.alive = True
+
+    def __str__(self):
+        return "{}:{}".format(self.host, self.port)
+
+
+def _parse_workers(workers):
+    ret = []
+
+    for worker in workers.split(","):
+        if not worker:
+            continue
+
+        address, _, slots = worker.partition("/")
+        host, _, port = address.rpartition(":")
+
+        try:
+            ret.append(_Worker(host, int(port), int(slots or 1)))
+        except ValueError:
+            ui.fatal("bad worker: {}, expected host:port/slots".format(worker))
+
+    return ret
+
+
+def workers():
+    global _workers
+
+    with _lock:
+        if _workers is None:
+            _workers = _parse_workers(command_line.args.workers or "")
+
+    return _workers
+
+
+def enabled():
+    return any(worker.alive for worker in workers())
+
+
+def slots(local_jobs):
+    return local_jobs + sum(worker.slots for worker in workers() if worker.alive)
+
+
+def _acquire():
+    with _lock:
+        free = [worker for worker in _workers
+                if worker.alive and worker.busy < worker.slots]
+
+        if not free:
+            return None
+
+        worker = min(free, key=lambda w: float(w.busy) / w.slots)
+        worker.busy += 1
+        return worker
+
+
+def _release(worker, alive=True):
+    with _lock:
+        worker.busy -= 1
+        if not alive and worker.alive:
+            ui.warning("worker {!s} failed, not using it anymore".format(worker))
+            worker.alive = False
+
+
+def _send(sock, header, data=""):
+    header = dict(header, size=len(data))
+    sock.sendall(json.dumps(header) + "\n" + data)
+
+
+def _receive(stream):
+    line = stream.readline()
+    if not line:
+        raise IOError("connection closed")
+
+    header = json.loads(line)
+    data = stream.read(header["size"])
+    if len(data) != header["size"]:
+        raise IOError("connection closed")
+
+    return header, data
+
+
+def _compile_on(worker, flags, preprocessed):
+    sock = socket.create_connection((worker.host, worker.port),
+                                    timeout=float(command_line.args.worker_timeout))
+    try:
+        _send(sock, {"flags": flags}, preprocessed)
+        return _receive(sock.makefile("rb"))
+    finally:
+        sock.close()
+
+
+# returns False when the object should be built locally instead
+def build_object(compiler, flags, in_filename, out_filename):
+    preprocessed = None
+    retries = len(workers())
+
+    while retries > 0:
+        worker = _acquire()
+        if worker is None:
+            return False
+
+        retries -= 1
+
+        if preprocessed is None:
+            try:
+                with jobs.local():
+                    preprocessed = shell.run(compiler + flags + ["-E", in_filename],
+                                             capture_output=True)
+            except Exception:
+                _release(worker)
+                return False
+
+        try:
+            header, data = _compile_on(worker, flags, preprocessed)
+        except (IOError, socket.error, ValueError, KeyError) as e:
+            ui.debug("worker {!s} failed: {!s}".format(worker, e))
+            _release(worker, alive=False)
+            continue
+
+        _release(worker)
+
+        if header.get("status") != 0:
+            # let local compiler report the error in user's environment
+            ui.debug("worker {!s} couldn't compile {}: {}"
+                     .format(worker, in_filename, header.get("output")))
+            return False
+
+        if header.get("output"):
+            ui.info(header["output"].encode("utf-8"))
+
+        with open(out_filename, "wb") as f:
+            f.write(data)
+
+        return True
+
+    return False
+
+
+def _allowed_flags(flags):
+    # preprocessing is already done, its flags are dropped, the others have
+    # to be allowed
+    ret = []
+    skip = False
+
+    for flag in flags:
+        if skip:
+            skip = False
+        elif flag in _PREPROCESSOR_FLAGS_WITH_ARGUMENT:
+            skip = True
+        elif flag.startswith(_PREPROCESSOR_FLAGS):
+            pass
+        elif flag.startswith(_ALLOWED_FLAGS) and not flag.startswith(_REFUSED_FLAGS):
+            ret.append(flag)
+        else:
+            raise ValueError("flag not allowed on worker: {}".format(flag))
+
+    return ret
+
+
+class _Handler(SocketServer.StreamRequestHandler):
+    def handle(self):
+        header, preprocessed = _receive(self.rfile)
+
+        with self.server.slots:
+            status, output, data = self.__compile(header["flags"], preprocessed)
+
+        _send(self.request, {"status": status, "output": output.decode("utf-8", "replace")}, data)
+
+    def __compile(self, flags, preprocessed):
+        directory = tempfile.mkdtemp(prefix="pake-worker-")
+
+        try:
+            in_filename = os.path.join(directory, "source.ii")
+            out_filename = os.path.join(directory, "source.o")
+
+            with open(in_filename, "wb") as f:
+                f.write(preprocessed)
+
+            try:
+                flags = _allowed_flags(flags)
+            except ValueError as e:
+                return 1, str(e), ""
+
+            process = subprocess.Popen(shell.split(self.server.compiler) + flags
+                                       + ["-c", "-o", out_filename, in_filename],
+                                       stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+            output = process.communicate()[0]
+
+            data = ""
+            if process.returncode == 0:
+                with open(out_filename, "rb") as f:
+                    data = f.read()
+
+            return process.returncode, output, data
+        finally:
+            shutil.rmtree(directory)
+
+
+class _Server(SocketServer.ThreadingMixIn, SocketServer.TCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+def serve():
+    args = command_line.args
+
+    server = _Server((args.bind, int(args.port)), _Handler)
+    server.slots = threading.Semaphore(int(args.slots))
+    server.compiler = args.compiler
+
+    port = server.server_address[1]
+
+    if args.port_file:
+        with open(args.port_file, "w") as f:
+            f.write(str(port))
+
+    ui.bigstep("worker", "listening on {}:{} with {} slots".format(args.bind, port, args.slots))
+    server.serve_forever()
@@ -1,11 +1,14 @@
 import os
 import errno
+import hashlib
 import itertools
 
 import ui
 import shell
+import command_line
 
-BUILD_ROOT = os.path.normpath(os.getcwd() + "/__build")
+SOURCE_ROOT = os.getcwd()
+BUILD_ROOT = os.path.normpath(os.path.join(SOURCE_ROOT, getattr(command_line.args, "build_root", "__build")))
 
 def mkdir_recursive(path):
     try:
@@ -37,6 +40,50 @@ def is_any_newer_than(prerequisites, target):
     return any(map(lambda pre: is_newer_than(pre, target), prerequisites))
 
 
+def write_if_changed(filename, content):
+    # keeps mtime of the file when content is the same, so nothing which
+    # depends on it is rebuilt
+    if os.path.isfile(filename):
+        with open(filename, "rb") as f:
+            if f.read() == content:
+                return False
+
+    with open(filename, "wb") as f:
+        f.write(content)
+
+    return True
+
+
+def copy_if_changed(source, destination):
+    with open(source, "rb") as f:
+        return write_if_changed(destination, f.read())
+
+
+def digest(filename):
+    sha1 = hashlib.sha1()
+
+    with open(filename, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), ""):
+            sha1.update(chunk)
+
+    return sha1.hexdigest()
+
+
+def digest_tree(path):
+    # directories are made of their files, missing paths are told apart
+    # from empty ones
+    if os.path.isdir(path):
+        return hashlib.sha1("".join(os.path.relpath(os.path.join(dirpath, filename), path)
+                                    + digest_tree(os.path.join(dirpath, filename))
+                                    for (dirpath, _, filenames) in sorted(os.walk(path))
+                                    for filename in sorted(filenames))).hexdigest()
+
+    try:
+        return digest(path)
+    except IOError:
+        return "missing"
+
+
 def get_mtime(filename):
     return os.path.getmtime(filename)
 
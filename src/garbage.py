@@ -0,0 +1,136 @@
+import os
+import marshal
+
+import ui
+import targets
+import compiler
+import configurations
+import command_line
+
+# --gc removes from the build directory of the configuration whatever the
+# current tree wouldn't build anymore: objects and include caches of removed
+# sources, artefacts of removed targets and resources they copied. Files
+# builds put outside of objects/ and build.<target>/ are removed only when
+# they are known to be outputs of some earlier build, so the build directory
+# can be shared with other tools.
+
+_OUTPUTS = ".outputs"
+
+_recorded = {}
+
+
+def enabled():
+    return bool(command_line.args.gc)
+
+
+def _outputs_filename(build_dir):
+    return os.path.join(build_dir, _OUTPUTS)
+
+
+def _load(build_dir):
+    if build_dir not in _recorded:
+        try:
+            with open(_outputs_filename(build_dir), "rb") as f:
+                _recorded[build_dir] = set(marshal.load(f))
+        except (IOError, EOFError, ValueError):
+            _recorded[build_dir] = set()
+
+    return _recorded[build_dir]
+
+
+def record(outputs):
+    _load(configurations.build_dir()).update(outputs)
+
+
+def _expected():
+    toolchain = compiler.Gnu()
+    ret = set()
+
+    for name in targets.visible_targets():
+        ret.update(targets.targets[name].outputs(toolchain))
+
+    return ret
+
+
+def _walk(directory):
+    for (dirpath, _, filenames) in os.walk(directory):
+        for filename in filenames:
+            yield os.path.join(dirpath, filename)
+
+
+def _size(path):
+    try:
+        return os.lstat(path).st_size
+    except OSError:
+        return 0
+
+
+def _human(size):
+    for unit in ["B", "kB", "MB"]:
+        if size < 1024:
+            return "{:.1f} {}".format(size, unit)
+        size /= 1024.0
+
+    return "{:.1f} GB".format(size)
+
+
+def _remove_empty_directories(directory):
+    for (dirpath, _, _) in sorted(os.walk(directory), reverse=True):
+        if not os.listdir(dirpath):
+            os.rmdir(dirpath)
+
+
+def collect():
+    build_dir = configurations.build_dir()
+    recorded = _load(build_dir)
+    expected = _expected()
+
+    candidates = set()
+    roots = []
+
+    # directories recorded by older builds are looked into, some of their
+    # files can still be expected
+    for path in recorded:
+        # sources and whatever else lives outside are never touched
+        if not path.startswith(build_dir + os.sep):
+            continue
+
+        if os.path.isdir(path) and not os.path.islink(path):
+            roots.append(path)
+            candidates.update(_walk(path))
+        else:
+            candidates.add(path)
+
+    for entry in sorted(os.listdir(build_dir)):
+        if entry == "objects" or entry.startswith("build."):
+            roots.append(os.path.join(build_dir, entry))
+            candidates.update(_walk(roots[-1]))
+
+    removed = 0
+    reclaimed = 0
+
+    for path in sorted(candidates - expected):
+        if not os.path.lexists(path):
+            continue
+
+        ui.debug("removing stale " + path)
+
+        reclaimed += _size(path)
+        removed += 1
+
+        os.remove(path)
+
+    for root in roots:
+        if os.path.isdir(root):
+            _remove_empty_directories(root)
+
+    _recorded[build_dir] = recorded & expected
+
+    ui.bigstep("gc", "removed {} files, reclaimed {}".format(removed, _human(reclaimed)))
+
+
+def finish():
+    for (build_dir, outputs) in _recorded.items():
+        if os.path.isdir(build_dir):
+            with open(_outputs_filename(build_dir), "wb") as f:
+                marshal.dump(sorted(outputs), f)
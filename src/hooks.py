@@ -0,0 +1,157 @@
+import os
+import marshal
+import hashlib
+import functools
+
+import ui
+import fsutils
+import shell
+import compiler
+import variables
+
+# run_before and run_after of every target type can declare prerequisites
+# (inputs) and artefacts (outputs). Hook with both runs again only when its
+# commands or content of the prerequisites change, or an artefact is
+# missing. What it ran with is kept in build.<target>/<kind>.hook. Hooks
+# without them run on every build. Artefacts edited since the hook made them
+# make it run again too. Artefacts a hook writes with the same content as
+# before keep their mtimes.
+
+
+def stamp_filename(target_name, kind):
+    return compiler.Gnu().cache_directory(target_name) + kind + ".hook"
+
+
+def _key(cmds, prerequisites):
+    sha1 = hashlib.sha1()
+
+    for cmd in cmds:
+        sha1.update(cmd + "\0")
+
+    for prerequisite in prerequisites:
+        sha1.update(prerequisite + "\0" + fsutils.digest_tree(prerequisite) + "\0")
+
+    return sha1.hexdigest()
+
+
+def _load(filename):
+    try:
+        with open(filename, "rb") as f:
+            return marshal.load(f)
+    except (IOError, EOFError, ValueError):
+        return None
+
+
+def _is_unchanged(artefact, recorded):
+    # recorded is (size, mtime, digest), content is read only when stat differs
+    try:
+        (size, mtime, digest) = recorded
+        st = os.stat(artefact)
+    except (ValueError, TypeError, OSError):
+        return False
+
+    if (st.st_size, st.st_mtime) == (size, mtime):
+        return True
+
+    return fsutils.digest(artefact) == digest
+
+
+def _is_fresh(stamp, key, artefacts, prerequisites):
+    if not all(map(os.path.exists, artefacts + prerequisites)):
+        return False
+
+    # hooks which pake didn't run yet are told by mtimes
+    if stamp is None:
+        return not any(fsutils.is_any_newer_than(prerequisites, artefact)
+                       for artefact in artefacts)
+
+    return (stamp["key"] == key
+            and all(_is_unchanged(artefact, recorded)
+                    for (artefact, recorded) in stamp["outputs"].items()))
+
+
+def _write_stamp(filename, key, artefacts):
+    outputs = {}
+
+    for artefact in artefacts:
+        if os.path.isfile(artefact):
+            st = os.stat(artefact)
+            outputs[artefact] = (st.st_size, st.st_mtime, fsutils.digest(artefact))
+
+    stamp = {"key": key, "outputs": outputs}
+
+    fsutils.mkdir_recursive(os.path.dirname(filename))
+    with open(filename, "wb") as f:
+        marshal.dump(stamp, f)
+
+
+def _snapshot(artefacts):
+    return dict((artefact, (fsutils.digest(artefact), os.stat(artefact)))
+                for artefact in artefacts if os.path.isfile(artefact))
+
+
+def _keep_unchanged(snapshot):
+    # artefacts generated again with the same content get their mtimes
+    # back, so nothing including them is rebuilt
+    for (artefact, (digest, st)) in snapshot.items():
+        if (os.path.isfile(artefact) and fsutils.get_mtime(artefact) != st.st_mtime
+                and fsutils.digest(artefact) == digest):
+            ui.debug("{} didn't change, keeping its mtime".format(artefact))
+            os.utime(artefact, (st.st_atime, st.st_mtime))
+
+
+def _run(name, kind, root_path, cmds, artefacts, prerequisites, env, stamp_filename):
+    cached = bool(artefacts and prerequisites)
+
+    if cached:
+        key = _key(cmds, prerequisites)
+
+        if _is_fresh(_load(stamp_filename), key, artefacts, prerequisites):
+            ui.debug("{} of {} is up to date".format(kind, name))
+            return
+
+    snapshot = _snapshot(artefacts)
+
+    for cmd in cmds:
+        ui.debug("running {!s}".format(cmd))
+
+        # output of hooks isn't collected, long ones show their progress
+        try:
+            shell.execute(cmd, env=env, cwd=root_path)
+        except Exception as e:
+            raise Exception("run_{} of {}: {!s}".format(kind, name, e))
+
+    _keep_unchanged(snapshot)
+
+    if cached:
+        _write_stamp(stamp_filename, key, artefacts)
+
+
+def prepare(target, kind):
+    # everything from the tree is evaluated here, so the hook can run in
+    # the pool, None when there is nothing to run
+    parameters = target.common_parameters
+    cmds = (parameters.run_before if kind == "before" else parameters.run_after).eval()
+
+    if not cmds:
+        return None
+
+    root_path = parameters.root_path
+
+    return functools.partial(_run, parameters.name, kind, root_path, cmds,
+                             [os.path.join(root_path, artefact)
+                              for artefact in parameters.artefacts.eval()],
+                             [os.path.join(root_path, prerequisite)
+                              for prerequisite in parameters.prerequisites.eval()],
+                             variables.environment(parameters.module_name),
+                             stamp_filename(parameters.name, kind))
+
+
+def run(target, kind):
+    hook = prepare(target, kind)
+
+    if hook:
+        try:
+            hook()
+        except Exception as e:
+            ui.fatal("failed {!s}".format(e))
@@ -0,0 +1,180 @@
+import os
+import time
+import errno
+import fcntl
+import Queue
+import threading
+
+import command_line
+import distributed
+
+# Every compile or other heavy action done in parallel takes a slot before it
+# runs. Links run only after all compiles of their target are done, so they
+# don't share the machine with -j of compiles.
+#
+# Parallel work is done by a fixed pool of limit() threads, no matter how many
+# sources there are. With workers it's -j plus their slots, so whatever runs
+# on this machine, like compiles which workers gave back, takes also a local
+# slot and no more than -j of them run at once.
+#
+# Configurations built at once run in processes forked from one pake, they
+# share the slots through lock files in a directory given to share(). Kernel
+# releases locks of a process which died, so its slots aren't lost.
+
+_condition = threading.Condition()
+_used = {"slot": 0, "local": 0}
+_limit = None
+
+_tasks = Queue.Queue()
+_workers = []
+
+_shared = None
+_POLL_INTERVAL = 0.05
+
+
+def limit():
+    global _limit
+
+    with _condition:
+        if _limit is None:
+            _limit = distributed.slots(int(command_line.args.jobs))
+
+    return _limit
+
+
+def share(directory):
+    global _shared
+
+    _shared = directory
+
+
+def forked():
+    # only the thread which forked is in the child, pool starts again
+    global _condition, _used, _tasks
+
+    _condition = threading.Condition()
+    _used = {"slot": 0, "local": 0}
+    _tasks = Queue.Queue()
+    del _workers[:]
+
+
+def _lock_any(prefix, count):
+    # returns descriptor holding one of count locks, waits for a free one
+    while True:
+        for index in range(count):
+            fd = os.open(os.path.join(_shared, "{}.{}".format(prefix, index)),
+                         os.O_RDWR | os.O_CREAT, 0600)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                return fd
+            except IOError as e:
+                os.close(fd)
+                if e.errno not in (errno.EAGAIN, errno.EACCES):
+                    raise
+
+        time.sleep(_POLL_INTERVAL)
+
+
+class _Slot:
+    def __init__(self, kind):
+        self.kind = kind
+
+    def __enter__(self):
+        count = limit() if self.kind == "slot" else int(command_line.args.jobs)
+
+        with _condition:
+            while _used[self.kind] >= count:
+                _condition.wait()
+            _used[self.kind] += 1
+
+        self.fd = _lock_any(self.kind, count) if _shared else None
+
+    def __exit__(self, *args):
+        if self.fd is not None:
+            os.close(self.fd)
+
+        with _condition:
+            _used[self.kind] -= 1
+            _condition.notify_all()
+
+
+def slot():
+    return _Slot("slot")
+
+
+def local():
+    return _Slot("local")
+
+
+class _Batch:
+    def __init__(self, count):
+        self.left = count
+        self.errors = []
+        self.lock = threading.Lock()
+        self.done = threading.Event()
+
+        if count == 0:
+            self.done.set()
+
+    def finished(self, error=None):
+        with self.lock:
+            if error is not None:
+                self.errors.append(error)
+
+            self.left -= 1
+            if self.left == 0:
+                self.done.set()
+
+
+def _work():
+    while True:
+        (function, batch) = _tasks.get()
+
+        # after first failure the rest is only drained
+        if batch.errors:
+            batch.finished()
+            continue
+
+        try:
+            function()
+            batch.finished()
+        except Exception as e:
+            batch.finished(e)
+
+
+def _start_workers():
+    with _condition:
+        while len(_workers) < _limit:
+            worker = threading.Thread(target=_work)
+            worker.daemon = True
+            worker.start()
+            _workers.append(worker)
+
+
+def start(functions):
+    # queues functions in the pool without waiting for them, wait() returns
+    # exceptions they raised
+    limit()
+    _start_workers()
+
+    functions = list(functions)
+    batch = _Batch(len(functions))
+
+    for function in functions:
+        _tasks.put((function, batch))
+
+    return batch
+
+
+def wait(batch):
+    # waiting with timeout keeps main thread responsive to ^C
+    while not batch.done.wait(1):
+        pass
+
+    return batch.errors
+
+
+def run(functions):
+    # runs functions in the pool and waits for all of them, returns exceptions
+    # they raised
+    return wait(start(functions))
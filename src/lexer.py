@@ -42,7 +42,9 @@ class FileReader:
         return self.position >= len(self.buf) or self.position < 0
 
 
-class FileLocation:
+class FileLocation(object):
+    __slots__ = ("filename", "line", "column")
+
     def __init__(self, filename, line, column):
         self.filename = filename
         self.line = line
@@ -52,7 +54,9 @@ class FileLocation:
         return "{}:{!s}".format(self.filename, self.line)
 
 
-class Token:
+class Token(object):
+    __slots__ = ("token_type", "content", "location")
+
     OPEN_PARENTHESIS = 1
     CLOSE_PARENTHESIS = 2
     LITERAL = 3
@@ -65,12 +69,19 @@ class Token:
     def __init__(self, token_type, content, filename=None, line=None, col=None):
         self.token_type = token_type
         self.content = content
+        self.location = FileLocation(filename, line, col)
 
-        self.filename = filename
-        self.line = line
-        self.col = col
+    @property
+    def filename(self):
+        return self.location.filename
 
-        self.location = FileLocation(filename, line, col)
+    @property
+    def line(self):
+        return self.location.line
+
+    @property
+    def col(self):
+        return self.location.column
 
     def __repr__(self):
         if self.is_a(Token.LITERAL):
@@ -95,7 +106,7 @@ def parse(filename):
 
 class Tokenizer:
     def __init__(self, filename):
-        self.filename = filename
+        self.filename = intern(filename)
         buf = FileReader(filename)
         self.tokens = []
         self.__tokenize(buf)
@@ -110,6 +121,9 @@ class Tokenizer:
         return ""
 
     def __add_token(self, token_type, content, line = None):
+        if token_type in (Token.LITERAL, Token.VARIABLE):
+            content = intern(content)
+
         token = Token(token_type, content, self.filename, line)
         self.tokens.append(token)
 
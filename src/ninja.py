@@ -0,0 +1,313 @@
+import os
+import sys
+import pipes
+
+import ui
+import fsutils
+import shell
+import compiler
+import targets
+import variables
+import configurations
+
+# --generate-ninja writes build.ninja which does what building the requested
+# targets with the selected configuration would do. Object caches, workers,
+# sharding and pgo are left out, ninja only runs the commands.
+
+_PATH_FLAGS = ["-I", "-isystem", "-iquote", "-include"]
+
+
+def _escape_path(path):
+    return path.replace("$", "$$").replace(" ", "$ ").replace(":", "$:")
+
+
+def _escape(text):
+    return text.replace("$", "$$")
+
+
+def _paths(paths):
+    return " ".join(_escape_path(path) for path in paths)
+
+
+def _absolute_flags(argv, root_path):
+    # compiler writes depfiles with paths as it found them, ninja reads them
+    # relative to its own directory
+    ret = []
+    pending = False
+
+    for arg in argv:
+        if pending:
+            ret.append(os.path.join(root_path, arg))
+            pending = False
+        elif arg in _PATH_FLAGS:
+            ret.append(arg)
+            pending = True
+        else:
+            for flag in _PATH_FLAGS:
+                if arg.startswith(flag) and len(arg) > len(flag) and flag != "-include":
+                    arg = flag + os.path.join(root_path, arg[len(flag):])
+                    break
+            ret.append(arg)
+
+    return ret
+
+
+def _in_directory(root_path, argv, env=None):
+    assignments = ["{}={}".format(name, pipes.quote(value))
+                   for (name, value) in sorted((env or {}).items())]
+
+    return "cd {} && {}".format(pipes.quote(root_path),
+                                " ".join(assignments + [shell.quote(argv)]))
+
+
+class _Writer:
+    def __init__(self):
+        self.lines = []
+        self.outputs = set()
+
+    def rule(self, name, **variables):
+        self.lines.append("rule " + name)
+        for (key, value) in sorted(variables.items()):
+            self.lines.append("  {} = {}".format(key, value))
+        self.lines.append("")
+
+    def build(self, outputs, rule, inputs=[], implicit=[], order_only=[], **variables):
+        # objects shared between targets are built once
+        if all(output in self.outputs for output in outputs):
+            return
+
+        self.outputs.update(outputs)
+
+        line = "build {}: {}".format(_paths(outputs), rule)
+        if inputs:
+            line += " " + _paths(inputs)
+        if implicit:
+            line += " | " + _paths(implicit)
+        if order_only:
+            line += " || " + _paths(order_only)
+
+        self.lines.append(line)
+        for (key, value) in sorted(variables.items()):
+            self.lines.append("  {} = {}".format(key, _escape(value)))
+        self.lines.append("")
+
+
+def _hook_environment(module_name):
+    # only what pake adds to the environment, the rest comes from ninja
+    env = variables.environment(module_name)
+    return dict((name, value) for (name, value) in env.items()
+                if os.environ.get(name) != value)
+
+
+def _hook(writer, target, kind, cmds, after=[]):
+    parameters = target.common_parameters
+    evaluated_cmds = cmds.eval()
+
+    if not evaluated_cmds:
+        return []
+
+    env = _hook_environment(parameters.module_name)
+    command = " && ".join(_in_directory(parameters.root_path, ["/bin/sh", "-c", cmd], env)
+                          for cmd in evaluated_cmds)
+
+    artefacts = [os.path.join(parameters.root_path, artefact)
+                 for artefact in parameters.artefacts.eval()]
+    prerequisites = [os.path.join(parameters.root_path, prerequisite)
+                     for prerequisite in parameters.prerequisites.eval()]
+
+    # without artefacts and prerequisites, pake runs hooks on every build,
+    # so does ninja when the output is never made
+    if artefacts and prerequisites:
+        outputs = artefacts if kind == "after" else [a + ".before" for a in artefacts]
+        if kind == "before":
+            command += " && touch " + " ".join(pipes.quote(o) for o in outputs)
+    else:
+        outputs = [os.path.join(configurations.build_dir(),
+                                "build." + parameters.name, kind + ".always")]
+
+    writer.build(outputs, "run", prerequisites + after,
+                 command=command, description="{} {}".format(kind, parameters.name))
+
+    return outputs
+
+
+def _compileable(writer, toolchain, name, target, order_only):
+    parameters = target.common_parameters
+    root_path = parameters.root_path
+
+    include_dirs = target.cxx_parameters.include_dirs.eval()
+    compiler_flags = target.compiler_flags()
+    precompiled_header = target.precompiled_header()
+
+    objects_directory = toolchain.objects_directory(name, include_dirs, compiler_flags,
+                                                    precompiled_header)
+
+    implicit = []
+
+    if precompiled_header:
+        pch_filename = toolchain.precompiled_header_filename(name, precompiled_header)
+        source = os.path.join(root_path, precompiled_header)
+        argv = toolchain.precompiled_header_command(pch_filename, source,
+                                                    include_dirs, compiler_flags)
+
+        writer.build([pch_filename], "compile", [source], order_only=order_only,
+                     command=_in_directory(root_path, _absolute_flags(argv, root_path)
+                                          + ["-MD", "-MF", pch_filename + ".d"]),
+                     depfile=pch_filename + ".d",
+                     description="pch " + precompiled_header)
+        implicit.append(pch_filename)
+
+    object_files = []
+
+    for source in target.sources(toolchain):
+        object_file = toolchain.object_filename(objects_directory, source)
+        object_files.append(object_file)
+
+        path = os.path.join(root_path, source)
+        argv = toolchain.compile_command(name, object_file, path, include_dirs,
+                                         compiler_flags, precompiled_header)
+
+        writer.build([object_file], "compile", [path], implicit, order_only,
+                     command=_in_directory(root_path, _absolute_flags(argv, root_path)
+                                          + ["-MD", "-MF", object_file + ".d"]),
+                     depfile=object_file + ".d",
+                     description="c++ " + source)
+
+    return object_files
+
+
+def _libraries(toolchain, link_with):
+    # libraries from the tree, they are built by edges of their targets
+    ret = []
+
+    for lib in link_with:
+        target = targets.targets.get(lib)
+
+        if isinstance(target, targets.StaticLibrary):
+            ret.append(toolchain.static_library_filename(lib))
+        elif isinstance(target, targets.SharedLibrary):
+            ret.append(toolchain.shared_library_filename(lib))
+
+    return ret
+
+
+def _target(writer, toolchain, name, target, order_only):
+    parameters = target.common_parameters
+    root_path = parameters.root_path
+
+    root_dir = os.getcwd()
+    os.chdir(root_path)
+
+    try:
+        before = _hook(writer, target, "before", parameters.run_before)
+        outputs = []
+
+        if isinstance(target, targets.CompileableTarget):
+            object_files = _compileable(writer, toolchain, name, target, order_only + before)
+
+            # response files are written by ninja, when the edge runs
+            if isinstance(target, targets.Application):
+                artefact = toolchain.application_filename(name)
+                argv = toolchain.link_application_command(artefact, object_files,
+                                                          target.link_with.eval(),
+                                                          target.library_dirs.eval(),
+                                                          write_response_file=False)
+            elif isinstance(target, targets.SharedLibrary):
+                artefact = toolchain.shared_library_filename(name)
+                argv = toolchain.link_shared_library_command(artefact, object_files,
+                                                             target.link_with.eval(),
+                                                             target.library_dirs.eval(),
+                                                             write_response_file=False)
+            else:
+                artefact = toolchain.static_library_filename(name)
+                argv = toolchain.static_library_command(artefact, object_files,
+                                                        write_response_file=False)
+
+            response_file = artefact + ".rsp"
+            link_variables = {}
+            if "@" + response_file in argv:
+                link_variables = {"rspfile": response_file}
+
+            command = _in_directory(root_path, argv)
+            if isinstance(target, targets.StaticLibrary):
+                command = "rm -f {} && {}".format(pipes.quote(artefact), command)
+
+            link_with = getattr(target, "link_with", None)
+            libraries = _libraries(toolchain, link_with.eval()) if link_with else []
+
+            writer.build([artefact], "link" if link_variables else "run", object_files, libraries,
+                         order_only + before, command=command, description="link " + artefact,
+                         **link_variables)
+            outputs.append(artefact)
+
+        outputs += _hook(writer, target, "after", parameters.run_after, before + outputs)
+
+        # laid out the same way pake stages them, with trailing slash only
+        # content of the directory is copied
+        for (index, resource) in enumerate(parameters.resources.eval()):
+            stamp = os.path.join(configurations.build_dir(), "build." + name,
+                                 "resources.{}.always".format(index))
+            source = resource + "." if resource.endswith("/") else resource
+            writer.build([stamp], "run", order_only=outputs or before,
+                         command=_in_directory(root_path, ["cp", "-R", "-p", source,
+                                                           toolchain.build_dir() + "/"]),
+                         description="copy " + resource)
+            outputs.append(stamp)
+
+        writer.build([name], "phony", outputs + before)
+    finally:
+        os.chdir(root_dir)
+
+
+def generate(names):
+    # ninja is run from the source root and looks for build.ninja there
+    filename = "build.ninja"
+    configuration = configurations.get_selected_configuration()
+    toolchain = compiler.Gnu()
+    writer = _Writer()
+
+    writer.lines.append("# generated by pake from {}, changes will be lost".format(configuration))
+    writer.lines.append("")
+
+    writer.rule("compile", command="$command", depfile="$depfile", deps="gcc",
+                description="$description")
+    writer.rule("run", command="$command", description="$description")
+    writer.rule("link", command="$command", rspfile="$rspfile", rspfile_content="$in",
+                description="$description")
+    # build.ninja keeps its mtime when it comes out the same, restat tells
+    # ninja it's up to date anyway
+    writer.rule("regenerate", command="$command", generator="1", restat="1",
+                description="regenerating build.ninja")
+
+    visited = set()
+
+    def visit(name):
+        if name in visited:
+            return
+        visited.add(name)
+
+        if name not in targets.targets:
+            ui.fatal("target {} not found".format(name))
+
+        target = targets.targets[name]
+
+        for dependency in targets.dependencies(name):
+            visit(dependency)
+
+        _target(writer, toolchain, name, target, target.common_parameters.depends_on.eval())
+
+    for name in names:
+        visit(name)
+
+    writer.build([filename], "regenerate", fsutils.pake_files,
+                 command=_in_directory(fsutils.SOURCE_ROOT,
+                                       [sys.executable, os.path.abspath(sys.argv[0])]
+                                       + sys.argv[1:]))
+
+    writer.lines.append("default " + _paths(names))
+
+    if fsutils.write_if_changed(os.path.join(fsutils.SOURCE_ROOT, filename),
+                                "\n".join(writer.lines) + "\n"):
+        ui.bigstep("generated", filename)
+    else:
+        ui.bigstep("up to date", filename)
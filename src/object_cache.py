@@ -0,0 +1,207 @@
+import os
+import errno
+import shutil
+import marshal
+import hashlib
+import threading
+import distutils.spawn
+
+import ui
+import fsutils
+import command_line
+
+_lock = threading.Lock()
+_digests = {}
+_compilers = {}
+_hits = 0
+_misses = 0
+
+
+def enabled():
+    return bool(command_line.args.cache_dir)
+
+
+def _cache_dir():
+    return os.path.abspath(command_line.args.cache_dir)
+
+
+def _entry_filename(key):
+    return os.path.join(_cache_dir(), key[:2], key + ".o")
+
+
+def _stats_filename():
+    return os.path.join(_cache_dir(), "stats")
+
+
+def _file_digest(filename):
+    filename = os.path.abspath(filename)
+    stat = os.stat(filename)
+    cached = _digests.get(filename)
+
+    if cached is not None and cached[0] == (stat.st_size, stat.st_mtime):
+        return cached[1]
+
+    with open(filename, "rb") as f:
+        digest = hashlib.sha1(f.read()).hexdigest()
+
+    _digests[filename] = ((stat.st_size, stat.st_mtime), digest)
+    return digest
+
+
+def _compiler_identity(compiler):
+    if compiler not in _compilers:
+        executable = compiler.split()[0]
+        path = distutils.spawn.find_executable(executable) or executable
+
+        try:
+            stat = os.stat(path)
+            _compilers[compiler] = "{} {} {} {}".format(compiler, os.path.realpath(path),
+                                                        stat.st_size, stat.st_mtime)
+        except OSError:
+            _compilers[compiler] = compiler
+
+    return _compilers[compiler]
+
+
+# direct mode key, made of compiler identity, the command line without output
+# file and digests of the source and every header it includes
+def key(compiler, flags, in_filename, prerequisites):
+    h = hashlib.sha1()
+    h.update(_compiler_identity(compiler) + "\0")
+    h.update("\0".join(flags) + "\0")
+    h.update(in_filename + "\0")
+
+    for prerequisite in prerequisites:
+        h.update(prerequisite + "\0" + _file_digest(prerequisite) + "\0")
+
+    return h.hexdigest()
+
+
+def archive_key(archiver, in_filenames):
+    h = hashlib.sha1()
+    h.update(_compiler_identity(archiver) + "\0")
+
+    # archive members are stored under their base names
+    for in_filename in in_filenames:
+        h.update(os.path.basename(in_filename) + "\0" + _file_digest(in_filename) + "\0")
+
+    return h.hexdigest()
+
+
+def _link_or_copy(source, destination):
+    try:
+        os.link(source, destination)
+    except OSError:
+        shutil.copyfile(source, destination)
+
+
+def _remove_if_exists(filename):
+    try:
+        os.remove(filename)
+    except OSError as e:
+        if e.errno != errno.ENOENT:
+            raise
+
+
+def fetch(key, out_filename):
+    global _hits, _misses
+
+    entry = _entry_filename(key)
+
+    if not os.path.isfile(entry):
+        with _lock:
+            _misses += 1
+        return False
+
+    ui.debug("object cache hit: {} -> {}".format(entry, out_filename))
+
+    # output might be hardlinked to other entry, never write through it
+    _remove_if_exists(out_filename)
+    _link_or_copy(entry, out_filename)
+
+    # object must look fresh to the linker step, this also marks the entry
+    # as recently used
+    os.utime(out_filename, None)
+
+    with _lock:
+        _hits += 1
+
+    return True
+
+
+def store(key, out_filename):
+    entry = _entry_filename(key)
+
+    if os.path.isfile(entry):
+        return
+
+    ui.debug("storing {} in object cache as {}".format(out_filename, entry))
+
+    fsutils.mkdir_recursive(os.path.dirname(entry))
+
+    # write under temporary name first so concurrent builds never see
+    # partial entries
+    temporary = "{}.{}.tmp".format(entry, os.getpid())
+    _link_or_copy(out_filename, temporary)
+    os.rename(temporary, entry)
+
+
+def prepare_output(out_filename):
+    # output might be a hardlink to the cache entry, compiler must not
+    # overwrite it in place
+    _remove_if_exists(out_filename)
+
+
+def _entries():
+    for (dirpath, _, filenames) in os.walk(_cache_dir()):
+        for filename in filenames:
+            if filename.endswith(".o"):
+                path = os.path.join(dirpath, filename)
+                stat = os.stat(path)
+                yield (stat.st_mtime, stat.st_size, path)
+
+
+def _evict():
+    limit = int(command_line.args.cache_size) * 1024 * 1024
+
+    entries = sorted(_entries())
+    total = sum(size for (_, size, _) in entries)
+
+    if total <= limit:
+        return
+
+    ui.debug("object cache exceeds its size ({} > {}), evicting".format(total, limit))
+
+    # drop least recently used entries until we have some room
+    for (_, size, path) in entries:
+        if total <= limit * 0.9:
+            break
+
+        _remove_if_exists(path)
+        total -= size
+
+
+def _load_stats():
+    try:
+        with open(_stats_filename(), "rb") as f:
+            return marshal.load(f)
+    except (IOError, EOFError, ValueError):
+        return {"hits": 0, "misses": 0}
+
+
+def finish():
+    if not enabled() or not (_hits or _misses):
+        return
+
+    stats = _load_stats()
+    stats["hits"] += _hits
+    stats["misses"] += _misses
+
+    fsutils.mkdir_recursive(_cache_dir())
+    with open(_stats_filename(), "wb") as f:
+        marshal.dump(stats, f)
+
+    _evict()
+
+    ui.bigstep("object cache", "{} hits, {} misses (total: {} hits, {} misses)"
+               .format(_hits, _misses, stats["hits"], stats["misses"]))
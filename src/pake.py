@@ -1,11 +1,30 @@
 #!/usr/bin/env python
 
+import os
+import sys
+import time
+import shutil
+import tempfile
+import traceback
+
 import fsutils
 import ui
+import jobs
+import compiler
 import targets
 import variables
 import configurations
+import object_cache
+import remote_cache
+import distributed
 import parser
+import pgo
+import sharding
+import affected
+import query
+import ninja
+import garbage
+import testing
 
 def parse_source_tree():
     for filename in fsutils.pake_files:
@@ -14,20 +33,168 @@ def parse_source_tree():
     configuration = configurations.get_selected_configuration()
     variables.export_special_variables(configuration)
 
+def build_configuration(name, build_targets):
+    configurations.select(name)
+    configuration = configurations.get_selected_configuration()
+    variables.export_special_variables(configuration)
+    targets.forget_built_targets()
+
+    if configuration.name != "__default":
+        ui.bigstep("configuration", str(configuration))
+
+    import command_line
+
+    if sharding.enabled():
+        sharding.assign(targets.compile_actions(command_line.args.target
+                                                or targets.visible_targets()))
+
+    # ninja gets the commands of the configuration as it is
+    if configuration.pgo.eval() and not command_line.args.generate_ninja:
+        pgo.build(configuration, build_targets)
+    else:
+        build_targets()
+
+    if command_line.args.test and not command_line.args.generate_ninja:
+        failed = testing.run(targets.built_targets())
+
+        if failed:
+            ui.fatal("tests failed: {}".format(" ".join(failed)))
+
+    if garbage.enabled():
+        garbage.collect()
+
+def finish():
+    object_cache.finish()
+    remote_cache.finish()
+    sharding.finish()
+    garbage.finish()
+
+def _build_in_child(name, build_targets):
+    # exit status of the forked process
+    jobs.forked()
+
+    try:
+        build_configuration(name, build_targets)
+        finish()
+        return 0
+    except SystemExit as e:
+        return e.code if isinstance(e.code, int) and e.code else 1
+    except BaseException:
+        traceback.print_exc()
+        return 1
+
+def _build_at_once(names, build_targets):
+    # every configuration is built by a process forked after parsing, they
+    # share slots of jobs and include scans through a temporary directory
+    directory = tempfile.mkdtemp(prefix="pake-")
+    jobs.share(directory)
+    compiler.share_scans(directory)
+
+    start = time.time()
+    children = {}
+    results = {}
+
+    try:
+        for name in names:
+            sys.stdout.flush()
+            pid = os.fork()
+
+            if pid == 0:
+                os._exit(_build_in_child(name, build_targets))
+
+            children[pid] = name
+
+        while children:
+            (pid, status) = os.wait()
+            if pid in children:
+                results[children.pop(pid)] = (status == 0, time.time() - start)
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    return [(name,) + results[name] for name in names]
+
+def _build_one_by_one(names, build_targets):
+    results = []
+    root_dir = os.getcwd()
+
+    for name in names:
+        start = time.time()
+        try:
+            build_configuration(name, build_targets)
+            results.append((name, True, time.time() - start))
+        except SystemExit:
+            # failed target can leave us in its directory
+            os.chdir(root_dir)
+            results.append((name, False, time.time() - start))
+
+    finish()
+
+    return results
+
+def build_configurations(names, build_targets):
+    # tree is parsed once and failure of one configuration doesn't stop the
+    # others. Shards collect objects of all configurations into one bundle
+    # and there is one build.ninja, so those are done in turn
+    import command_line
+
+    if sharding.enabled() or sharding.merging() or command_line.args.generate_ninja:
+        results = _build_one_by_one(names, build_targets)
+    else:
+        results = _build_at_once(names, build_targets)
+
+    ui.bigstep("summary", "{} configurations".format(len(results)))
+    for (name, succeeded, seconds) in results:
+        ui.info("  {} {} ({:.1f}s)".format(name, "ok" if succeeded else "FAILED", seconds))
+
+    return all(succeeded for (_, succeeded, _) in results)
+
 def main():
     import command_line
 
+    if command_line.args.command == "worker":
+        distributed.serve()
+        return
+
     parse_source_tree()
 
-    configuration = configurations.get_selected_configuration()
-    if configuration.name != "__default":
-        ui.bigstep("configuration", str(configurations.get_selected_configuration()))
+    if command_line.args.command == "query":
+        query.run()
+        return
+
+    def build_targets():
+        if command_line.args.generate_ninja:
+            ninja.generate(command_line.args.target or targets.visible_targets())
+        elif affected.enabled():
+            targets.build_targets(affected.affected_targets(command_line.args.target
+                                                            or targets.visible_targets()))
+        elif command_line.args.target:
+            targets.build_targets(command_line.args.target)
+        elif command_line.args.all:
+            targets.build_all()
+        elif command_line.args.test:
+            targets.build_targets([name for name in targets.visible_targets()
+                                   if isinstance(targets.targets[name], targets.Test)])
+
+    # --gc alone only cleans up
+    if (command_line.args.target or command_line.args.all or affected.enabled()
+            or command_line.args.generate_ninja or command_line.args.gc
+            or command_line.args.test):
+        names = configurations.requested()
+
+        if sharding.enabled() and sharding.merging():
+            ui.fatal("--shard and --merge-shards can't be used together")
+
+        if sharding.enabled() and command_line.args.test:
+            ui.fatal("--shard doesn't link, so there is nothing to test")
+
+        if sharding.merging():
+            sharding.import_bundles()
 
-    if command_line.args.target:
-        for target in command_line.args.target:
-            targets.build(target)
-    elif command_line.args.all:
-        targets.build_all()
+        if len(names) == 1:
+            build_configuration(names[0], build_targets)
+            finish()
+        elif not build_configurations(names, build_targets):
+            sys.exit(1)
     else:
         ui.info("no target selected\n")
 
@@ -11,14 +11,18 @@ from variables import Variable
 def parse(filename):
     Module(filename)
 
-class CommonTargetParameters:
+class CommonTargetParameters(object):
+    __slots__ = ("root_path", "module_name", "name", "artefacts",
+                 "prerequisites", "depends_on", "run_before", "run_after",
+                 "resources", "visible_in")
+
     def __init__(self, root_path, module_name, name):
         assert isinstance(module_name, str)
         assert isinstance(name, str)
 
-        self.root_path = root_path
-        self.module_name = module_name
-        self.name = name
+        self.root_path = intern(root_path)
+        self.module_name = intern(module_name)
+        self.name = intern(name)
         self.artefacts = Variable()
         self.prerequisites = Variable()
         self.depends_on = Variable()
@@ -28,11 +32,18 @@ class CommonTargetParameters:
         self.visible_in = Variable()
 
 
-class CxxParameters:
+class CxxParameters(object):
+    __slots__ = ("sources", "include_dirs", "compiler_flags",
+                 "precompiled_header", "unity", "unity_exclude",
+                 "built_targets")
+
     def __init__(self):
         self.sources = Variable()
         self.include_dirs = Variable()
         self.compiler_flags = Variable()
+        self.precompiled_header = Variable()
+        self.unity = Variable()
+        self.unity_exclude = Variable()
         self.built_targets = Variable()
 
 
@@ -65,14 +76,14 @@ class Module:
         elif token == lexer.Token.VARIABLE:
             return variables.ReferenceToVariable(self.name, token.content)
         elif token == lexer.Token.QUOTED_LITERAL:
-            return variables.Literal(self.name, token.content)
+            return variables.Literal(self.name, token.content, token)
 
         return None
 
     def __get_module_name(self, filename):
         base = os.path.basename(filename)
         (root, ext) = os.path.splitext(base)
-        return root
+        return intern(root)
 
     def __parse_set_or_append(self, it, append):
         token = it.next()
@@ -81,6 +92,8 @@ class Module:
         else:
             ui.parse_error(token)
 
+        variables.definitions[(self.name, variable_name)].append(token.location)
+
         second_add = False
         while True:
             token = it.next()
@@ -168,6 +181,12 @@ class Module:
         elif token.content == "visible_in":
             common_parameters.visible_in = self.__parse_list(it)
             return True
+        elif token.content == "artefacts":
+            common_parameters.artefacts = self.__parse_list(it)
+            return True
+        elif token.content == "prerequisites":
+            common_parameters.prerequisites = self.__parse_list(it)
+            return True
 
         return False
 
@@ -181,6 +200,15 @@ class Module:
         elif token.content == "compiler_flags":
             cxx_parameters.compiler_flags = self.__parse_list(it)
             return True
+        elif token.content == "precompiled_header":
+            cxx_parameters.precompiled_header = self.__parse_list(it)
+            return True
+        elif token.content == "unity":
+            cxx_parameters.unity = self.__parse_list(it)
+            return True
+        elif token.content == "unity_exclude":
+            cxx_parameters.unity_exclude = self.__parse_list(it)
+            return True
 
         return False
 
@@ -211,6 +239,42 @@ class Module:
         target = targets.Application(common_parameters, cxx_parameters, link_with, library_dirs)
         targets.add_target(target)
 
+    def __parse_test(self, target_name, it):
+        link_with = variables.Variable()
+        library_dirs = variables.Variable()
+        arguments = variables.Variable()
+        data = variables.Variable()
+        timeout = variables.Variable()
+        shards = variables.Variable()
+
+        common_parameters = CommonTargetParameters(
+            os.path.dirname(self.filename),
+            self.name,
+            target_name)
+
+        cxx_parameters = CxxParameters()
+
+        while True:
+            token = it.next()
+            if token == lexer.Token.LITERAL:
+                if self.__try_parse_target_common_parameters(common_parameters, token, it): pass
+                elif self.__try_parse_cxx_parameters(cxx_parameters, token, it): pass
+                elif token.content == "link_with": link_with = self.__parse_list(it)
+                elif token.content == "library_dirs": library_dirs = self.__parse_list(it)
+                elif token.content == "arguments": arguments = self.__parse_list(it)
+                elif token.content == "data": data = self.__parse_list(it)
+                elif token.content == "timeout": timeout = self.__parse_list(it)
+                elif token.content == "shards": shards = self.__parse_list(it)
+                else: ui.parse_error(token)
+            elif token == lexer.Token.NEWLINE:
+                break
+            else:
+                ui.parse_error(token)
+
+        target = targets.Test(common_parameters, cxx_parameters, link_with, library_dirs,
+                              arguments, data, timeout, shards)
+        targets.add_target(target)
+
     def __parse_static_library(self, target_name, it):
         common_parameters = CommonTargetParameters(
             os.path.dirname(self.filename),
@@ -233,6 +297,36 @@ class Module:
         target = targets.StaticLibrary(common_parameters, cxx_parameters)
         targets.add_target(target)
 
+    def __parse_shared_library(self, target_name, it):
+        link_with = variables.Variable()
+        library_dirs = variables.Variable()
+        relink_dependents = variables.Variable()
+
+        common_parameters = CommonTargetParameters(
+            os.path.dirname(self.filename),
+            self.name,
+            target_name)
+
+        cxx_parameters = CxxParameters()
+
+        while True:
+            token = it.next()
+            if token == lexer.Token.LITERAL:
+                if self.__try_parse_target_common_parameters(common_parameters, token, it): pass
+                elif self.__try_parse_cxx_parameters(cxx_parameters, token, it): pass
+                elif token.content == "link_with": link_with = self.__parse_list(it)
+                elif token.content == "library_dirs": library_dirs = self.__parse_list(it)
+                elif token.content == "relink_dependents": relink_dependents = self.__parse_list(it)
+                else: ui.parse_error(token)
+            elif token == lexer.Token.NEWLINE:
+                break
+            else:
+                ui.parse_error(token)
+
+        target = targets.SharedLibrary(common_parameters, cxx_parameters, link_with, library_dirs,
+                                       relink_dependents)
+        targets.add_target(target)
+
     def __parse_phony(self, target_name, it):
         common_parameters = CommonTargetParameters(
             os.path.dirname(self.filename),
@@ -245,8 +339,6 @@ class Module:
             token = it.next()
             if token == lexer.Token.LITERAL:
                 if self.__try_parse_target_common_parameters(common_parameters, token, it): pass
-                elif token.content == "artefacts": common_parameters.artefacts = self.__parse_list(it)
-                elif token.content == "prerequisites": common_parameters.prerequisites = self.__parse_list(it)
                 else: ui.parse_error(token)
 
             elif token == lexer.Token.NEWLINE:
@@ -272,7 +364,9 @@ class Module:
 
         if target_type == "application":       self.__parse_application_target(target_name, it)
         elif target_type == "static_library":  self.__parse_static_library(target_name, it)
+        elif target_type == "shared_library":  self.__parse_shared_library(target_name, it)
         elif target_type == "phony":           self.__parse_phony(target_name, it)
+        elif target_type == "test":            self.__parse_test(target_name, it)
         else: ui.parse_error(token, msg="unknown target type: " + target_type)
 
     def __parse_configuration(self, it):
@@ -293,6 +387,14 @@ class Module:
                 elif token.content == "application_suffix": configuration.application_suffix = self.__parse_list(it)
                 elif token.content == "compiler_flags": configuration.compiler_flags = self.__parse_list(it)
                 elif token.content == "linker_flags": configuration.linker_flags = self.__parse_list(it)
+                elif token.content == "precompiled_header": configuration.precompiled_header = self.__parse_list(it)
+                elif token.content == "unity": configuration.unity = self.__parse_list(it)
+                elif token.content == "thin_archives": configuration.thin_archives = self.__parse_list(it)
+                elif token.content == "linker": configuration.linker = self.__parse_list(it)
+                elif token.content == "linker_threads": configuration.linker_threads = self.__parse_list(it)
+                elif token.content == "split_dwarf": configuration.split_dwarf = self.__parse_list(it)
+                elif token.content == "response_files": configuration.response_files = self.__parse_list(it)
+                elif token.content == "pgo": configuration.pgo = self.__parse_list(it)
                 elif token.content == "export": configuration.export = self._parse_configuration_export(it)
                 else: ui.parse_error(token)
 
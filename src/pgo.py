@@ -0,0 +1,162 @@
+import os
+import copy
+import glob
+import hashlib
+import threading
+
+import ui
+import fsutils
+import shell
+import targets
+import variables
+import configurations
+
+# Profile guided optimization is done in two builds of the same targets. First
+# one goes to <configuration>-pgo-generate and is instrumented, then training
+# commands from pgo(...) are run, profiles are merged into
+# <configuration>/pgo and the second build uses them. Training commands run
+# in the shell with the environment of __configuration, from the source root.
+# Instrumented objects are never compiled by workers, the profile path is
+# baked into them.
+
+GENERATE = "generate"
+USE = "use"
+
+_lock = threading.Lock()
+_instrumented = {}
+
+
+def stage():
+    return configurations.get_selected_configuration().pgo_stage
+
+
+def is_clang():
+    return "clang" in configurations.compiler()
+
+
+def profile_dir(configuration_name):
+    return fsutils.build_dir(configuration_name) + "/pgo"
+
+
+def raw_profile_dir():
+    return configurations.build_dir() + "/pgo-raw"
+
+
+def clang_profile():
+    return profile_dir(configurations.get_selected_configuration().name) + "/default.profdata"
+
+
+def _gcc_profile(configuration_name, source):
+    return "{}/{}.gcda".format(profile_dir(configuration_name),
+                               hashlib.sha1(os.path.abspath(source)).hexdigest())
+
+
+def _gcc_data_file(object_filename):
+    # gcc puts profile next to object, named after it without .o
+    return os.path.splitext(object_filename)[0] + ".gcda"
+
+
+def record_instrumented(out_filename, in_filename):
+    with _lock:
+        _instrumented[out_filename] = os.path.abspath(in_filename)
+
+
+def stage_profile(out_filename, in_filename):
+    # returns the profile object depends on, compiler expects gcc profiles
+    # next to the object so it's copied there, but only when it changed
+    if is_clang():
+        profile = clang_profile()
+        return profile if os.path.exists(profile) else None
+
+    profile = _gcc_profile(configurations.get_selected_configuration().name, in_filename)
+    data_file = _gcc_data_file(out_filename)
+
+    if not os.path.exists(profile):
+        if os.path.exists(data_file):
+            os.remove(data_file)
+        return None
+
+    fsutils.mkdir_recursive(os.path.dirname(data_file))
+    fsutils.copy_if_changed(profile, data_file)
+    return data_file
+
+
+def _training_stamp(configuration):
+    return profile_dir(configuration.name) + "/trained"
+
+
+def _needs_training(configuration):
+    outputs = list(_instrumented) + fsutils.pake_files
+    return fsutils.is_any_newer_than(outputs, _training_stamp(configuration))
+
+
+def _train(configuration):
+    if is_clang():
+        for raw in glob.glob(raw_profile_dir() + "/*.profraw"):
+            os.remove(raw)
+    else:
+        for out_filename in _instrumented:
+            if os.path.exists(_gcc_data_file(out_filename)):
+                os.remove(_gcc_data_file(out_filename))
+
+    env = variables.environment("__configuration")
+
+    for cmd in configuration.pgo.eval():
+        ui.step("train", cmd)
+        shell.execute(cmd, env=env)
+
+
+def _merge(configuration):
+    fsutils.mkdir_recursive(profile_dir(configuration.name))
+
+    if is_clang():
+        raw_profiles = glob.glob(raw_profile_dir() + "/*.profraw")
+        if not raw_profiles:
+            ui.warning("training didn't produce any profiles, is pgo(...) running instrumented binaries?")
+            return
+
+        merged = raw_profile_dir() + "/merged.profdata"
+        shell.run(["llvm-profdata", "merge", "-output=" + merged] + raw_profiles)
+        fsutils.copy_if_changed(merged, clang_profile())
+    else:
+        for (out_filename, source) in _instrumented.items():
+            data_file = _gcc_data_file(out_filename)
+            if os.path.exists(data_file):
+                fsutils.copy_if_changed(data_file, _gcc_profile(configuration.name, source))
+
+    open(_training_stamp(configuration), "w").close()
+
+
+def _select(configuration):
+    configurations.select(configuration.name)
+    variables.export_special_variables(configuration)
+    targets.forget_built_targets()
+
+
+def build(configuration, build_targets):
+    _instrumented.clear()
+
+    generate = copy.copy(configuration)
+    generate.name = configuration.name + "-pgo-generate"
+    generate.pgo_stage = GENERATE
+    configurations.add_configuration(generate)
+
+    ui.bigstep("pgo", "building instrumented variant")
+
+    _select(generate)
+    build_targets()
+
+    if _needs_training(configuration):
+        ui.bigstep("pgo", "training")
+        _train(configuration)
+
+        ui.bigstep("pgo", "merging profiles")
+        _merge(configuration)
+    else:
+        ui.bigstep("pgo", "instrumented variant didn't change, keeping profiles")
+
+    ui.bigstep("pgo", "building optimized variant")
+
+    configuration.pgo_stage = USE
+    _select(configuration)
+    build_targets()
@@ -0,0 +1,135 @@
+import os
+import collections
+
+import ui
+import fsutils
+import compiler
+import targets
+import variables
+import command_line
+
+# pake.py --query answers from the parsed tree and include caches of the last
+# build, nothing is scanned or compiled
+
+
+def _target(name):
+    if name not in targets.targets:
+        ui.fatal("target {} not found".format(name))
+
+    return targets.targets[name]
+
+
+def _closure(names, edges):
+    visited = set()
+    pending = list(names)
+
+    while pending:
+        for edge in edges(pending.pop()):
+            if edge not in visited:
+                visited.add(edge)
+                pending.append(edge)
+
+    return sorted(visited - set(names))
+
+
+def _dependents_index():
+    index = collections.defaultdict(set)
+
+    for name in targets.targets:
+        for dependency in targets.dependencies(name):
+            index[dependency].add(name)
+
+    return index
+
+
+def _compiled_sources(name, toolchain):
+    # yields (source, object, includes from the last build) of the target,
+    # working directory is target's one meanwhile
+    target = targets.targets[name]
+
+    if not isinstance(target, targets.CompileableTarget):
+        return
+
+    root_dir = os.getcwd()
+    os.chdir(target.common_parameters.root_path)
+
+    try:
+        objects_directory = toolchain.objects_directory(name,
+                                                        target.cxx_parameters.include_dirs.eval(),
+                                                        target.compiler_flags(),
+                                                        target.precompiled_header())
+
+        for source in target.sources(toolchain):
+            yield (source, toolchain.object_filename(objects_directory, source),
+                   toolchain.cached_includes(name, source))
+    finally:
+        os.chdir(root_dir)
+
+
+def deps(names):
+    for name in names:
+        _target(name)
+
+    for dependency in _closure(names, targets.dependencies):
+        ui.info(dependency)
+
+
+def rdeps(names):
+    for name in names:
+        _target(name)
+
+    index = _dependents_index()
+
+    for dependent in _closure(names, lambda name: index[name]):
+        ui.info(dependent)
+
+
+def includers(headers):
+    toolchain = compiler.Gnu()
+    headers = set(os.path.abspath(header) for header in headers)
+
+    for name in sorted(targets.targets):
+        root_path = targets.targets[name].common_parameters.root_path
+
+        for (source, _, includes) in _compiled_sources(name, toolchain):
+            included = set(os.path.normpath(os.path.join(root_path, include))
+                           for include in includes or [])
+
+            if included & headers:
+                ui.info("{} {}".format(name, source))
+
+
+def why_rebuild(names):
+    toolchain = compiler.Gnu()
+
+    for name in names:
+        _target(name)
+
+        for (source, object_filename, includes) in _compiled_sources(name, toolchain):
+            if not os.path.exists(object_filename):
+                ui.info("{} {}: not built yet".format(name, source))
+            elif includes is None:
+                ui.info("{} {}: includes not scanned yet".format(name, source))
+            else:
+                newer = [prerequisite for prerequisite in includes + [source] + fsutils.pake_files
+                         if not os.path.exists(prerequisite)
+                         or fsutils.get_mtime(prerequisite) > fsutils.get_mtime(object_filename)]
+
+                if newer:
+                    ui.info("{} {}: {} changed".format(name, source, " ".join(newer)))
+
+
+def where(names):
+    for name in names:
+        module, _, variable = name.lstrip("$").rpartition(".")
+
+        for location in variables.definitions.get((module, "$" + variable), []):
+            ui.info("{} {!s}".format(name, location))
+
+
+def run():
+    {"deps": deps,
+     "rdeps": rdeps,
+     "includers": includers,
+     "why-rebuild": why_rebuild,
+     "where": where}[command_line.args.kind](command_line.args.names)
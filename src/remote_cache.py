@@ -0,0 +1,173 @@
+import os
+import json
+import time
+import Queue
+import socket
+import httplib
+import hashlib
+import urllib2
+import threading
+
+import ui
+import command_line
+
+# remote cache is a plain HTTP server which keeps content addressed blobs
+# under <url>/cas/<digest> and action results (json manifests pointing to
+# blobs) under <url>/ac/<key>
+
+_uploads = Queue.Queue()
+_uploader = None
+_lock = threading.Lock()
+_unreachable = False
+_hits = 0
+_misses = 0
+
+
+def enabled():
+    return bool(command_line.args.remote_cache) and not _unreachable
+
+
+def _url(kind, name):
+    return "{}/{}/{}".format(command_line.args.remote_cache.rstrip("/"), kind, name)
+
+
+def _give_up(reason):
+    global _unreachable
+
+    with _lock:
+        if not _unreachable:
+            ui.warning("remote cache disabled for this build: {!s}".format(reason))
+        _unreachable = True
+
+
+def _get(kind, name):
+    try:
+        response = urllib2.urlopen(_url(kind, name),
+                                   timeout=float(command_line.args.remote_cache_timeout))
+        return response.read()
+    except urllib2.HTTPError as e:
+        if e.code != 404:
+            _give_up(e)
+    except (urllib2.URLError, socket.error, IOError, httplib.HTTPException) as e:
+        _give_up(e)
+    except Exception as e:
+        # whatever goes wrong, object is built locally
+        _give_up(e)
+
+    return None
+
+
+def _put(kind, name, data):
+    request = urllib2.Request(_url(kind, name), data=data)
+    request.get_method = lambda: "PUT"
+    request.add_header("Content-Type", "application/octet-stream")
+
+    try:
+        urllib2.urlopen(request, timeout=float(command_line.args.remote_cache_timeout)).read()
+    except (urllib2.URLError, socket.error, IOError, httplib.HTTPException) as e:
+        _give_up(e)
+    except Exception as e:
+        _give_up(e)
+
+
+def fetch(key, out_filename):
+    global _hits, _misses
+
+    manifest = _get("ac", key)
+    data = None
+
+    if manifest is not None:
+        try:
+            digest = json.loads(manifest)["digest"]
+            data = _get("cas", digest)
+            if data is not None and hashlib.sha1(data).hexdigest() != digest:
+                ui.debug("corrupted blob {} in remote cache".format(digest))
+                data = None
+        except (ValueError, KeyError, TypeError):
+            ui.debug("malformed manifest {} in remote cache".format(key))
+
+    if data is None:
+        with _lock:
+            _misses += 1
+        return False
+
+    ui.debug("remote cache hit: {} -> {}".format(key, out_filename))
+
+    temporary = "{}.{}.tmp".format(out_filename, os.getpid())
+    with open(temporary, "wb") as f:
+        f.write(data)
+    os.rename(temporary, out_filename)
+
+    with _lock:
+        _hits += 1
+
+    return True
+
+
+def _upload_worker():
+    while True:
+        (key, data) = _uploads.get()
+
+        # failed upload must not end the thread, finish() waits for the rest
+        try:
+            if enabled():
+                digest = hashlib.sha1(data).hexdigest()
+                _put("cas", digest, data)
+                _put("ac", key, json.dumps({"digest": digest, "size": len(data)}))
+        except Exception as e:
+            _give_up(e)
+        finally:
+            _uploads.task_done()
+
+
+def store(key, out_filename):
+    global _uploader
+
+    if not enabled():
+        return
+
+    with open(out_filename, "rb") as f:
+        data = f.read()
+
+    with _lock:
+        if _uploader is None:
+            _uploader = threading.Thread(target=_upload_worker)
+            _uploader.daemon = True
+            _uploader.start()
+
+    # uploads never block the build, they are finished in finish()
+    _uploads.put((key, data))
+
+
+def _wait_for_uploads():
+    # like _uploads.join(), but gives up when uploads stop making progress,
+    # so broken cache never hangs the build, and waits with timeout so ^C
+    # still works
+    patience = 2 * float(command_line.args.remote_cache_timeout) + 1
+
+    with _uploads.all_tasks_done:
+        left = _uploads.unfinished_tasks
+        deadline = time.time() + patience
+
+        while _uploads.unfinished_tasks:
+            if _uploads.unfinished_tasks < left:
+                left = _uploads.unfinished_tasks
+                deadline = time.time() + patience
+
+            if time.time() >= deadline:
+                _give_up("{} uploads didn't finish in time".format(left))
+                return
+
+            _uploads.all_tasks_done.wait(min(1, deadline - time.time()))
+
+
+def finish():
+    if not command_line.args.remote_cache:
+        return
+
+    if _uploader is not None:
+        ui.debug("waiting for uploads to the remote cache")
+        _wait_for_uploads()
+
+    if _hits or _misses:
+        ui.bigstep("remote cache", "{} hits, {} misses".format(_hits, _misses))
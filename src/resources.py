@@ -0,0 +1,151 @@
+import os
+import errno
+import fcntl
+import shutil
+import marshal
+
+import ui
+import fsutils
+import jobs
+
+# Resources are staged into the build directory by pake itself. Manifest of
+# the target remembers (source, size, mtime, digest) of every staged file, so
+# unchanged files are only stat'ed, touched ones are hashed and only changed
+# ones are staged again. Staged files are reflinks or hardlinks of sources
+# when filesystem allows and copies otherwise. Files the target doesn't list
+# anymore are removed.
+
+# ioctl cloning a file on btrfs, xfs and others
+_FICLONE = 0x40049409
+
+
+def manifest_filename(toolchain, target_name):
+    return toolchain.cache_directory(target_name) + "resources.manifest"
+
+
+def files(root_path, resource, build_dir):
+    # (source, destination) of every file of the resource, laid out like
+    # rsync -r does: directory is staged with its name, with trailing slash
+    # only its content is
+    source = os.path.normpath(os.path.join(root_path, resource))
+
+    if resource.endswith("/"):
+        destination = build_dir
+    else:
+        destination = os.path.join(build_dir, os.path.basename(source))
+
+    if not os.path.isdir(source):
+        return [(source, destination)]
+
+    ret = []
+
+    for (dirpath, _, filenames) in os.walk(source):
+        for filename in sorted(filenames):
+            path = os.path.join(dirpath, filename)
+            ret.append((path, os.path.join(destination, os.path.relpath(path, source))))
+
+    return ret
+
+
+def _load(filename):
+    try:
+        with open(filename, "rb") as f:
+            return marshal.load(f)
+    except (IOError, EOFError, ValueError):
+        return {}
+
+
+def _reflink(source, destination):
+    try:
+        with open(source, "rb") as src:
+            with open(destination, "wb") as dst:
+                fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+    except (IOError, OSError):
+        if os.path.lexists(destination):
+            os.remove(destination)
+        return False
+
+    shutil.copystat(source, destination)
+
+    return True
+
+
+def _link_or_copy(source, destination):
+    fsutils.mkdir_recursive(os.path.dirname(destination))
+
+    # hardlink shares the file with the source, so it's never written into
+    if os.path.lexists(destination):
+        os.remove(destination)
+
+    if _reflink(source, destination):
+        return
+
+    try:
+        os.link(source, destination)
+    except OSError:
+        shutil.copy2(source, destination)
+
+
+def _remove(destination, build_dir):
+    try:
+        os.remove(destination)
+    except OSError as e:
+        if e.errno != errno.ENOENT:
+            raise
+
+    directory = os.path.dirname(destination)
+
+    while directory.startswith(build_dir + os.sep) and not os.listdir(directory):
+        os.rmdir(directory)
+        directory = os.path.dirname(directory)
+
+
+def _stage_file(root_path, source, destination, previous):
+    try:
+        st = os.stat(source)
+    except OSError as e:
+        raise Exception("can't stage {}: {!s}".format(source, e))
+
+    staged = os.path.exists(destination)
+
+    if staged and previous and previous[:3] == (source, st.st_size, st.st_mtime):
+        return previous
+
+    digest = fsutils.digest(source)
+
+    # touched, but the same
+    if staged and previous and previous[0] == source and previous[3] == digest:
+        return (source, st.st_size, st.st_mtime, digest)
+
+    ui.step("copy", os.path.relpath(source, root_path))
+    _link_or_copy(source, destination)
+
+    return (source, st.st_size, st.st_mtime, digest)
+
+
+def stage(root_path, evaluated_resources, build_dir, manifest):
+    previous = _load(manifest)
+    current = {}
+
+    for resource in evaluated_resources:
+        for (source, destination) in files(root_path, resource, build_dir):
+            current[destination] = _stage_file(root_path, source, destination,
+                                               previous.get(destination))
+
+    for destination in sorted(set(previous) - set(current)):
+        ui.debug("removing " + destination)
+        _remove(destination, build_dir)
+
+    if current != previous:
+        fsutils.mkdir_recursive(os.path.dirname(manifest))
+        with open(manifest, "wb") as f:
+            marshal.dump(current, f)
+
+
+def start(root_path, evaluated_resources, build_dir, manifest):
+    # stages in the pool, so it goes along with compiles of the target
+    def run():
+        with jobs.slot():
+            stage(root_path, evaluated_resources, build_dir, manifest)
+
+    return jobs.start([run])
@@ -0,0 +1,183 @@
+import os
+import marshal
+import tarfile
+import StringIO
+import threading
+
+import ui
+import fsutils
+import command_line
+import configurations
+
+# --shard I/N compiles only I-th part of the objects of requested targets and
+# packs them into a bundle, --merge-shards imports bundles of all the shards
+# and does the links. Objects are split by compile times recorded by earlier
+# builds, so every shard has to see the same compile_times file to compute
+# the same split. Without records, size of the source is used instead.
+
+_lock = threading.Lock()
+_times = {}
+_assigned = None
+_bundled = []
+_imported = set()
+
+_TIMES_MEMBER = "compile_times"
+
+
+def enabled():
+    return bool(command_line.args.shard)
+
+
+def _shard():
+    try:
+        index, count = [int(part) for part in command_line.args.shard.split("/")]
+    except ValueError:
+        ui.fatal("--shard expects I/N, got: {}".format(command_line.args.shard))
+
+    if not 1 <= index <= count:
+        ui.fatal("shard {} is out of range 1..{}".format(index, count))
+
+    return index, count
+
+
+def _times_filename():
+    return fsutils.BUILD_ROOT + "/compile_times"
+
+
+def _bundle_filename():
+    return "{}/shard-{}-of-{}.tar".format(fsutils.BUILD_ROOT, *_shard())
+
+
+def _key(target_name, source):
+    return "\0".join([configurations.get_selected_configuration().name, target_name, source])
+
+
+def _load_times():
+    try:
+        with open(_times_filename(), "rb") as f:
+            return marshal.load(f)
+    except (IOError, EOFError, ValueError):
+        return {}
+
+
+def record_compile_time(target_name, source, seconds):
+    with _lock:
+        _times[_key(target_name, source)] = seconds
+
+
+def assign(actions):
+    # actions are (target name, source, source path) of every object which
+    # requested targets need
+    global _assigned
+
+    index, count = _shard()
+    recorded = _load_times()
+
+    def weight(action):
+        (target_name, source, path) = action
+        key = _key(target_name, source)
+
+        if recorded:
+            return recorded.get(key, sum(recorded.values()) / len(recorded))
+
+        try:
+            return os.path.getsize(path)
+        except OSError:
+            return 0
+
+    # longest first to the least loaded shard, ties are broken by names so
+    # the split doesn't depend on anything but the tree and the records
+    loads = [0] * count
+    _assigned = set()
+
+    for (cost, target_name, source) in sorted(((weight(action), action[0], action[1])
+                                               for action in actions),
+                                              key=lambda a: (-a[0], a[1], a[2])):
+        shard = min(range(count), key=lambda i: (loads[i], i))
+        loads[shard] += cost
+
+        if shard == index - 1:
+            _assigned.add((target_name, source))
+
+    ui.bigstep("shard", "{}/{} compiles {} of {} objects"
+               .format(index, count, len(_assigned), len(actions)))
+
+
+def is_assigned(target_name, source):
+    return _assigned is None or (target_name, source) in _assigned
+
+
+def bundle(object_filename):
+    with _lock:
+        _bundled.append(object_filename)
+
+
+def merging():
+    return bool(command_line.args.merge_shards)
+
+
+def _member_path(member):
+    path = os.path.normpath(os.path.join(fsutils.BUILD_ROOT, member.name))
+
+    if not path.startswith(fsutils.BUILD_ROOT + os.sep) or not member.isfile():
+        ui.fatal("unexpected {} in shard bundle".format(member.name))
+
+    return path
+
+
+def import_bundles():
+    for filename in command_line.args.merge_shards.split(","):
+        ui.bigstep("import", filename)
+
+        try:
+            with tarfile.open(filename) as tar:
+                for member in tar.getmembers():
+                    if member.name == _TIMES_MEMBER:
+                        _times.update(marshal.loads(tar.extractfile(member).read()))
+                        continue
+
+                    path = _member_path(member)
+                    tar.extract(member, fsutils.BUILD_ROOT)
+                    _imported.add(path)
+        except (IOError, tarfile.TarError) as e:
+            ui.fatal("can't import shard bundle {}: {!s}".format(filename, e))
+
+
+def is_imported(object_filename):
+    return os.path.normpath(object_filename) in _imported
+
+
+def _write_bundle():
+    filename = _bundle_filename()
+
+    ui.bigstep("bundle", filename)
+
+    fsutils.mkdir_recursive(fsutils.BUILD_ROOT)
+
+    with tarfile.open(filename, "w") as tar:
+        for object_filename in sorted(set(_bundled)):
+            # split dwarf leaves debug info next to the object
+            dwo_filename = os.path.splitext(object_filename)[0] + ".dwo"
+
+            for path in [object_filename, dwo_filename]:
+                if os.path.exists(path):
+                    tar.add(path, arcname=os.path.relpath(path, fsutils.BUILD_ROOT))
+
+        times = marshal.dumps(_times)
+        info = tarfile.TarInfo(_TIMES_MEMBER)
+        info.size = len(times)
+        tar.addfile(info, StringIO.StringIO(times))
+
+
+def finish():
+    # shards keep their times in the bundle, records they split by must stay
+    # the same for all of them
+    if enabled():
+        _write_bundle()
+    elif _times:
+        times = _load_times()
+        times.update(_times)
+
+        fsutils.mkdir_recursive(fsutils.BUILD_ROOT)
+        with open(_times_filename(), "wb") as f:
+            marshal.dump(times, f)
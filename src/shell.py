@@ -1,17 +1,72 @@
+import errno
+import pipes
+import shlex
 import subprocess
 
 import ui
 
-def execute(command, capture_output = False):
+# commands from pake files (run_before, run_after...) are shell scripts, but
+# the ones made by pake are argument vectors and they run without the shell
+
+
+def execute(command, capture_output = False, env = None, cwd = None):
     out = ''
     try:
         if capture_output:
-            out = subprocess.check_output(command, shell=True)
+            out = subprocess.check_output(command, shell=True, env=env, cwd=cwd)
         else:
-            subprocess.check_call(command, shell=True)
+            subprocess.check_call(command, shell=True, env=env, cwd=cwd)
     except subprocess.CalledProcessError as e:
         raise Exception("command exited with error({}): {}".format(str(e.returncode), command))
 
     ui.debug("command completed: " + command)
     return out
 
+
+def split(command):
+    # compiler, flags and the like are written by user as in the shell
+    return shlex.split(command)
+
+
+def quote(argv):
+    return " ".join(pipes.quote(arg) for arg in argv)
+
+
+def _spawn(argv, env, capture_output):
+    return subprocess.Popen(argv, env=env,
+                            stdout=subprocess.PIPE,
+                            stderr=subprocess.PIPE if capture_output else subprocess.STDOUT)
+
+
+def run(argv, capture_output=False, env=None):
+    # output is collected and printed at once, so diagnostics of jobs running
+    # in parallel don't interleave
+    try:
+        process = _spawn(argv, env, capture_output)
+    except OSError as e:
+        # scripts without #! are run by the shell, like execvp(3) does
+        if e.errno != errno.ENOEXEC:
+            raise Exception("can't run {}: {!s}".format(argv[0], e))
+        process = _spawn(["/bin/sh"] + argv, env, capture_output)
+
+    (out, err) = process.communicate()
+
+    if not capture_output and out:
+        ui.info(out.rstrip("\n"))
+
+    if process.returncode != 0:
+        if capture_output and err:
+            ui.info(err.rstrip("\n"))
+        raise Exception("command exited with error({}): {}".format(process.returncode, quote(argv)))
+
+    ui.debug("command completed: " + quote(argv))
+    return out if capture_output else ''
+
+
+def response_file(filename, arguments):
+    # gcc, clang and binutils read @file the same way
+    with open(filename, "w") as f:
+        for argument in arguments:
+            f.write('"{}"\n'.format(argument.replace("\\", "\\\\").replace('"', '\\"')))
+
+    return "@" + filename
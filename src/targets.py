@@ -1,16 +1,19 @@
 import os
-import threading
+import functools
 
 import ui
 import fsutils
 import compiler
-import shell
-import variables
 import configurations
-import command_line
+import jobs
+import sharding
+import garbage
+import resources
+import hooks
 
 targets = {}
 _built_targets = []
+_hooks_run = set()
 
 
 def add_target(target):
@@ -19,6 +22,11 @@ def add_target(target):
     targets[target.common_parameters.name] = target
 
 
+def forget_built_targets():
+    del _built_targets[:]
+    _hooks_run.clear()
+
+
 def build(name):
     configuration = configurations.get_selected_configuration()
 
@@ -49,9 +57,21 @@ def build(name):
         toolchain = compiler.Gnu()
 
         target.before()
-        target.build(toolchain)
-        target.after()
-        target.copy_resources(toolchain)
+
+        # run_after can make resources, otherwise they are staged along with
+        # compiles
+        if target.common_parameters.run_after.eval():
+            target.build(toolchain)
+            target.after()
+            staging = target.copy_resources(toolchain)
+        else:
+            staging = target.copy_resources(toolchain)
+            target.build(toolchain)
+            target.after()
+
+        target.wait_for_resources(staging)
+
+        garbage.record(target.outputs(toolchain))
 
 
 def build_all():
@@ -59,6 +79,9 @@ def build_all():
 
     configuration = configurations.get_selected_configuration()
 
+    run_independent_hooks([name for (name, target) in targets.items()
+                           if target.is_visible(configuration)])
+
     for name, target in targets.items():
         if target.is_visible(configuration):
             build(name)
@@ -66,6 +89,141 @@ def build_all():
             ui.bigstep("skip", name)
 
 
+def build_targets(names):
+    run_independent_hooks(names)
+
+    for name in names:
+        build(name)
+
+
+def run_independent_hooks(names):
+    # run_before of targets which depend on nothing can't need anything
+    # built, so they all run at once in the pool before the build
+    configuration = configurations.get_selected_configuration()
+    closure = set()
+    pending = list(names)
+
+    while pending:
+        name = pending.pop()
+
+        if name in closure or name not in targets:
+            continue
+        closure.add(name)
+
+        pending.extend(targets[name].common_parameters.depends_on.eval())
+
+    independent = []
+
+    for name in sorted(closure):
+        if (name in _built_targets or name in _hooks_run or dependencies(name)
+                or not targets[name].is_visible(configuration)):
+            continue
+
+        hook = hooks.prepare(targets[name], "before")
+        if hook:
+            independent.append((name, hook))
+
+    if len(independent) < 2:
+        return
+
+    ui.debug("running run_before of {} in parallel"
+             .format(" ".join(name for (name, _) in independent)))
+
+    fsutils.make_build_dir(configuration.name)
+
+    errors = jobs.run(hook for (_, hook) in independent)
+    _hooks_run.update(name for (name, _) in independent)
+
+    if errors:
+        ui.fatal("failed {!s}".format(errors[0]))
+
+
+def compile_actions(names):
+    # (target, source, path of the source) of every object which building
+    # given targets needs, without building anything
+    actions = []
+    visited = set()
+    toolchain = compiler.Gnu()
+
+    def visit(name):
+        if name in visited:
+            return
+        visited.add(name)
+
+        if name not in targets:
+            ui.fatal("target {} not found".format(name))
+
+        target = targets[name]
+
+        for dependency in target.common_parameters.depends_on.eval():
+            visit(dependency)
+
+        if isinstance(target, CompileableTarget):
+            root_path = target.common_parameters.root_path
+            root_dir = os.getcwd()
+            os.chdir(root_path)
+
+            for source in target.sources(toolchain):
+                actions.append((name, source, os.path.join(root_path, source)))
+
+            os.chdir(root_dir)
+
+    for name in names:
+        visit(name)
+
+    return actions
+
+
+def dependencies(name):
+    # targets from the tree which given one depends on or links with
+    target = targets[name]
+    ret = target.common_parameters.depends_on.eval()
+
+    link_with = getattr(target, "link_with", None)
+    if link_with is not None:
+        ret = ret + link_with.eval()
+
+    return [dependency for dependency in ret if dependency in targets]
+
+
+def built_targets():
+    return list(_built_targets)
+
+
+def visible_targets():
+    configuration = configurations.get_selected_configuration()
+    return [name for (name, target) in targets.items() if target.is_visible(configuration)]
+
+
+def _split_into_batches(sources, batch_size):
+    # contiguous batches of roughly the same size in bytes, keeping the order
+    # of sources so membership stays stable when files grow or shrink
+    sizes = [os.path.getsize(source) if os.path.isfile(source) else 0
+             for source in sources]
+
+    batches_count = (len(sources) + batch_size - 1) // batch_size
+    size_per_batch = float(sum(sizes)) / batches_count
+
+    batches = []
+    batch = []
+    batch_bytes = 0
+
+    for (source, size) in zip(sources, sizes):
+        batch.append(source)
+        batch_bytes += size
+
+        if (len(batches) < batches_count - 1
+                and (batch_bytes >= size_per_batch or len(batch) >= 2 * batch_size)):
+            batches.append(batch)
+            batch = []
+            batch_bytes = 0
+
+    if batch:
+        batches.append(batch)
+
+    return batches
+
+
 class Target:
     def __init__(self, common_parameters):
         self.common_parameters = common_parameters
@@ -88,63 +246,54 @@ class Target:
                                                            params]))
 
     def before(self):
-        self.__try_run(self.common_parameters.run_before)
+        if self.common_parameters.name not in _hooks_run:
+            hooks.run(self, "before")
 
     def after(self):
-        self.__try_run(self.common_parameters.run_after)
+        hooks.run(self, "after")
 
     def copy_resources(self, toolchain):
-        root_dir = os.getcwd()
-        os.chdir(self.common_parameters.root_path)
-
-        for resource in self.common_parameters.resources.eval():
-            ui.step("copy", resource)
-            shell.execute("rsync --update -r '{resource}' '{build_dir}/'"
-                          .format(resource=resource,
-                                  build_dir=toolchain.build_dir()))
-
-        os.chdir(root_dir)
+        evaluated_resources = self.common_parameters.resources.eval()
+        manifest = resources.manifest_filename(toolchain, self.common_parameters.name)
 
-    def is_visible(self, configuration):
-        evaluated_visible_in = self.common_parameters.visible_in.eval()
+        # manifest is left by earlier builds, its files are removed
+        if not evaluated_resources and not os.path.exists(manifest):
+            return None
 
-        if evaluated_visible_in:
-            return configuration.name in evaluated_visible_in
+        return resources.start(self.common_parameters.root_path, evaluated_resources,
+                               toolchain.build_dir(), manifest)
 
-        return True
+    def wait_for_resources(self, staging):
+        errors = jobs.wait(staging) if staging else []
 
-    def __try_run(self, cmds):
-        root_dir = os.getcwd()
-        os.chdir(self.common_parameters.root_path)
-
-        evaluated_artefacts = self.common_parameters.artefacts.eval()
-        evaluated_prerequisites = self.common_parameters.prerequisites.eval()
+        if errors:
+            ui.fatal("failed copying resources of {}: {!s}"
+                     .format(self.common_parameters.name, errors[0]))
 
-        should_run = True
-        if evaluated_prerequisites and evaluated_artefacts:
-            should_run = False
+    def outputs(self, toolchain):
+        # everything building the target leaves in the build directory
+        ret = [resources.manifest_filename(toolchain, self.common_parameters.name),
+               hooks.stamp_filename(self.common_parameters.name, "before"),
+               hooks.stamp_filename(self.common_parameters.name, "after")]
 
-            ui.debug("checking prerequisites ({!s}) for making {!s}"
-                     .format(evaluated_prerequisites, evaluated_artefacts))
+        # whatever hooks make
+        ret += [os.path.normpath(os.path.join(self.common_parameters.root_path, artefact))
+                for artefact in self.common_parameters.artefacts.eval()]
 
-            for artefact in evaluated_artefacts:
-                ui.debug("  " + artefact)
-                if fsutils.is_any_newer_than(evaluated_prerequisites, artefact):
-                    ui.debug(("going on because {!s}"
-                              "needs to be rebuilt").format(artefact))
-                    should_run = True
-                    break
+        for resource in self.common_parameters.resources.eval():
+            ret += [destination for (_, destination)
+                    in resources.files(self.common_parameters.root_path, resource,
+                                       toolchain.build_dir())]
 
-        if should_run:
-            variables.pollute_environment(self.common_parameters.module_name)
+        return ret
 
-            evaluated_cmds = cmds.eval()
+    def is_visible(self, configuration):
+        evaluated_visible_in = self.common_parameters.visible_in.eval()
 
-            for cmd in evaluated_cmds:
-                ui.debug("running {!s}".format(cmd))
-                shell.execute(cmd)
+        if evaluated_visible_in:
+            return configuration.name in evaluated_visible_in
 
-        os.chdir(root_dir)
+        return True
 
 
 class Phony(Target):
@@ -173,59 +322,160 @@ class CompileableTarget(Target):
 
         self.common_parameters = common_parameters
         self.cxx_parameters = cxx_parameters
-        self.error = False
 
-    def _build_object(self, sem, toolchain, name, object_file,
-                       source, include_dirs, compiler_flags):
-        try:
-            if self.error:
-                return
+    def _build_object(self, toolchain, name, object_file,
+                      source, include_dirs, compiler_flags, precompiled_header):
+        with jobs.slot():
+            toolchain.build_object(name, object_file, source, include_dirs, compiler_flags,
+                                   precompiled_header)
+
+    def compiler_flags(self):
+        return self.cxx_parameters.compiler_flags.eval()
 
-            with sem:
-                toolchain.build_object(name, object_file, source, include_dirs, compiler_flags)
+    def precompiled_header(self):
+        evaluated_precompiled_header = (self.cxx_parameters.precompiled_header.eval()
+                                        or configurations.precompiled_header())
+
+        if not evaluated_precompiled_header:
+            return None
+
+        if len(evaluated_precompiled_header) > 1:
+            ui.fatal("target {} can have only one precompiled header, got: {!s}"
+                     .format(self.common_parameters.name, evaluated_precompiled_header))
+
+        return evaluated_precompiled_header[0]
+
+    def build_precompiled_header(self, toolchain, precompiled_header, include_dirs,
+                                 compiler_flags):
+        try:
+            toolchain.build_precompiled_header(self.common_parameters.name,
+                                               precompiled_header,
+                                               include_dirs, compiler_flags)
         except Exception as e:
-            ui.debug("catched during compilation {!s}".format(e))
-            self.error_reason = str(e)
-            self.error = True
+            ui.fatal("failed building precompiled header for {!s}: {!s}"
+                     .format(self.common_parameters.name, e))
+
+    def unity_sources(self, toolchain, sources):
+        evaluated_unity = (self.cxx_parameters.unity.eval()
+                           or configurations.unity())
+
+        if not evaluated_unity:
+            return sources
+
+        try:
+            batch_size = int(evaluated_unity[0])
+        except ValueError:
+            ui.fatal("unity expects number of sources in one unit, got: {!s}"
+                     .format(evaluated_unity))
+
+        evaluated_unity_exclude = self.cxx_parameters.unity_exclude.eval()
+
+        batched = [source for source in sources if source not in evaluated_unity_exclude]
+        excluded = [source for source in sources if source in evaluated_unity_exclude]
+
+        if batch_size <= 1 or len(batched) <= 1:
+            return sources
+
+        unity_files = []
+
+        for (index, batch) in enumerate(_split_into_batches(batched, batch_size)):
+            unity_file = toolchain.unity_filename(self.common_parameters.name, index)
+            toolchain.write_unity_source(unity_file, batch)
+            unity_files.append(unity_file)
+
+        ui.debug("unity sources: {!s}, excluded: {!s}".format(unity_files, excluded))
+
+        return unity_files + excluded
+
+    def sources(self, toolchain):
+        return self.unity_sources(toolchain, self.cxx_parameters.sources.eval())
+
+    def artefacts(self, toolchain):
+        return []
+
+    def outputs(self, toolchain):
+        name = self.common_parameters.name
+        ret = Target.outputs(self, toolchain) + self.artefacts(toolchain)
+
+        root_dir = os.getcwd()
+        os.chdir(self.common_parameters.root_path)
+
+        precompiled_header = self.precompiled_header()
+        objects_directory = toolchain.objects_directory(name,
+                                                        self.cxx_parameters.include_dirs.eval(),
+                                                        self.compiler_flags(),
+                                                        precompiled_header)
+
+        if precompiled_header:
+            precompiled_header_filename = toolchain.precompiled_header_filename(name, precompiled_header)
+            ret += [precompiled_header_filename, precompiled_header_filename + ".cmd",
+                    toolchain.includes_filename(name, precompiled_header)]
+
+        for source in self.sources(toolchain):
+            object_file = toolchain.object_filename(objects_directory, source)
+            base = os.path.splitext(object_file)[0]
+
+            # split dwarf and pgo leave their files next to the object
+            ret += [object_file, base + ".dwo", base + ".gcda",
+                    toolchain.includes_filename(name, source)]
+
+            if source.startswith(toolchain.cache_directory(name)):
+                ret.append(source)
+
+        ret = [os.path.normpath(os.path.abspath(filename)) for filename in ret]
+
+        os.chdir(root_dir)
+
+        return ret
 
     def build_objects(self, toolchain):
         object_files = []
-        evaluated_sources = self.cxx_parameters.sources.eval()
+        evaluated_sources = self.sources(toolchain)
         evaluated_include_dirs = self.cxx_parameters.include_dirs.eval()
-        evaluated_compiler_flags = self.cxx_parameters.compiler_flags.eval()
+        evaluated_compiler_flags = self.compiler_flags()
 
         ui.debug("building objects from {!s}".format(evaluated_sources))
-        ui.push()
 
-        threads = []
+        # ui.fatal leaves through here, ident is popped anyway
+        with ui.ident:
+            precompiled_header = self.precompiled_header()
+
+            ui.debug("limiting jobs to {!s}".format(jobs.limit()))
 
-        jobs = command_line.args.jobs
-        limit_semaphore = threading.Semaphore(int(jobs))
-        ui.debug("limiting jobs to {!s}".format(jobs))
+            objects_directory = toolchain.objects_directory(self.common_parameters.name,
+                                                            evaluated_include_dirs,
+                                                            evaluated_compiler_flags,
+                                                            precompiled_header)
 
-        for source in evaluated_sources:
-            object_file = toolchain.object_filename(self.common_parameters.name,
-                                                        source)
-            object_files.append(object_file)
+            builds = []
 
-            thread = threading.Thread(target=self._build_object,
-                                      args=(limit_semaphore, toolchain, self.common_parameters.name, object_file,
-                                            source, evaluated_include_dirs, evaluated_compiler_flags))
+            for source in evaluated_sources:
+                object_file = toolchain.object_filename(objects_directory, source)
+                object_files.append(object_file)
 
-            threads.append(thread)
-            thread.daemon = True
-            thread.start()
+                # other shard compiles it or it came with bundle of one
+                if (not sharding.is_assigned(self.common_parameters.name, source)
+                        or sharding.is_imported(object_file)):
+                    continue
 
-        assert len(threads) <= jobs
+                if sharding.enabled():
+                    sharding.bundle(object_file)
 
-        for t in threads:
-            t.join()
+                builds.append(functools.partial(self._build_object, toolchain,
+                                                self.common_parameters.name, object_file,
+                                                source, evaluated_include_dirs,
+                                                evaluated_compiler_flags, precompiled_header))
 
-        if self.error:
-            ui.fatal("failed building {!s}: {!s}"
-                     .format(self.common_parameters.name, self.error_reason))
+            if precompiled_header and builds:
+                self.build_precompiled_header(toolchain, precompiled_header,
+                                              evaluated_include_dirs, evaluated_compiler_flags)
 
-        ui.pop()
+            errors = jobs.run(builds)
+
+            if errors:
+                ui.debug("catched during compilation {!s}".format(errors))
+                ui.fatal("failed building {!s}: {!s}"
+                         .format(self.common_parameters.name, errors[0]))
 
         return object_files
 
@@ -240,18 +490,44 @@ class Application(CompileableTarget):
     def type_string(self):
         return "application"
 
+    def artefacts(self, toolchain):
+        application = toolchain.application_filename(self.common_parameters.name)
+        return [application, application + ".rsp"]
+
     def build(self, toolchain):
         root_dir = os.getcwd()
         os.chdir(self.common_parameters.root_path)
 
         object_files = self.build_objects(toolchain)
 
-        toolchain.link_application(toolchain.application_filename(self.common_parameters.name),
-                                   object_files, self.link_with.eval(), self.library_dirs.eval())
+        # links are done when shards are merged
+        if not sharding.enabled():
+            toolchain.link_application(toolchain.application_filename(self.common_parameters.name),
+                                       object_files, self.link_with.eval(), self.library_dirs.eval())
 
         os.chdir(root_dir)
 
 
+class Test(Application):
+    def __init__(self, common_parameters, cxx_parameters, link_with, library_dirs,
+                 arguments, data, timeout, shards):
+        Application.__init__(self, common_parameters, cxx_parameters, link_with, library_dirs)
+
+        self.arguments = arguments
+        self.data = data
+        self.timeout = timeout
+        self.shards = shards
+
+    def type_string(self):
+        return "test"
+
+    def artefacts(self, toolchain):
+        # results of the last run are kept for --test
+        cache_directory = toolchain.cache_directory(self.common_parameters.name)
+        return (Application.artefacts(self, toolchain)
+                + [cache_directory + "test.result", cache_directory + "test.log"])
+
+
 class StaticLibrary(CompileableTarget):
     def __init__(self, common_parameters, cxx_parameters):
         CompileableTarget.__init__(self, common_parameters, cxx_parameters)
@@ -259,6 +535,10 @@ class StaticLibrary(CompileableTarget):
     def type_string(self):
         return "static_library"
 
+    def artefacts(self, toolchain):
+        library = toolchain.static_library_filename(self.common_parameters.name)
+        return [library, library + ".members", library + ".rsp"]
+
     def build(self, toolchain):
         root_dir = os.getcwd()
         os.chdir(self.common_parameters.root_path)
@@ -267,9 +547,46 @@ class StaticLibrary(CompileableTarget):
 
         artefact = toolchain.static_library_filename(self.common_parameters.name)
 
-        if fsutils.is_any_newer_than(object_files, artefact):
+        if not sharding.enabled():
             toolchain.link_static_library(artefact, object_files)
-        else:
-            ui.bigstep("up to date", artefact)
+
+        os.chdir(root_dir)
+
+
+class SharedLibrary(CompileableTarget):
+    def __init__(self, common_parameters, cxx_parameters, link_with, library_dirs,
+                 relink_dependents):
+        CompileableTarget.__init__(self, common_parameters, cxx_parameters)
+
+        self.link_with = link_with
+        self.library_dirs = library_dirs
+        self.relink_dependents = relink_dependents
+
+    def type_string(self):
+        return "shared_library"
+
+    def artefacts(self, toolchain):
+        library = toolchain.shared_library_filename(self.common_parameters.name)
+        return [library, library + ".interface", library + ".rsp"]
+
+    def compiler_flags(self):
+        return CompileableTarget.compiler_flags(self) + ["-fPIC"]
+
+    def build(self, toolchain):
+        root_dir = os.getcwd()
+        os.chdir(self.common_parameters.root_path)
+
+        evaluated_relink_dependents = self.relink_dependents.eval() or ["always"]
+
+        if evaluated_relink_dependents[0] not in ["always", "on_interface_change"]:
+            ui.fatal("relink_dependents of {} should be always or on_interface_change, got: {!s}"
+                     .format(self.common_parameters.name, evaluated_relink_dependents))
+
+        object_files = self.build_objects(toolchain)
+
+        if not sharding.enabled():
+            toolchain.link_shared_library(toolchain.shared_library_filename(self.common_parameters.name),
+                                          object_files, self.link_with.eval(), self.library_dirs.eval(),
+                                          evaluated_relink_dependents[0] == "on_interface_change")
 
         os.chdir(root_dir)
@@ -0,0 +1,183 @@
+import os
+import time
+import signal
+import hashlib
+import functools
+import threading
+import subprocess
+
+import ui
+import fsutils
+import compiler
+import targets
+import variables
+import jobs
+import command_line
+
+# --test runs test targets which were built. Every test, or every shard of
+# it when shards(N) is given, is a job in the pool. Passing result is kept in
+# build.<test>/test.result with digest of everything the run depends on: the
+# binary, shared libraries from the tree it links with, data files,
+# arguments and shards, so only tests whose inputs changed run again. Output
+# of the last run is in build.<test>/test.log.
+
+_lock = threading.Lock()
+
+
+def _result_filename(toolchain, name):
+    return toolchain.cache_directory(name) + "test.result"
+
+
+def _log_filename(toolchain, name):
+    return toolchain.cache_directory(name) + "test.log"
+
+
+def _number(evaluated, default, parameter, name, convert):
+    try:
+        return convert(evaluated[0] if evaluated else default)
+    except ValueError:
+        ui.fatal("{} of test {} expects number, got: {!s}".format(parameter, name, evaluated))
+
+
+def _key(toolchain, target, binary, arguments, data, shards):
+    root_path = target.common_parameters.root_path
+    parts = [fsutils.digest_tree(binary)]
+
+    for lib in target.link_with.eval():
+        if isinstance(targets.targets.get(lib), targets.SharedLibrary):
+            parts.append(fsutils.digest_tree(toolchain.shared_library_filename(lib)))
+
+    parts += [filename + "=" + fsutils.digest_tree(os.path.join(root_path, filename))
+              for filename in data]
+
+    return hashlib.sha1("\0".join(parts + arguments + [str(shards)])).hexdigest()
+
+
+def _load(filename):
+    try:
+        with open(filename, "r") as f:
+            return f.read()
+    except IOError:
+        return None
+
+
+def _execute(argv, env, cwd, timeout):
+    # returns (passed, output), test is killed when it runs out of time.
+    # It runs in its own process group, so children which inherited the
+    # output pipe are killed with it and communicate() returns
+    try:
+        process = subprocess.Popen(argv, env=env, cwd=cwd, preexec_fn=os.setsid,
+                                   stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    except OSError as e:
+        return (False, "can't run {}: {!s}\n".format(argv[0], e))
+
+    expired = []
+
+    def kill():
+        expired.append(True)
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except OSError:
+            pass
+
+    timer = threading.Timer(timeout, kill)
+    timer.start()
+
+    try:
+        (out, _) = process.communicate()
+    finally:
+        timer.cancel()
+
+    if expired:
+        return (False, out + "timed out after {:g}s\n".format(timeout))
+
+    if process.returncode != 0:
+        return (False, out + "exited with error({})\n".format(process.returncode))
+
+    return (True, out)
+
+
+def _run_shard(results, name, shard, argv, env, cwd, timeout):
+    with jobs.slot(), jobs.local():
+        start = time.time()
+        (passed, out) = _execute(argv, env, cwd, timeout)
+
+    with _lock:
+        results.setdefault(name, []).append((shard, passed, out, time.time() - start))
+
+
+def run(names):
+    # runs test targets among given ones, returns names of failed tests
+    toolchain = compiler.Gnu()
+    actions = []
+    tests = []
+    results = {}
+    cached = 0
+
+    for name in names:
+        target = targets.targets[name]
+
+        if not isinstance(target, targets.Test):
+            continue
+
+        binary = toolchain.application_filename(name)
+        arguments = target.arguments.eval()
+        timeout = _number(target.timeout.eval(), command_line.args.test_timeout,
+                          "timeout", name, float)
+        shards = _number(target.shards.eval(), 1, "shards", name, int)
+
+        key = _key(toolchain, target, binary, arguments, target.data.eval(), shards)
+
+        if _load(_result_filename(toolchain, name)) == key:
+            ui.debug("{} passed with the same inputs".format(name))
+            cached += 1
+            continue
+
+        env = variables.environment(target.common_parameters.module_name)
+
+        for shard in range(shards):
+            # gtest runs only its part of the cases
+            if shards > 1:
+                env = dict(env, GTEST_TOTAL_SHARDS=str(shards), GTEST_SHARD_INDEX=str(shard))
+
+            actions.append(functools.partial(_run_shard, results, name, shard,
+                                             [binary] + arguments, env,
+                                             target.common_parameters.root_path, timeout))
+
+        tests.append((name, key))
+
+    if tests or cached:
+        ui.bigstep("test", "running {} of {} tests".format(len(tests), len(tests) + cached))
+
+    errors = jobs.run(actions)
+    if errors:
+        ui.fatal("failed running tests: {!s}".format(errors[0]))
+
+    failed = []
+
+    for (name, key) in tests:
+        shards = sorted(results[name])
+        passed = all(shard_passed for (_, shard_passed, _, _) in shards)
+        seconds = max(shard_seconds for (_, _, _, shard_seconds) in shards)
+        log = "".join(out if len(shards) == 1 else "shard {}:\n{}".format(shard, out)
+                      for (shard, _, out, _) in shards)
+
+        result_filename = _result_filename(toolchain, name)
+        fsutils.mkdir_recursive(os.path.dirname(result_filename))
+
+        with open(_log_filename(toolchain, name), "w") as f:
+            f.write(log)
+
+        if passed:
+            ui.step("passed", "{} ({:.1f}s)".format(name, seconds))
+            with open(result_filename, "w") as f:
+                f.write(key)
+        else:
+            ui.step("FAILED", "{} ({:.1f}s)".format(name, seconds))
+            ui.info(log.rstrip("\n"))
+            failed.append(name)
+
+            if os.path.exists(result_filename):
+                os.remove(result_filename)
+
+    return failed
@@ -7,6 +7,25 @@ import collections
 
 modules = collections.defaultdict(dict)
 
+# where set and append of each variable are in pake files, by (module, name)
+definitions = collections.defaultdict(list)
+
+# bumped whenever any variable is added or changed, evaluated values cached
+# inside Variable objects are valid only for the generation they were made in
+_generation = 0
+
+
+def _invalidate_cache():
+    global _generation
+    _generation += 1
+
+
+# variables exported to run_before/run_after environment, computed once
+# per generation
+_exported = None
+_exported_generation = None
+_environments = {}
+
 
 def export_special_variables(configuration):
     ui.debug("exporting special variables")
@@ -23,20 +42,42 @@ def export_special_variables(configuration):
             add(module, "$__build", fsutils.build_dir(configuration.name))
 
 
-def pollute_environment(current_module):
-    ui.debug("polluting environment")
+def _export_to_environment():
+    ui.debug("exporting variables to environment")
+
+    exported = {}
 
     with ui.ident:
         for module in modules:
+            exported[module] = {}
             for (name, variable) in modules[module].iteritems():
-                evaluated = variable.eval()
-                env_name = module + "_" + name[1:]
-                os.environ[env_name] = " ".join(evaluated)
-                ui.debug("  " + env_name + ": " + str(evaluated))
-                if module == current_module:
-                    env_short_name = name[1:]
-                    os.environ[env_short_name] = " ".join(evaluated)
-                    ui.debug("  " + env_short_name + ": " + str(evaluated))
+                evaluated = " ".join(variable.eval())
+                exported[module][name[1:]] = evaluated
+                ui.debug("  " + module + "_" + name[1:] + ": " + evaluated)
+
+    return exported
+
+
+def environment(current_module):
+    global _exported, _exported_generation, _environments
+
+    if _exported_generation != _generation:
+        _exported = _export_to_environment()
+        _exported_generation = _generation
+        _environments = {}
+
+    if current_module not in _environments:
+        env = dict(os.environ)
+
+        for module in _exported:
+            for (name, value) in _exported[module].iteritems():
+                env[module + "_" + name] = value
+
+        env.update(_exported.get(current_module, {}))
+
+        _environments[current_module] = env
+
+    return _environments[current_module]
 
 
 def make_simple_variable(value):
@@ -47,20 +88,20 @@ def eval_variable_to_string(variable):
     return " ".join(variable.eval())
 
 
-class Literal:
-    def __init__(self, module, content):
+class Literal(object):
+    __slots__ = ("module", "content", "template")
+
+    def __init__(self, module, content, token=None):
         self.module = module
         self.content = content
+        self.template = self.__compile(content, token)
 
     def __str__(self):
         return self.content
 
-    def eval(self):
-        ui.debug("evaluating {!s}: ".format(self))
-
-        s = self.content
-
-        ret = []
+    def __compile(self, s, token):
+        template = []
+        fixed = []
 
         STATE_READING = 1
         STATE_WAITING_FOR_PARENTHESIS = 2
@@ -74,35 +115,56 @@ class Literal:
                 if c == "$":
                     state = STATE_WAITING_FOR_PARENTHESIS
                 else:
-                    ret.append(c)
+                    fixed.append(c)
             elif state == STATE_WAITING_FOR_PARENTHESIS:
                 if c == "{":
                     state = STATE_READING_NAME
                 else:
-                    ui.parse_error(msg="expecting { after $")
+                    ui.parse_error(token, msg="expecting { after $")
             elif state == STATE_READING_NAME:
                 if c == "}":
-                    ui.debug("variable: " + variable_name)
+                    if fixed:
+                        template.append("".join(fixed))
+                        fixed = []
 
-                    variable = ReferenceToVariable(self.module, variable_name)
-                    ret.append(" ".join(variable.eval()))
+                    template.append(ReferenceToVariable(self.module, variable_name))
 
                     variable_name = '$'
                     state = STATE_READING
                 else:
                     variable_name += c
-            elif state == STATE_READING_NAME:
-                variable_name = variable_name + c
 
-        return ["".join(ret)]
+        if state != STATE_READING:
+            ui.parse_error(token, msg="unterminated variable reference in \"{}\"".format(s))
+
+        if fixed:
+            template.append("".join(fixed))
+
+        return template
+
+    def eval(self):
+        ui.debug("evaluating {!s}: ".format(self))
+
+        def eval_piece(piece):
+            return piece if isinstance(piece, str) else " ".join(piece.eval())
+
+        return ["".join(eval_piece(piece) for piece in self.template)]
 
     eval_to_string = eval_variable_to_string
 
 
-class ReferenceToVariable:
+class ReferenceToVariable(object):
+    __slots__ = ("module", "name")
+
     def __init__(self, module, name):
-        self.module = module
-        self.name = name
+        parts = name.split(".")
+
+        if len(parts) == 2:
+            module = parts[0][1:]  # lose the $
+            name = "$" + parts[1]
+
+        self.module = intern(module)
+        self.name = intern(name)
 
     def __str__(self):
         return "${}.{}".format(self.module, self.name)
@@ -112,15 +174,6 @@ class ReferenceToVariable:
     def eval(self):
         ui.debug("evaluating {!s}".format(self))
 
-        parts = self.name.split(".")
-
-        if len(parts) == 1:
-            self.module = self.module
-            self.name = parts[0]
-        elif len(parts) == 2:
-            self.module = parts[0][1:]  # lose the $
-            self.name = "$" + parts[1]
-
         global modules
 
         if self.module not in modules:
@@ -134,17 +187,21 @@ class ReferenceToVariable:
     eval_to_string = eval_variable_to_string
 
 
-class Variable:
+class Variable(object):
+    __slots__ = ("module", "name", "content", "_cached", "_cached_generation")
+
     def __init__(self, module=None, name=None, content=None):
         self.module = module
         self.name = name
         self.content = [content] if content else []
+        self._cached = None
+        self._cached_generation = None
 
     def __str__(self):
         return "${}.{} = {!s} ".format(self.module, self.name, self.content)
 
     def __bool__(self):
-        return self.module or self.name or len(self.content) > 0
+        return bool(self.module or self.name or len(self.content) > 0)
 
     __nonzero__=__bool__
 
@@ -152,30 +209,46 @@ class Variable:
         def eval_not_str(e):
             return [e] if isinstance(e, str) else e.eval()
 
-        return reduce(list.__add__, (eval_not_str(el) for el in self.content), [])
+        if self._cached_generation != _generation:
+            self._cached = reduce(list.__add__, (eval_not_str(el) for el in self.content), [])
+            self._cached_generation = _generation
+
+        return list(self._cached)
 
     eval_to_string = eval_variable_to_string
 
 
 def add_empty(module_name, name):
+    module_name = intern(module_name)
+    name = intern(name)
+
     variable = Variable(name=name)
     modules[module_name][name] = variable
+    _invalidate_cache()
 
     ui.debug("adding variable: {!s}".format(variable))
 
 
 def add(module_name, name, value):
+    module_name = intern(module_name)
+    name = intern(name)
+
     variable = Variable(module_name, name, value)
     modules[module_name][name] = variable
+    _invalidate_cache()
 
     ui.debug("adding variable: {!s}".format(variable))
 
 
 def append(module_name, name, value):
+    module_name = intern(module_name)
+    name = intern(name)
+
     if name not in modules[module_name]:
         modules[module_name][name] = Variable(module_name, name)
 
     variable = modules[module_name][name]
     variable.content.append(value)
+    _invalidate_cache()
 
     ui.debug("setting variable: {!s}".format(variable))
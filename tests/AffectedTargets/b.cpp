@@ -0,0 +1,4 @@
+int b()
+{
+    return 2;
+}
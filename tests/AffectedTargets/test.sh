@@ -0,0 +1,45 @@
+. ../common.sh
+
+rm -rf __build
+mkdir __build
+
+function affected()
+{
+    $pake $@ > __build/output.txt || error $pake $@
+    cat __build/output.txt
+    grep -e ^affected __build/output.txt > __build/affected.txt
+}
+
+big_echo "nothing was built yet, so everything is affected"
+echo a.cpp > __build/changed.txt
+affected --affected-by __build/changed.txt
+assert grep -e app_a __build/affected.txt
+assert grep -e app_b __build/affected.txt
+assert __build/__default/app_a
+assert __build/__default/app_b
+
+big_echo "header affects library including it and application linking with it"
+echo a.hpp > __build/changed.txt
+affected --affected-by __build/changed.txt
+assert grep -e liba __build/affected.txt
+assert grep -e app_a __build/affected.txt
+assert_fail grep -e libb __build/affected.txt
+assert_fail grep -e app_b __build/affected.txt
+assert_fail grep -e data __build/affected.txt
+
+big_echo "only requested targets are considered"
+affected --affected-by __build/changed.txt app_b
+assert grep -e affected.nothing __build/affected.txt
+
+big_echo "prerequisites of phony targets"
+echo data.txt > __build/changed.txt
+affected --affected-by __build/changed.txt
+assert grep -e data __build/affected.txt
+assert_fail grep -e app __build/affected.txt
+
+big_echo "changed pake files affect everything"
+echo hello.pake > __build/changed.txt
+affected --affected-by __build/changed.txt
+assert grep -e everything __build/affected.txt
+
+rm -rf __build
@@ -0,0 +1,3 @@
+#!/bin/sh
+echo generated >> `dirname $2`/generations.list
+echo "const char* greeting = \"`cat $1`\";" > $2
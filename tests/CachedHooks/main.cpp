@@ -0,0 +1,3 @@
+#include "generated.hpp"
+
+int main() { return greeting[0] == 0; }
@@ -0,0 +1,58 @@
+. ../common.sh
+
+rm -rf __build
+trap "echo hello > input.txt" EXIT
+
+function generations()
+{
+    test `cat __build/__default/generations.list | wc -l` -eq $1
+}
+
+big_echo "hook of application with declared prerequisites and artefacts"
+assert $pake hello
+assert __build/__default/hello
+assert generations 1
+
+big_echo "nothing changed"
+assert $pake hello
+assert generations 1
+
+big_echo "touched, but the same"
+sleep 1
+touch input.txt
+assert $pake hello
+assert generations 1
+
+big_echo "changed"
+echo hi > input.txt
+assert $pake hello
+assert generations 2
+
+big_echo "missing artefact"
+rm __build/__default/generated.hpp
+assert $pake hello
+assert generations 3
+
+big_echo "edited artefact"
+echo "// edited" >> __build/__default/generated.hpp
+assert $pake hello
+assert generations 4
+
+big_echo "artefact rewritten with the same content"
+cp __build/__default/generated.hpp __build/generated.hpp
+sleep 1
+cp __build/generated.hpp __build/__default/generated.hpp
+assert $pake hello
+assert generations 4
+
+big_echo "output of hooks is shown while they run"
+$pake streaming > __build/streaming.txt &
+pake_pid=$!
+timeout 10 sh -c "until grep -q started __build/streaming.txt; do sleep 0.1; done" || error "no output of running hook"
+touch __build/__default/go
+assert wait $pake_pid
+
+big_echo "independent hooks run in parallel"
+assert $pake -j 2 a_waiting b_signalling
+
+rm -rf __build
@@ -0,0 +1,6 @@
+#!/bin/sh
+for i in `seq 100`; do
+    test -f $1 && exit 0
+    sleep 0.1
+done
+exit 1
@@ -0,0 +1,2 @@
+echo "$@" >> __build/calls.list
+c++ $@
@@ -0,0 +1,52 @@
+. ../common.sh
+
+rm -rf __build
+mkdir __build
+
+$pake --worker --bind 127.0.0.1 --port 0 --port-file __build/port --slots 2 > /dev/null &
+worker=$!
+trap "kill $worker 2> /dev/null" EXIT
+
+timeout 10 sh -c "while [ ! -s __build/port ]; do sleep 0.1; done" || error "worker didn't start"
+workers="--workers 127.0.0.1:`cat __build/port`/2"
+
+big_echo "sources are preprocessed locally and compiled by the worker"
+assert $pake $workers -j1 hello
+assert grep -e -E.*main.cpp __build/calls.list
+assert_fail grep -e -c.*main.cpp __build/calls.list
+assert_fail grep -e -c.*utils.cpp __build/calls.list
+assert __build/__default/hello
+
+big_echo "objects built by the worker aren't cached"
+rm -rf __build/__default __build/calls.list
+assert $pake $workers --cache-dir __build/cache hello
+assert_fail grep -e -c.*main.cpp __build/calls.list
+rm -rf __build/__default __build/calls.list
+assert $pake --cache-dir __build/cache hello
+assert grep -e -c.*main.cpp __build/calls.list
+
+big_echo "flags not allowed on the worker mean local build"
+rm __build/calls.list
+assert $pake $workers -c refused hello
+assert grep -e -B/nonexistent/.-c.*main.cpp __build/calls.list
+assert __build/refused/hello
+
+big_echo "split dwarf objects are built locally, next to their .dwo"
+rm __build/calls.list
+assert $pake $workers -c split hello
+assert grep -e -c.*main.cpp __build/calls.list
+test -n "`find __build/split/objects -name '*.dwo'`" || error "no .dwo next to objects"
+
+big_echo "target named worker is built"
+assert $pake $workers worker
+assert __build/__default/worker
+
+big_echo "dead worker means local build"
+kill $worker
+wait $worker 2> /dev/null
+touch main.cpp
+assert $pake $workers hello
+assert grep -e -c.*main.cpp __build/calls.list
+assert __build/__default/hello
+
+rm -rf __build
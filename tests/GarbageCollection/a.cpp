@@ -0,0 +1 @@
+int a() { return 1; }
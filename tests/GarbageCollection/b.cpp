@@ -0,0 +1 @@
+int b() { return 2; }
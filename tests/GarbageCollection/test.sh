@@ -0,0 +1,37 @@
+. ../common.sh
+
+rm -rf __build
+
+big_echo "everything the tree builds is kept"
+cp all.pake.in build.pake
+assert $pake -a
+assert $pake --gc
+assert test -e __build/__default/app
+assert test -e __build/__default/liblib.a
+assert test -e __build/__default/build.app/main.cpp.includes
+assert test -e __build/__default/build.lib/b.cpp.includes
+
+big_echo "outputs of removed source and target are removed"
+cp less.pake.in build.pake
+assert $pake -a --gc > __build/output.txt
+cat __build/output.txt
+assert grep -e gc.*reclaimed __build/output.txt
+assert test -e __build/__default/app
+assert_fail test -e __build/__default/liblib.a
+assert_fail test -e __build/__default/build.lib
+assert test -e __build/__default/build.app/main.cpp.includes
+assert_fail test -e __build/__default/build.app/a.cpp.includes
+assert test -e a.cpp
+
+big_echo "artefacts of hooks are kept"
+assert test -e __build/__default/build.app/generated.txt
+assert $pake --gc
+assert test -e __build/__default/build.app/generated.txt
+test `find __build/__default/objects -name '*.o' | wc -l` -eq 1 || error "stale objects left"
+
+big_echo "files not built by pake are left alone"
+touch __build/__default/foreign.txt
+assert $pake --gc
+assert test -e __build/__default/foreign.txt
+
+rm -rf __build build.pake
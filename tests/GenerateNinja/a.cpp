@@ -0,0 +1,6 @@
+#include "a.hpp"
+
+int a()
+{
+    return 1;
+}
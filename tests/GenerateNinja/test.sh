@@ -0,0 +1,48 @@
+. ../common.sh
+
+rm -rf __build build.ninja .ninja_log .ninja_deps
+
+big_echo "manifest with compile, archive, link and hook edges"
+assert $pake --generate-ninja app_a
+assert test -f build.ninja
+assert_fail test -e __build/__default/app_a
+assert grep -e "^build.*a.cpp.o:.compile.*/a.cpp" build.ninja
+assert grep -e "-MD.-MF.*a.cpp.o.d" build.ninja
+assert grep -e "^build.*libliba.a:.run" build.ninja
+assert grep -e "^build.*/app_a:.run.*app_a.cpp.o.|.*libliba.a.||.liba" build.ninja
+assert grep -e "^build.*after.always:.run" build.ninja
+assert grep -e "^build.build.ninja:.regenerate.*hello.pake" build.ninja
+assert grep -e "^default.app_a" build.ninja
+
+big_echo "every resource is copied"
+assert $pake --generate-ninja data
+assert grep -e "^build.*resources.0.always:.run" build.ninja
+assert grep -e "^build.*resources.1.always:.run" build.ninja
+assert grep -e "cp.-R.-p.b.txt" build.ninja
+
+big_echo "response files are written by ninja"
+rm -rf __build
+assert $pake -c rsp --generate-ninja app_a
+assert_fail test -e __build/rsp/app_a.rsp
+assert grep -e "^build.*/app_a:.link" build.ninja
+assert grep -e "rspfile.=.*app_a.rsp" build.ninja
+assert grep -e "@.*app_a.rsp" build.ninja
+
+assert $pake --generate-ninja app_a
+
+big_echo "ninja builds it"
+assert ninja
+assert __build/__default/app_a
+assert test -f __build/__default/after.txt
+
+big_echo "ninja regenerates the manifest after pake file changes"
+touch hello.pake
+assert ninja
+
+big_echo "ninja copies resources"
+assert $pake --generate-ninja data
+assert ninja
+assert test -f __build/__default/a.txt
+assert test -f __build/__default/b.txt
+
+rm -rf __build build.ninja .ninja_log .ninja_deps
@@ -0,0 +1,2 @@
+#!/bin/sh
+echo "const char* greeting = \"`cat $1`\";" > $2
@@ -0,0 +1,23 @@
+. ../common.sh
+
+rm -rf __build
+mkdir __build
+
+assert $pake hello
+assert grep -e -c.*main.cpp __build/calls.list
+
+big_echo "header generated again with the same content"
+rm __build/calls.list
+sleep 1
+assert $pake hello
+assert_fail test -f __build/calls.list
+
+big_echo "header generated with different content"
+sleep 1
+echo hi > input.txt
+assert $pake hello
+assert grep -e -c.*main.cpp __build/calls.list
+assert_fail grep -e -c.*other.cpp __build/calls.list
+
+echo hello > input.txt
+rm -rf __build
@@ -0,0 +1 @@
+echo "$greeting $hello_greeting" > $output
@@ -0,0 +1,8 @@
+. ../common.sh
+
+rm -rf __build
+
+assert $pake hello
+assert grep -x hello.hello __build/__default/greeting
+
+rm -rf __build
@@ -0,0 +1,2 @@
+echo "$@" >> __build/archiver_calls.list
+ar $@
@@ -0,0 +1,44 @@
+. ../common.sh
+
+function make_module()
+{
+    echo 'configuration __default compiler("${hello.__path}/c++-wrapper.sh") archiver("${hello.__path}/ar-wrapper.sh")' > hello.pake
+    echo 'configuration thin compiler("${hello.__path}/c++-wrapper.sh") archiver("${hello.__path}/ar-wrapper.sh") thin_archives(yes)' >> hello.pake
+    echo "target static_library hello sources($@)" >> hello.pake
+}
+
+rm -rf __build
+mkdir __build
+
+make_module one.cpp two.cpp
+
+assert $pake hello
+assert ar t __build/__default/libhello.a
+assert grep -e -rcs.*one.cpp.o.*two.cpp.o __build/archiver_calls.list
+
+big_echo "nothing changed"
+rm __build/archiver_calls.list
+assert $pake hello
+assert_fail test -f __build/archiver_calls.list
+
+big_echo "only changed object is put into archive"
+touch one.cpp
+assert $pake hello
+assert grep -e -rcs.*one.cpp.o __build/archiver_calls.list
+assert_fail grep -e two.cpp.o __build/archiver_calls.list
+
+big_echo "removed source is dropped from archive"
+rm __build/archiver_calls.list
+make_module one.cpp
+assert $pake hello
+assert grep -e -dS.*two.cpp.o __build/archiver_calls.list
+assert_fail grep -e two.cpp.o <(ar t __build/__default/libhello.a)
+assert grep -e one.cpp.o <(ar t __build/__default/libhello.a)
+
+big_echo "thin archive"
+make_module one.cpp two.cpp
+assert $pake -c thin hello
+assert grep -e -rcsT __build/archiver_calls.list
+assert grep -x '!<thin>' <(head -1 __build/thin/libhello.a)
+
+rm -rf __build hello.pake
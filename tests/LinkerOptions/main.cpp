@@ -0,0 +1,6 @@
+#include "utils.hpp"
+
+int main()
+{
+    return utils();
+}
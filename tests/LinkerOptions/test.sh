@@ -0,0 +1,26 @@
+. ../common.sh
+
+rm -rf __build
+mkdir __build
+
+big_echo "objects passed through response file"
+assert $pake -j2 hello
+assert grep -e -o.*hello.*@.*hello.rsp __build/calls.list
+assert grep -e main.cpp.o __build/__default/hello.rsp
+assert __build/__default/hello
+
+big_echo "gold linking in parallel, split dwarf"
+assert $pake -c gold hello
+assert grep -e -gsplit-dwarf.*-c.*main.cpp __build/calls.list
+assert grep -e -fuse-ld=gold.*--thread-count=2.*--gdb-index.*-o.*gold/hello __build/calls.list
+assert __build/gold/hello
+
+big_echo "split dwarf objects aren't taken from the cache without their .dwo"
+rm -rf __build/gold
+assert $pake --cache-dir __build/cache -c gold hello
+rm -rf __build/gold
+assert $pake --cache-dir __build/cache -c gold hello
+assert test `find __build/gold -name "*.dwo" | wc -l` -eq 2
+assert __build/gold/hello
+
+rm -rf __build
@@ -0,0 +1,12 @@
+#!/bin/sh
+
+# every compiler run leaves its pid in __build/running while it runs and
+# logs how many were running, so the peak can be checked
+mkdir -p __build/running
+touch __build/running/$$
+ls __build/running | wc -l >> __build/running.log
+sleep 0.05
+c++ "$@"
+status=$?
+rm __build/running/$$
+exit $status
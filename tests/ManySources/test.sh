@@ -0,0 +1,41 @@
+. ../common.sh
+
+rm -rf __build src
+mkdir __build src
+
+sources=""
+for i in `seq 1 200`; do
+    echo "int f$i() { return $i; }" > src/f$i.cpp
+    sources="$sources src/f$i.cpp"
+done
+
+echo "int main() {}" > src/main.cpp
+
+cat > hello.pake <<PAKE
+configuration __default compiler("\${hello.__path}/c++-wrapper.sh")
+target application hello sources(src/main.cpp $sources)
+PAKE
+
+function peak()
+{
+    sort -n __build/running.log | tail -1
+}
+
+big_echo "lots of sources built by few jobs"
+assert $pake -j3 hello
+assert __build/__default/hello
+assert test `find __build/__default/objects -name '*.o' | wc -l` -eq 201
+assert test `peak` -le 3
+
+big_echo "compiles workers give back run no more than -j at once"
+rm -rf __build
+mkdir __build
+assert $pake -j2 --workers 127.0.0.1:1/8 hello
+assert __build/__default/hello
+assert test `peak` -le 2
+
+big_echo "broken source fails the build"
+echo "broken" > src/f100.cpp
+assert_fail $pake -j3 hello
+
+rm -rf __build src hello.pake
@@ -0,0 +1,12 @@
+#!/bin/sh
+
+# marks that configuration $1 started and waits for the other one, which
+# happens only when both are built at the same time
+touch __build/$1.started
+
+for i in `seq 100`; do
+    test `ls __build/*.started | wc -l` -ge 2 && exit 0
+    sleep 0.1
+done
+
+exit 1
@@ -0,0 +1,29 @@
+. ../common.sh
+
+rm -rf __build
+mkdir __build
+
+big_echo "few configurations in one run, includes scanned once"
+assert $pake -c __default,release hello
+assert __build/__default/hello
+assert __build/release/hello
+assert test `grep -c -e -M __build/calls.list` -eq 1
+
+big_echo "failing configuration doesn't stop the others"
+rm -rf __build/__default __build/release
+assert_fail $pake --all-configurations -a
+assert __build/__default/hello
+assert __build/release/hello
+
+big_echo "configurations are built at the same time"
+assert $pake -c __default,release meeting
+
+big_echo "-c without configuration"
+$pake hello -c > __build/output.txt 2>&1 && error "should fail"
+assert grep -e fatal:.-c.expects __build/output.txt
+assert_fail grep -e Traceback __build/output.txt
+
+big_echo "unknown configuration"
+assert_fail $pake -c release,nonexistent hello
+
+rm -rf __build
@@ -0,0 +1,43 @@
+. ../common.sh
+
+rm -rf __build __cache
+mkdir __build
+
+cache="--cache-dir __cache"
+
+assert $pake $cache hello
+assert grep -e -c.*main.cpp __build/calls.list
+assert __build/__default/hello
+
+big_echo "fresh build directory gets objects from the cache"
+rm -rf __build
+mkdir __build
+assert $pake $cache hello
+assert_fail grep -e -c.*main.cpp __build/calls.list
+assert grep -e -o.*hello __build/calls.list
+assert __build/__default/hello
+
+big_echo "other configuration with the same flags shares the objects"
+rm __build/calls.list
+assert $pake $cache -c other hello
+assert_fail grep -e -c __build/calls.list
+assert __build/other/hello
+
+big_echo "different flags means different objects"
+assert $pake $cache -c different_flags hello
+assert grep -e -c.*main.cpp __build/calls.list
+
+big_echo "changed header misses the cache"
+rm __build/calls.list
+cp utils.hpp __build/utils.hpp.orig
+echo "// changed" >> utils.hpp
+assert $pake $cache hello
+assert grep -e -c.*main.cpp __build/calls.list
+assert grep -e -c.*utils.cpp __build/calls.list
+mv __build/utils.hpp.orig utils.hpp
+
+big_echo "cache stays within its size limit"
+assert $pake $cache --cache-size 0 -c other hello
+assert test -z "`find __cache -name '*.o'`"
+
+rm -rf __build __cache
@@ -0,0 +1,20 @@
+#include <cstdio>
+#include <cstdlib>
+
+int classify(int n)
+{
+    if (n % 7 == 0)
+        return 1;
+    return 0;
+}
+
+int main(int argc, char** argv)
+{
+    int count = argc > 1 ? std::atoi(argv[1]) : 10;
+    int sum = 0;
+
+    for (int i = 0; i < count; i++)
+        sum += classify(i);
+
+    std::printf("%d\n", sum);
+}
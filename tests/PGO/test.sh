@@ -0,0 +1,42 @@
+. ../common.sh
+
+rm -rf __build
+mkdir __build
+
+big_echo "instrumented build, training and optimized build"
+assert $pake -c release hello
+assert grep -e -fprofile-generate.*-o.*release-pgo-generate/objects/.*main.cpp.o __build/calls.list
+assert grep -e -fprofile-use.*-o.*release/objects/.*main.cpp.o __build/calls.list
+assert ls __build/release/pgo/*.gcda
+assert __build/release/hello
+
+big_echo "nothing changed, no training and no rebuild"
+rm __build/calls.list
+assert $pake -c release hello
+assert_fail test -e __build/calls.list
+
+big_echo "source changed, training again"
+touch main.cpp
+assert $pake -c release hello
+assert grep -e -fprofile-generate __build/calls.list
+assert grep -e -fprofile-use __build/calls.list
+
+big_echo "configuration without pgo isn't affected"
+rm __build/calls.list
+assert $pake hello
+assert_fail grep -e -fprofile __build/calls.list
+
+big_echo "instrumented objects aren't compiled by workers"
+rm -rf __build
+mkdir __build
+$pake --worker --port 0 --port-file __build/port > /dev/null &
+worker=$!
+trap "kill $worker 2> /dev/null" EXIT
+while [ ! -s __build/port ]; do sleep 0.1; done
+
+assert $pake --workers 127.0.0.1:`cat __build/port`/2 -c release hello
+assert_fail grep -e -fprofile-generate.*-E __build/calls.list
+assert grep -e -fprofile-generate.*-c __build/calls.list
+assert ls __build/release/pgo/*.gcda
+
+rm -rf __build
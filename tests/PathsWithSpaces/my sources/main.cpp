@@ -0,0 +1,6 @@
+#include "utils.hpp"
+
+int main()
+{
+    return answer() == 42 ? 0 : 1;
+}
@@ -0,0 +1,11 @@
+. ../common.sh
+
+rm -rf __build
+mkdir __build
+
+big_echo "sources and include dirs with spaces are passed to compiler as they are"
+assert $pake hello
+assert __build/__default/hello
+assert test -f __build/__default/libutils.a
+
+rm -rf __build
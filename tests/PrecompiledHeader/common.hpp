@@ -0,0 +1,4 @@
+#include <iostream>
+#include <string>
+
+#define FROM_PRECOMPILED_HEADER
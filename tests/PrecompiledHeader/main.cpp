@@ -0,0 +1,8 @@
+#ifndef FROM_PRECOMPILED_HEADER
+#error precompiled header was not included
+#endif
+
+int main()
+{
+    std::cout << std::string("hello") << "\n";
+}
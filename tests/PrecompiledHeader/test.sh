@@ -0,0 +1,27 @@
+. ../common.sh
+
+rm -rf __build
+mkdir __build
+
+assert $pake hello
+assert test -f __build/__default/build.hello/common.hpp.gch
+assert grep -e -include.*common.hpp.*-c.*main.cpp __build/calls.list
+assert __build/__default/hello
+
+big_echo "nothing changed, nothing is rebuilt"
+rm __build/calls.list
+assert $pake hello
+assert_fail test -f __build/calls.list
+
+big_echo "header changed, both header and object are rebuilt"
+touch common.hpp
+assert $pake hello
+assert grep -e c++-header.*common.hpp __build/calls.list
+assert grep -e -c.*main.cpp __build/calls.list
+
+big_echo "precompiled header from configuration"
+assert $pake -c with_flags hello_library
+assert grep -e -DDUMMY.*c++-header.*common.hpp __build/calls.list
+assert test -f __build/with_flags/libhello_library.a
+
+rm -rf __build
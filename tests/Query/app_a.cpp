@@ -0,0 +1,6 @@
+#include "a.hpp"
+
+int main()
+{
+    return a() - 1;
+}
@@ -0,0 +1,6 @@
+int b();
+
+int main()
+{
+    return b() - 2;
+}
@@ -0,0 +1,52 @@
+. ../common.sh
+
+big_echo "target named query is built"
+assert $pake query
+assert test -f __build/__default/libquery.a
+
+rm -rf __build
+mkdir __build
+
+function query()
+{
+    $pake --query $@ > __build/output.txt || error $pake --query $@
+    cat __build/output.txt
+}
+
+big_echo "dependencies and dependents"
+query deps app_a
+assert grep -e ^liba$ __build/output.txt
+assert_fail grep -e libb __build/output.txt
+query rdeps liba
+assert grep -e ^app_a$ __build/output.txt
+assert_fail grep -e app_b __build/output.txt
+
+big_echo "nothing is built yet"
+query why-rebuild app_a
+assert grep -e "app_a.cpp:.not.built" __build/output.txt
+
+big_echo "includers from the last build"
+assert $pake -a
+query includers a.hpp
+assert grep -e "^liba.a.cpp$" __build/output.txt
+assert grep -e "^app_a.app_a.cpp$" __build/output.txt
+assert_fail grep -e b.cpp __build/output.txt
+
+big_echo "why objects would be rebuilt"
+query why-rebuild app_a liba
+assert_fail test -s __build/output.txt
+touch a.hpp
+query why-rebuild app_a liba
+assert grep -e "^app_a.app_a.cpp:.a.hpp.changed" __build/output.txt
+assert grep -e "^liba.a.cpp:.a.hpp.changed" __build/output.txt
+
+big_echo "where variables are set"
+query where hello.greeting
+assert grep -e "hello.pake:1$" __build/output.txt
+assert grep -e "hello.pake:2$" __build/output.txt
+
+big_echo "target named query is built"
+assert $pake query
+assert test -f __build/__default/libquery.a
+
+rm -rf __build
@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+
+# minimal stand-in for remote cache, keeps blobs in given directory and
+# writes the port it listens on to given file. With "drop" it closes every
+# connection without answering, with "drop-put" only uploads.
+
+import os
+import sys
+import BaseHTTPServer
+
+
+class Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+    def __path(self):
+        return os.path.join(storage, self.path.strip("/").replace("/", "_"))
+
+    def __drop(self, modes):
+        if mode in modes:
+            self.close_connection = 1
+            return True
+        return False
+
+    def do_GET(self):
+        if self.__drop(["drop"]):
+            return
+
+        path = self.__path()
+        if os.path.isfile(path):
+            data = open(path, "rb").read()
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+        else:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+    def do_PUT(self):
+        if self.__drop(["drop", "drop-put"]):
+            return
+
+        data = self.rfile.read(int(self.headers["Content-Length"]))
+        with open(self.__path(), "wb") as f:
+            f.write(data)
+        self.send_response(201)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+
+storage = sys.argv[1]
+mode = sys.argv[3] if len(sys.argv) > 3 else None
+server = BaseHTTPServer.HTTPServer(("127.0.0.1", 0), Handler)
+
+with open(sys.argv[2], "w") as f:
+    f.write(str(server.server_address[1]))
+
+server.serve_forever()
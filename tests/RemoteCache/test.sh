@@ -0,0 +1,56 @@
+. ../common.sh
+
+rm -rf __build __storage
+mkdir __build __storage
+
+./cache_server.py __storage __storage/port 2> /dev/null &
+server=$!
+trap "kill $server" EXIT
+
+while [ ! -s __storage/port ]; do sleep 0.1; done
+remote="--remote-cache http://127.0.0.1:`cat __storage/port`"
+
+assert $pake $remote hello
+assert grep -e -c.*main.cpp __build/calls.list
+assert __build/__default/hello
+assert ls __storage/ac_*
+
+big_echo "clean build gets objects and archives from the remote cache"
+rm -rf __build
+mkdir __build
+assert $pake $remote hello
+assert_fail grep -e -c __build/calls.list
+assert test -f __build/__default/libutils.a
+assert __build/__default/hello
+
+big_echo "server dropping connections means local build"
+function dropping_server()
+{
+    rm -rf __build __dropping
+    mkdir __build __dropping
+    ./cache_server.py __dropping __dropping/port $1 2> /dev/null &
+    dropping=$!
+    while [ ! -s __dropping/port ]; do sleep 0.1; done
+}
+
+dropping_server drop
+assert timeout 60 $pake --remote-cache http://127.0.0.1:`cat __dropping/port` hello
+assert grep -e -c.*main.cpp __build/calls.list
+assert __build/__default/hello
+kill $dropping
+
+big_echo "server dropping uploads doesn't hang the build"
+dropping_server drop-put
+assert timeout 60 $pake --remote-cache http://127.0.0.1:`cat __dropping/port` hello
+assert __build/__default/hello
+kill $dropping
+rm -rf __dropping
+
+big_echo "unreachable server means local build"
+rm -rf __build
+mkdir __build
+assert $pake --remote-cache http://127.0.0.1:1 hello
+assert grep -e -c.*main.cpp __build/calls.list
+assert __build/__default/hello
+
+rm -rf __build __storage
@@ -0,0 +1,51 @@
+. ../common.sh
+
+rm -rf __build
+
+function build()
+{
+    $pake app > __build/output.txt || error $pake app
+    cat __build/output.txt
+}
+
+mkdir __build
+cp all.pake.in build.pake
+
+big_echo "resources are staged with directories"
+build
+assert grep -e copy.data.txt __build/output.txt
+assert grep -e copy.assets/sub/two.txt __build/output.txt
+assert test -f __build/__default/data.txt
+assert test -f __build/__default/assets/one.txt
+assert test -f __build/__default/assets/sub/two.txt
+
+big_echo "nothing changed, nothing is copied"
+build
+assert_fail grep -e copy __build/output.txt
+
+big_echo "touched file with the same content isn't copied"
+sleep 1
+touch assets/one.txt
+build
+assert_fail grep -e copy __build/output.txt
+
+big_echo "changed file is"
+echo changed > assets/sub/two.txt
+build
+assert grep -e copy.assets/sub/two.txt __build/output.txt
+assert_fail grep -e copy.assets/one.txt __build/output.txt
+assert grep -e changed __build/__default/assets/sub/two.txt
+
+big_echo "resources not listed anymore are removed"
+cp less.pake.in build.pake
+build
+assert_fail test -e __build/__default/data.txt
+assert test -f __build/__default/assets/one.txt
+
+big_echo "files removed from resource directory are removed"
+rm assets/sub/two.txt
+build
+assert_fail test -e __build/__default/assets/sub
+
+echo two > assets/sub/two.txt
+rm -rf __build build.pake
@@ -0,0 +1 @@
+int f1() { return 1; }
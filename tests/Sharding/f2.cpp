@@ -0,0 +1 @@
+int f2() { return 2; }
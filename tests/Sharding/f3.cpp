@@ -0,0 +1 @@
+int f3() { return 3; }
@@ -0,0 +1 @@
+int f4() { return 4; }
@@ -0,0 +1 @@
+int f5() { return 5; }
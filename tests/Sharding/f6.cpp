@@ -0,0 +1 @@
+int f6() { return 6; }
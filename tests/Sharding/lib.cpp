@@ -0,0 +1 @@
+int lib() { return 7; }
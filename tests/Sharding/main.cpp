@@ -0,0 +1,7 @@
+int f1();
+int lib();
+
+int main()
+{
+    return f1() + lib() == 8 ? 0 : 1;
+}
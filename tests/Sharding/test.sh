@@ -0,0 +1,34 @@
+. ../common.sh
+
+rm -rf __build __shard1 __shard2 __merged
+mkdir __build
+
+big_echo "every shard compiles its part of objects and doesn't link"
+assert $pake --build-root __shard1 --shard 1/2 hello
+assert $pake --build-root __shard2 --shard 2/2 hello
+assert test -f __shard1/shard-1-of-2.tar
+assert test -f __shard2/shard-2-of-2.tar
+assert_fail test -e __shard1/__default/hello
+assert_fail test -e __shard1/__default/liblib.a
+
+big_echo "shards are disjoint and cover all the objects"
+tar tf __shard1/shard-1-of-2.tar | grep '\.o$' > __build/shard1.list
+tar tf __shard2/shard-2-of-2.tar | grep '\.o$' > __build/shard2.list
+assert test `cat __build/shard1.list __build/shard2.list | wc -l` -eq 8
+assert test `cat __build/shard1.list __build/shard2.list | sort -u | wc -l` -eq 8
+assert test -s __build/shard1.list
+assert test -s __build/shard2.list
+
+big_echo "split is deterministic"
+assert $pake --build-root __shard1 --shard 1/2 hello
+tar tf __shard1/shard-1-of-2.tar | grep '\.o$' > __build/again.list
+assert diff __build/shard1.list __build/again.list
+
+big_echo "merge only links"
+rm __build/calls.list
+assert $pake --build-root __merged --merge-shards __shard1/shard-1-of-2.tar,__shard2/shard-2-of-2.tar hello
+assert __merged/__default/hello
+assert_fail grep -e -c __build/calls.list
+assert test -f __merged/compile_times
+
+rm -rf __build __shard1 __shard2 __merged
@@ -0,0 +1,28 @@
+. ../common.sh
+
+rm -rf __build
+mkdir __build
+
+assert $pake hello
+assert grep -e -fPIC.*-c.*foo.cpp __build/calls.list
+assert grep -e -shared.*libfoo.so __build/calls.list
+assert test -f __build/__default/libfoo.so
+assert __build/__default/hello
+
+big_echo "implementation changed, dependent isn't relinked"
+rm __build/calls.list
+cp foo.cpp __build/foo.cpp.orig
+echo "// changed" >> foo.cpp
+assert $pake hello
+assert grep -e -shared.*libfoo.so __build/calls.list
+assert_fail grep -e -o.*/hello __build/calls.list
+
+big_echo "interface changed, dependent is relinked"
+rm __build/calls.list
+echo "int bar() { return 1; }" >> foo.cpp
+assert $pake hello
+assert grep -e -o.*/hello __build/calls.list
+assert __build/__default/hello
+
+mv __build/foo.cpp.orig foo.cpp
+rm -rf __build
@@ -0,0 +1,4 @@
+int common()
+{
+    return 0;
+}
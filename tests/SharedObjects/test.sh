@@ -0,0 +1,18 @@
+. ../common.sh
+
+rm -rf __build
+mkdir __build
+
+big_echo "source shared by targets with the same flags is compiled once"
+assert $pake app tool
+assert test `grep -c -e -c.*common.cpp __build/calls.list` -eq 1
+assert __build/__default/app
+assert __build/__default/tool
+
+big_echo "different flags, different object"
+rm __build/calls.list
+assert $pake tool_with_flags
+assert grep -e -DFLAGS.*-c.*common.cpp __build/calls.list
+assert __build/__default/tool_with_flags
+
+rm -rf __build
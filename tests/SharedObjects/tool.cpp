@@ -0,0 +1,6 @@
+int common();
+
+int main()
+{
+    return common();
+}
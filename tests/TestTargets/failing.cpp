@@ -0,0 +1,7 @@
+#include <cstdio>
+
+int main()
+{
+    std::printf("expected 1, got 2\n");
+    return 1;
+}
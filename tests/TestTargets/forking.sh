@@ -0,0 +1,5 @@
+#!/bin/sh
+
+# child keeps the output open long after the test is killed
+sleep 60 &
+wait
@@ -0,0 +1,7 @@
+#include <unistd.h>
+
+int main()
+{
+    sleep(60);
+    return 0;
+}
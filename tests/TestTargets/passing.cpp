@@ -0,0 +1,9 @@
+#include <cstdio>
+#include <fstream>
+
+int main(int argc, char** argv)
+{
+    std::printf("running passing\n");
+    std::ofstream("__build/passing.runs", std::ios::app) << "run\n";
+    return argc == 2 && std::ifstream(argv[1]) ? 0 : 1;
+}
@@ -0,0 +1,11 @@
+#include <cstdio>
+#include <cstdlib>
+
+int main()
+{
+    const char* index = std::getenv("GTEST_SHARD_INDEX");
+    const char* total = std::getenv("GTEST_TOTAL_SHARDS");
+
+    std::printf("shard %s of %s\n", index, total);
+    return index && total ? 0 : 1;
+}
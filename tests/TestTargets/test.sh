@@ -0,0 +1,48 @@
+. ../common.sh
+
+rm -rf __build
+mkdir __build
+
+# data.txt is changed below, it's put back however the test ends
+trap "echo data > data.txt" EXIT
+
+function runs()
+{
+    test `cat __build/passing.runs | wc -l` -eq $1
+}
+
+big_echo "tests are built and run"
+assert $pake passing sharded --test
+assert test -f __build/__default/passing
+assert runs 1
+assert grep -e shard.2.of.3 __build/__default/build.sharded/test.log
+
+big_echo "passed test with the same inputs isn't run again"
+assert $pake passing --test
+assert runs 1
+
+big_echo "changed data file"
+echo changed > data.txt
+assert $pake passing --test
+assert runs 2
+
+big_echo "failing and hanging tests"
+$pake failing hanging --test > __build/output.txt && error "tests should fail"
+cat __build/output.txt
+assert grep -e expected.1,.got.2 __build/output.txt
+assert grep -e timed.out __build/output.txt
+
+big_echo "children of timed out test are killed too"
+start=`date +%s`
+timeout 30 $pake forking --test > __build/output.txt && error "test should fail"
+cat __build/output.txt
+assert grep -e timed.out __build/output.txt
+assert test $((`date +%s` - start)) -lt 20
+
+big_echo "failed test runs again"
+assert_fail $pake failing --test
+
+big_echo "applications aren't tests"
+assert $pake hello --test
+
+rm -rf __build
@@ -0,0 +1,4 @@
+int four()
+{
+    return 1;
+}
@@ -0,0 +1,9 @@
+int one();
+int two();
+int three();
+int four();
+
+int main()
+{
+    return one() + two() + three() + four() - 4;
+}
@@ -0,0 +1,46 @@
+. ../common.sh
+
+rm -rf __build
+mkdir __build
+
+assert $pake hello
+assert __build/__default/hello
+assert grep -e -c.*unity_0.cpp __build/calls.list
+assert grep -e -c.*unity_1.cpp __build/calls.list
+assert_fail grep -e -c.*unity_2.cpp __build/calls.list
+assert grep -e -c.*main.cpp __build/calls.list
+assert_fail grep -e -c.*one.cpp __build/calls.list
+
+big_echo "nothing changed, unity sources are not rewritten"
+rm __build/calls.list
+assert $pake hello
+assert_fail test -f __build/calls.list
+
+big_echo "only the unit with changed source is rebuilt"
+touch four.cpp
+assert $pake hello
+assert_fail grep -e -c.*unity_0.cpp __build/calls.list
+assert grep -e -c.*unity_1.cpp __build/calls.list
+assert_fail grep -e -c.*main.cpp __build/calls.list
+
+big_echo "unity enabled by configuration"
+rm __build/calls.list
+assert $pake -c unity hello_without_unity
+assert __build/unity/hello_without_unity
+assert grep -e -c.*unity_0.cpp __build/calls.list
+assert_fail grep -e -c.*unity_1.cpp __build/calls.list
+
+big_echo "member of unit gains an include, edited header rebuilds the unit"
+four=`cat four.cpp`
+trap 'echo "$four" > four.cpp' EXIT
+echo "#define V 1" > __build/v.h
+printf '#include "__build/v.h"\nint four()\n{\n    return V;\n}\n' > four.cpp
+assert $pake hello
+assert __build/__default/hello
+echo "#define V 2" > __build/v.h
+rm __build/calls.list
+assert $pake hello
+assert grep -e -c.*unity_1.cpp __build/calls.list
+assert_fail __build/__default/hello
+
+rm -rf __build